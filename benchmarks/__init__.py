@@ -0,0 +1,5 @@
+"""Performance benchmarks for rezume.
+
+Run the suite and record results with ``python -m benchmarks run`` and check for
+regressions against recorded results with ``python -m benchmarks compare``.
+"""
@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+from typing import List
+
+import typer
+
+from .suite import BENCHMARKS, compare_results, run_benchmarks
+
+app = typer.Typer(help="Runs rezume benchmarks and compares recorded results")
+
+
+def _format(value: float, unit: str) -> str:
+    if unit == "s":
+        return f"{value * 1000:.3f} ms"
+    return f"{value:.1f} {unit}"
+
+
+@app.command()
+def run(
+    output: Path = typer.Option(Path("benchmark-results.json"), help="Results file"),
+    scale: List[int] = typer.Option([10, 100, 1000], help="Items per section"),
+    only: List[str] = typer.Option([], help="Names of benchmarks to run"),
+    rounds: int = typer.Option(5, help="Minimum number of rounds per benchmark"),
+    min_time: float = typer.Option(0.2, help="Minimum seconds spent per benchmark"),
+):
+    """Runs benchmarks and writes results to a JSON file."""
+    unknown = set(only) - set(BENCHMARKS)
+    if unknown:
+        typer.secho(f"Unknown benchmarks: {', '.join(sorted(unknown))}", fg=typer.colors.RED)
+        raise typer.Exit(2)
+
+    def report(metric: str, result: dict):
+        typer.echo(f"{metric:<32} {_format(result['value'], result['unit'])}")
+
+    results = run_benchmarks(scale, only or None, rounds, min_time, report)
+    output.write_text(json.dumps(results, indent=2))
+    typer.secho(f"Results written to: {output}", fg=typer.colors.GREEN)
+
+
+@app.command()
+def compare(
+    baseline: Path,
+    current: Path,
+    threshold: float = typer.Option(0.1, help="Relative change regarded a regression"),
+):
+    """Compares two results files and fails when a metric regresses."""
+    comparisons = compare_results(
+        json.loads(baseline.read_text()), json.loads(current.read_text()), threshold
+    )
+
+    regressions = 0
+    for entry in comparisons:
+        if entry["current"] is None:
+            regressions += 1
+            line = f"{entry['metric']:<32} {_format(entry['baseline'], entry['unit']):>14}"
+            typer.secho(f"{line}  MISSING", fg=typer.colors.RED)
+            continue
+
+        line = (
+            f"{entry['metric']:<32} {_format(entry['baseline'], entry['unit']):>14} -> "
+            f"{_format(entry['current'], entry['unit']):>14} ({entry['change']:+.1%})"
+        )
+        if entry["regressed"]:
+            regressions += 1
+            typer.secho(f"{line}  REGRESSED", fg=typer.colors.RED)
+        else:
+            typer.echo(line)
+
+    if regressions:
+        typer.secho(f"\n{regressions} metric(s) regressed or missing", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,462 @@
+"""Benchmarks for rezume loading, dumping, sections, rendering and serving."""
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from itertools import count
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from yaml import Dumper, dump
+
+from rezume import Rezume, RezumeCollection, get_version
+from rezume.models import Work
+from rezume.search import SearchIndex, get_texts
+
+from .synthetic import generate_corpus, generate_rezume
+
+THEMES_DIR = Path(__file__).parent / "themes"
+
+# benchmark name -> (setup, unit, better, scaled); setup receives the scale and a
+# working directory and returns the callable to be measured
+BENCHMARKS: Dict[str, tuple] = {}
+
+
+def benchmark(name: str, unit: str = "s", better: str = "lower", scaled: bool = True):
+    """Registers a benchmark setup function under the provided name. Benchmarks which
+    are not `scaled` run once regardless of the number of scales requested.
+    """
+
+    def decorator(setup: Callable):
+        BENCHMARKS[name] = (setup, unit, better, scaled)
+        return setup
+
+    return decorator
+
+
+def _write_rezume(scale: int, workdir: Path) -> Path:
+    filepath = workdir / f"rezume-{scale}.yml"
+    if not filepath.exists():
+        filepath.write_text(dump(generate_rezume(scale), Dumper=Dumper))
+    return filepath
+
+
+@benchmark("rezume.load")
+def bench_load(scale: int, workdir: Path):
+    filepath = _write_rezume(scale, workdir)
+    return lambda: Rezume().load(filepath)
+
+
+@benchmark("rezume.load_data")
+def bench_load_data(scale: int, workdir: Path):
+    data = generate_rezume(scale)
+    return lambda: Rezume().load_data(data)
+
+
+@benchmark("rezume.load_data.projected")
+def bench_load_data_projected(scale: int, workdir: Path):
+    data = generate_rezume(scale)
+    return lambda: Rezume().load_data(data, sections=["skills"])
+
+
+@benchmark("rezume.load_data.lazy")
+def bench_load_data_lazy(scale: int, workdir: Path):
+    data = generate_rezume(scale)
+    return lambda: Rezume().load_data(data, lazy=True)
+
+
+@benchmark("rezume.load_snapshot")
+def bench_load_snapshot(scale: int, workdir: Path):
+    filepath = workdir / f"rezume-{scale}.snap"
+    Rezume().load_data(generate_rezume(scale)).save_snapshot(filepath, overwrite=True)
+    return lambda: Rezume().load_snapshot(filepath)
+
+
+@benchmark("rezume.load_snapshot.records")
+def bench_load_snapshot_records(scale: int, workdir: Path):
+    filepath = workdir / f"rezume-{scale}.snap"
+    Rezume().load_data(generate_rezume(scale)).save_snapshot(filepath, overwrite=True)
+    return lambda: Rezume().load_snapshot(filepath, records=True)
+
+
+@benchmark("rezume.validate")
+def bench_validate(scale: int, workdir: Path):
+    data = generate_rezume(scale)
+    return lambda: Rezume.validate(data)
+
+
+@benchmark("rezume.dump_data")
+def bench_dump_data(scale: int, workdir: Path):
+    rezume = Rezume().load_data(generate_rezume(scale))
+    return rezume.dump_data
+
+
+@benchmark("rezume.save")
+def bench_save(scale: int, workdir: Path):
+    rezume = Rezume().load_data(generate_rezume(scale))
+    filepath = workdir / f"saved-{scale}.yml"
+    return lambda: rezume.save(filepath, overwrite=True)
+
+
+@benchmark("rezume.apply_patch")
+def bench_apply_patch(scale: int, workdir: Path):
+    rezume = Rezume().load_data(generate_rezume(scale))
+    # a single edited entry, as sent by editors
+    operations = [{"op": "add", "path": "/work/0/summary", "value": "Patched summary"}]
+    return lambda: rezume.apply_patch(operations)
+
+
+@benchmark("rezume.fingerprint")
+def bench_fingerprint(scale: int, workdir: Path):
+    rezume = Rezume().load_data(generate_rezume(scale))
+    [skill, *_] = rezume["skills"]
+
+    def run():
+        # a changed section, the other sections' digests being cached
+        rezume.discard_item("skills", skill)
+        rezume.add_item("skills", skill)
+        return rezume.fingerprint()
+
+    return run
+
+
+@benchmark("rezume.clone")
+def bench_clone(scale: int, workdir: Path):
+    rezume = Rezume().load_data(generate_rezume(scale))
+    # a tailored variant: a clone with one entry edited
+    operations = [{"op": "remove", "path": "/work/0/highlights/0"}]
+    return lambda: rezume.clone().apply_patch(operations)
+
+
+@benchmark("rezume.timeline")
+def bench_timeline(scale: int, workdir: Path):
+    rezume = Rezume().load_data(generate_rezume(scale))
+    sections = [rezume[name] for name in ("work", "volunteer", "education")]
+
+    def run():
+        # latest entries of sections which aren't sorted yet
+        for section in sections:
+            section._invalidate()
+        return list(rezume.timeline(limit=10))
+
+    return run
+
+
+def _work_items(scale: int) -> List[Work]:
+    return [Work(**item) for item in generate_rezume(scale)["work"]]
+
+
+@benchmark("section.add")
+def bench_section_add(scale: int, workdir: Path):
+    items = _work_items(scale)
+
+    def run():
+        section = Rezume.NAMED_SECTIONS["work"]("work")
+        for item in items:
+            section.add(item)
+
+    return run
+
+
+@benchmark("section.iterate")
+def bench_section_iterate(scale: int, workdir: Path):
+    section = Rezume().load_data(generate_rezume(scale))["work"]
+    return lambda: list(section)
+
+
+@benchmark("section.contains")
+def bench_section_contains(scale: int, workdir: Path):
+    items = _work_items(scale)
+    section = Rezume.NAMED_SECTIONS["work"]("work", items)
+    return lambda: all(item in section for item in items)
+
+
+@benchmark("collection.find")
+def bench_collection_find(scale: int, workdir: Path):
+    # scale is the number of rezumes in the collection, each with a few entries
+    collection = RezumeCollection(Rezume().load_data(d) for d in generate_corpus(scale, 5))
+    return lambda: collection.find(skill="skill-7", language="Language 1", country_code="NG")
+
+
+@benchmark("store.add_many")
+def bench_store_add_many(scale: int, workdir: Path):
+    from rezume.store import RezumeStore
+
+    # scale is the number of stored rezumes, each with a few entries
+    rezumes = [(str(k), Rezume().load_data(d)) for k, d in enumerate(generate_corpus(scale, 5))]
+    rounds = count()
+
+    def run():
+        # ingested into a new database every round
+        store = RezumeStore(workdir / f"store-{scale}-{next(rounds)}.db")
+        store.add_many(rezumes)
+        store.close()
+
+    return run
+
+
+@benchmark("store.find_keys")
+def bench_store_find_keys(scale: int, workdir: Path):
+    from rezume.store import RezumeStore
+
+    rezumes = ((str(k), Rezume().load_data(d)) for k, d in enumerate(generate_corpus(scale, 5)))
+    store = RezumeStore(workdir / f"store-find-{scale}.db")
+    store.add_many(rezumes)
+    return lambda: store.find_keys(skill="skill-7", language="Language 1", country_code="NG")
+
+
+@benchmark("collection.find_active")
+def bench_collection_find_active(scale: int, workdir: Path):
+    collection = RezumeCollection(Rezume().load_data(d) for d in generate_corpus(scale, 5))
+    collection.get_interval_index(("work",))
+    return lambda: collection.find_active(date(2015, 1, 1), date(2015, 12, 31))
+
+
+@benchmark("search.query")
+def bench_search_query(scale: int, workdir: Path):
+    # scale is the number of indexed rezumes, each with a few entries
+    index = SearchIndex()
+    for seed, data in enumerate(generate_corpus(scale, 5)):
+        index.add(str(seed), get_texts(Rezume().load_data(data)))
+    return lambda: index.search('"reduced latency" python services')
+
+
+@benchmark("matching.top")
+def bench_matching_top(scale: int, workdir: Path):
+    from rezume.matching import Matcher
+
+    # scale is the number of ranked rezumes, each with a few entries
+    matcher = Matcher(enumerate(Rezume().load_data(d) for d in generate_corpus(scale, 5)))
+    return lambda: matcher.top("python cloud data pipeline skill-7 latency security", k=10)
+
+
+@benchmark("analytics.add")
+def bench_analytics_add(scale: int, workdir: Path):
+    from rezume.analytics import CorpusStats
+
+    # scale is the number of analyzed rezumes, each with a few entries
+    rezumes = [Rezume().load_data(d) for d in generate_corpus(scale, 5)]
+
+    def run():
+        stats = CorpusStats()
+        for rezume in rezumes:
+            stats.add(rezume)
+
+    return run
+
+
+@benchmark("dedup.clusters")
+def bench_dedup_clusters(scale: int, workdir: Path):
+    from rezume.dedup import DuplicateFinder
+
+    # scale is the number of compared rezumes, each with a few entries
+    rezumes = [Rezume().load_data(d) for d in generate_corpus(scale, 5)]
+
+    def run():
+        finder = DuplicateFinder()
+        for key, rezume in enumerate(rezumes):
+            finder.add(key, rezume)
+        return finder.clusters()
+
+    return run
+
+
+@benchmark("diff.rezumes")
+def bench_diff_rezumes(scale: int, workdir: Path):
+    from rezume.diff import diff_rezumes
+
+    # every other work entry edited, half of the education entries replaced
+    data = generate_rezume(scale)
+    old = Rezume().load_data(data)
+    for item in data["work"][::2]:
+        item["summary"] = "Edited summary"
+    data["education"][: scale // 2] = generate_rezume(scale // 2 + 1)["education"][1:]
+    new = Rezume().load_data(data)
+    return lambda: diff_rezumes(old, new).to_json_patch()
+
+
+@benchmark("theme.render")
+def bench_theme_render(scale: int, workdir: Path):
+    from rezume.cli.commands.serve import render_rezume
+
+    rezume = Rezume().load_data(generate_rezume(scale))
+    return lambda: render_rezume(rezume, "bench")
+
+
+@benchmark("serve.requests", unit="req/s", better="higher")
+def bench_serve_requests(scale: int, workdir: Path):
+    from wsgiref.util import setup_testing_defaults
+
+    from rezume.cli.commands.serve import ServeCommand
+
+    command = ServeCommand(_write_rezume(scale, workdir), "bench", 0)
+    app = command.create_web_app()
+
+    def start_response(status, headers, exc_info=None):
+        if not status.startswith("200"):
+            raise RuntimeError(f"request failed: {status}")
+
+    def run():
+        environ: dict = {}
+        setup_testing_defaults(environ)
+        for _ in app(environ, start_response):
+            pass
+
+    return run
+
+
+def _run_python(code: str) -> Callable:
+    command = [sys.executable, "-c", code]
+    return lambda: subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+
+
+@benchmark("import.rezume", scaled=False)
+def bench_import_rezume(scale: int, workdir: Path):
+    # heavy dependencies are deferred until a lazy attribute is accessed
+    return _run_python("import rezume")
+
+
+@benchmark("import.rezume.Rezume", scaled=False)
+def bench_import_rezume_class(scale: int, workdir: Path):
+    return _run_python("from rezume import Rezume")
+
+
+@benchmark("cli.startup.test", scaled=False)
+def bench_cli_startup_test(scale: int, workdir: Path):
+    # only the invoked command gets registered (and imported)
+    return _run_python(
+        "import sys; from rezume.cli import main; sys.argv = ['rezume', 'test', '--help']\n"
+        "try: main()\nexcept SystemExit: pass"
+    )
+
+
+@benchmark("cli.startup.all", scaled=False)
+def bench_cli_startup_all(scale: int, workdir: Path):
+    # `rezume --help` registers (and imports) every command
+    return _run_python(
+        "import sys; from rezume.cli import main; sys.argv = ['rezume', '--help']\n"
+        "try: main()\nexcept SystemExit: pass"
+    )
+
+
+def measure(func: Callable, rounds: int = 5, min_time: float = 0.2) -> List[float]:
+    """Returns timings, in seconds, for running `func` at least `rounds` times and
+    for at least `min_time` seconds overall.
+    """
+    func()  # warm up caches and lazy imports
+
+    timings: List[float] = []
+    started = time.perf_counter()
+    while len(timings) < rounds or time.perf_counter() - started < min_time:
+        begin = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - begin)
+    return timings
+
+
+def summarize(timings: List[float], unit: str, better: str) -> dict:
+    value = statistics.median(timings)
+    if unit == "req/s":
+        # throughput metrics report operations per second
+        return {
+            "value": 1 / value,
+            "max": 1 / min(timings),
+            "rounds": len(timings),
+            "unit": unit,
+            "better": better,
+        }
+
+    return {
+        "value": value,
+        "min": min(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "rounds": len(timings),
+        "unit": unit,
+        "better": better,
+    }
+
+
+def run_benchmarks(
+    scales: Iterable[int],
+    names: Optional[Iterable[str]] = None,
+    rounds: int = 5,
+    min_time: float = 0.2,
+    report: Callable[[str, dict], None] = lambda name, result: None,
+) -> dict:
+    """Runs the selected benchmarks at every provided scale and returns the results
+    in the form written to results JSON files.
+    """
+    if str(THEMES_DIR) not in sys.path:
+        sys.path.insert(0, str(THEMES_DIR))
+
+    selected = list(names or BENCHMARKS)
+    metrics = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for index, scale in enumerate(scales):
+            for name in selected:
+                setup, unit, better, scaled = BENCHMARKS[name]
+                if not scaled and index:
+                    continue
+
+                func = setup(scale, Path(tmpdir))
+                metric = f"{name}[{scale}]" if scaled else name
+                metrics[metric] = summarize(measure(func, rounds, min_time), unit, better)
+                report(metric, metrics[metric])
+
+    return {
+        "meta": {
+            "rezume": get_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": datetime.now().isoformat(timespec="seconds"),
+        },
+        "metrics": metrics,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.1) -> List[dict]:
+    """Compares metrics tracked in the baseline results and returns one entry per metric
+    with the relative change and whether it regressed past the provided threshold.
+
+    Metrics missing from the current results (e.g. benchmarks renamed, removed or
+    crashing) are reported as regressed, without a current value or change.
+    """
+    comparisons = []
+    current_metrics = current.get("metrics", {})
+    for name, base in baseline.get("metrics", {}).items():
+        if name not in current_metrics:
+            comparisons.append(
+                {
+                    "metric": name,
+                    "baseline": base["value"],
+                    "current": None,
+                    "change": None,
+                    "unit": base.get("unit", "s"),
+                    "regressed": True,
+                }
+            )
+            continue
+
+        value, base_value = current_metrics[name]["value"], base["value"]
+        change = (value - base_value) / base_value if base_value else 0.0
+        if base.get("better", "lower") == "higher":
+            # a drop in throughput is a regression
+            regressed = change < -threshold
+        else:
+            regressed = change > threshold
+
+        comparisons.append(
+            {
+                "metric": name,
+                "baseline": base_value,
+                "current": value,
+                "change": change,
+                "unit": base.get("unit", "s"),
+                "regressed": regressed,
+            }
+        )
+    return comparisons
@@ -0,0 +1,154 @@
+"""Generates synthetic rezume data at controlled scales for benchmarking."""
+import random
+from datetime import date, timedelta
+from typing import List
+
+WORDS = (
+    "designed built led shipped migrated python services platform latency data "
+    "pipeline customers reduced improved team mentored scalable cloud api tests "
+    "release quality security research analytics product growth revenue support"
+).split()
+
+COUNTRIES = ["NG", "GH", "KE", "ZA", "GB", "US", "DE", "IN"]
+FLUENCY = ["Native", "Fluent", "Professional", "Elementary"]
+NETWORKS = ["twitter", "github", "linkedin", "gitlab", "mastodon", "medium"]
+STUDY_TYPES = ["Bachelor", "Master", "Doctorate", "Diploma"]
+
+
+def _sentence(rnd: random.Random, words: int) -> str:
+    return " ".join(rnd.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _date(rnd: random.Random, start_year=1990, end_year=2020) -> date:
+    start = date(start_year, 1, 1)
+    days = (date(end_year, 12, 31) - start).days
+    return start + timedelta(days=rnd.randrange(days))
+
+
+def _experiences(rnd: random.Random, items: int, highlights: int, words: int, org: str):
+    entries = []
+    for i in range(items):
+        start = _date(rnd)
+        entry = {
+            org: f"{org.capitalize()} {i % 50}",
+            "position": f"Position {i}",
+            "website": f"http://{org}{i % 50}.example.com",
+            "startDate": start.isoformat(),
+            "summary": _sentence(rnd, words),
+            "highlights": [_sentence(rnd, words) for _ in range(highlights)],
+        }
+        if i % 4:
+            entry["endDate"] = (start + timedelta(days=rnd.randrange(30, 2000))).isoformat()
+        entries.append(entry)
+    return entries
+
+
+def _keywords(rnd: random.Random, items: int, keywords: int, prefix: str) -> List[dict]:
+    return [
+        {
+            "name": f"{prefix} {i}",
+            "level": rnd.choice(["Beginner", "Intermediate", "Master"]),
+            "keywords": [f"{prefix.lower()}-{rnd.randrange(200)}" for _ in range(keywords)],
+        }
+        for i in range(items)
+    ]
+
+
+def generate_rezume(
+    items: int = 10,
+    highlights: int = 3,
+    words: int = 12,
+    profiles: int = 3,
+    seed: int = 0,
+) -> dict:
+    """Returns the data for a valid rezume with `items` entries in every section.
+
+    :param items: number of entries for each section
+    :param highlights: number of highlights for each work and volunteer entry
+    :param words: number of words for each summary and highlight
+    :param profiles: number of network profiles
+    :param seed: seed for the random generator so that output is reproducible
+    """
+    rnd = random.Random(seed)
+    name = f"Candidate {seed}"
+
+    basics = {
+        "name": name,
+        "label": "Programmer",
+        "email": f"candidate{seed}@example.com",
+        "phone": "0807-0000-1111",
+        "website": f"http://candidate{seed}.example.com",
+        "summary": _sentence(rnd, words * 4),
+        "location": {
+            "address": f"{seed} Example Avenue",
+            "postalCode": "KN 700214",
+            "city": "Kano",
+            "region": "Kano State",
+            "countryCode": rnd.choice(COUNTRIES),
+        },
+        "profiles": [
+            {
+                "network": f"{NETWORKS[i % len(NETWORKS)]}{i // len(NETWORKS) or ''}",
+                "username": f"candidate{seed}",
+                "url": f"http://{NETWORKS[i % len(NETWORKS)]}.example.com/candidate{seed}",
+            }
+            for i in range(profiles)
+        ],
+    }
+
+    education = []
+    for i in range(items):
+        start = _date(rnd)
+        education.append(
+            {
+                "institution": f"University {i % 100}",
+                "area": f"Area {i}",
+                "studyType": rnd.choice(STUDY_TYPES),
+                "startDate": start.isoformat(),
+                "endDate": (start + timedelta(days=1460)).isoformat(),
+                "gpa": "4.0/5.0",
+                "courses": [f"CS{100 + j} - {_sentence(rnd, 3)}" for j in range(3)],
+            }
+        )
+
+    return {
+        "basics": basics,
+        "work": _experiences(rnd, items, highlights, words, "company"),
+        "volunteer": _experiences(rnd, items, highlights, words, "organization"),
+        "education": education,
+        "awards": [
+            {
+                "title": f"Award {i}",
+                "awarder": f"Awarder {i % 20}",
+                "date": _date(rnd).isoformat(),
+                "summary": _sentence(rnd, words),
+            }
+            for i in range(items)
+        ],
+        "publications": [
+            {
+                "name": f"Publication {i}",
+                "publisher": f"Publisher {i % 20}",
+                "releaseDate": _date(rnd).isoformat(),
+                "website": f"http://publisher{i % 20}.example.com",
+                "summary": _sentence(rnd, words),
+            }
+            for i in range(items)
+        ],
+        "skills": _keywords(rnd, items, 5, "Skill"),
+        "languages": [
+            {"language": f"Language {i}", "fluency": rnd.choice(FLUENCY)} for i in range(items)
+        ],
+        "interests": [
+            {"name": f"Interest {i}", "keywords": [f"interest-{rnd.randrange(100)}"]}
+            for i in range(items)
+        ],
+        "references": [
+            {"name": f"Referee {i}", "reference": _sentence(rnd, words)} for i in range(items)
+        ],
+    }
+
+
+def generate_corpus(count: int, items: int = 10, **kwargs) -> List[dict]:
+    """Returns the data for `count` distinct synthetic rezumes."""
+    return [generate_rezume(items, seed=seed, **kwargs) for seed in range(count)]
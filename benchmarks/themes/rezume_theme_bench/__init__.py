@@ -0,0 +1,12 @@
+from html import escape
+
+
+def render(rezume):
+    """Renders rezume sections as a plain HTML page for benchmarking purposes."""
+    parts = [f"<h1>{escape(rezume.name)}</h1>", f"<p>{escape(rezume.summary or '')}</p>"]
+    for section in rezume.sections:
+        parts.append(f"<h2>{escape(section.name)}</h2><ul>")
+        for item in section:
+            parts.append(f"<li>{escape(str(item))}</li>")
+        parts.append("</ul>")
+    return "\n".join(parts)
@@ -0,0 +1,197 @@
+"""Analytics over a corpus of rezumes.
+
+:class:`CorpusStats` accumulates statistics one rezume at a time, so that a directory
+of rezumes is analyzed in a single streaming pass keeping only one rezume in memory:
+
+* frequencies of skill and interest keywords (number of rezumes holding each)
+* co-occurrence counts of skill keywords held by the same rezume, kept sparse
+* distributions of total tenure and of gaps between jobs from ``work`` dates, computed
+  with NumPy ``datetime64`` arithmetic and kept as fixed-size histograms
+
+Date arithmetic requires NumPy, installed with the ``numpy`` extra.
+"""
+import json
+from collections import Counter
+from datetime import date
+from itertools import combinations
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .base import RezumeError
+from .collection import normalize
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Rezume
+
+#: sections read by the analytics, other sections are skipped when loading
+ANALYZED_SECTIONS = ("skills", "interests", "work")
+
+# histograms hold yearly bins of tenure and monthly bins of gaps, the last bins
+# holding all longer periods
+TENURE_BINS = 50
+GAP_BINS = 60
+
+
+def get_keywords(rezume: "Rezume", section_name: str) -> Set[str]:
+    """Returns the normalized names and keywords of items within a section."""
+    keywords = set()
+    for item in rezume[section_name]:
+        keywords.add(normalize(item.name))
+        keywords.update(normalize(keyword) for keyword in item.keywords or ())
+    return keywords
+
+
+def get_career_spans(starts: Any, ends: Any) -> Tuple[int, Any]:
+    """Returns the total days covered by the periods from `starts` to `ends` (arrays
+    of ``datetime64[D]``, ends inclusive), counting overlapping days once, along with
+    the lengths in days of the gaps between periods.
+    """
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    # latest end among the periods starting up to each period
+    covered_until = np.maximum.accumulate(ends)
+    gaps = (starts[1:] - covered_until[:-1]).astype(np.int64) - 1
+    gaps = gaps[gaps > 0]
+    span = int((covered_until[-1] - starts[0]).astype(np.int64)) + 1
+    return span - int(gaps.sum()), gaps
+
+
+class Distribution:
+    """Represents a histogram of day counts with bins of `bin_days` days, along with
+    summary statistics, which takes constant memory whatever the number of values.
+    """
+
+    def __init__(self, bins: int, bin_days: int):
+        self.bin_days = bin_days
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.total = 0
+        self.maximum = 0
+
+    def __len__(self) -> int:
+        return int(self.counts.sum())
+
+    def add(self, days: Any) -> None:
+        days = np.asarray(days, dtype=np.int64)
+        if not days.size:
+            return
+        bins = np.minimum(days // self.bin_days, len(self.counts) - 1)
+        self.counts += np.bincount(bins, minlength=len(self.counts))
+        self.total += int(days.sum())
+        self.maximum = max(self.maximum, int(days.max()))
+
+    def percentile(self, pct: float) -> Optional[int]:
+        """Returns the lower bound, in days, of the bin holding provided percentile."""
+        count = len(self)
+        if not count:
+            return None
+        rank = max(int(round(pct / 100 * count)), 1)
+        return int(np.searchsorted(np.cumsum(self.counts), rank)) * self.bin_days
+
+    def as_dict(self) -> dict:
+        count = len(self)
+        return {
+            "count": count,
+            "mean_days": self.total / count if count else None,
+            "max_days": self.maximum,
+            "p50_days": self.percentile(50),
+            "p90_days": self.percentile(90),
+            "bin_days": self.bin_days,
+            "histogram": self.counts.tolist(),
+        }
+
+
+class CorpusStats:
+    """Accumulates analytics over rezumes, see :mod:`rezume.analytics`."""
+
+    def __init__(self, today: Optional[date] = None):
+        if np is None:
+            raise RezumeError("Analytics require numpy: pip install rezume[numpy]")
+
+        #: end date of ongoing jobs
+        self.today = np.datetime64(today or date.today(), "D")
+        self.rezumes = 0
+        self.errors: Dict[str, str] = {}
+        self.skills: Counter = Counter()
+        self.interests: Counter = Counter()
+        self.pairs: Counter = Counter()
+        self.tenure = Distribution(TENURE_BINS, 365)
+        self.gaps = Distribution(GAP_BINS, 30)
+
+    def add(self, rezume: "Rezume") -> None:
+        """Adds the statistics of a rezume."""
+        self.rezumes += 1
+        skills = get_keywords(rezume, "skills")
+        self.skills.update(skills)
+        self.interests.update(get_keywords(rezume, "interests"))
+        self.pairs.update(combinations(sorted(skills), 2))
+
+        work = list(rezume["work"])
+        if work:
+            starts = np.array([item.start_date for item in work], dtype="datetime64[D]")
+            ends = np.array(
+                [item.end_date or self.today for item in work], dtype="datetime64[D]"
+            )
+            tenure, gaps = get_career_spans(starts, ends)
+            self.tenure.add([tenure])
+            self.gaps.add(gaps)
+
+    def add_files(self, filepaths: Iterable[Union[str, Path]]) -> "CorpusStats":
+        """Loads and adds rezume files one at a time, recording the errors of files
+        which fail to load rather than stopping.
+        """
+        from .core import Rezume
+
+        for filepath in filepaths:
+            try:
+                self.add(Rezume().load(filepath, sections=ANALYZED_SECTIONS))
+            except RezumeError as ex:
+                self.errors[str(filepath)] = str(ex)
+
+        # allows fluent method chaining on `add_files`
+        return self
+
+    @classmethod
+    def from_directory(
+        cls, directory: Union[str, Path], pattern: str = "*.yml", **kwargs: Any
+    ) -> "CorpusStats":
+        """Returns the analytics over rezume files within a directory."""
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise RezumeError(f"Directory not found: {directory}")
+        return cls(**kwargs).add_files(sorted(directory.glob(pattern)))
+
+    def cooccurrence_matrix(self) -> Tuple[List[str], Any]:
+        """Returns the skill keywords and their co-occurrence counts as a sparse matrix
+        in coordinate form: an array of (row, column, count) with rows before columns.
+        """
+        terms = sorted(self.skills)
+        columns = {term: index for index, term in enumerate(terms)}
+        entries = np.array(
+            [(columns[a], columns[b], count) for (a, b), count in self.pairs.items()],
+            dtype=np.int64,
+        ).reshape(-1, 3)
+        return terms, entries
+
+    def as_dict(self, top: Optional[int] = 100) -> dict:
+        """Returns the analytics as JSON-serializable data, limiting keyword lists to
+        the `top` most common entries.
+        """
+        return {
+            "rezumes": self.rezumes,
+            "errors": self.errors,
+            "skills": dict(self.skills.most_common(top)),
+            "interests": dict(self.interests.most_common(top)),
+            "cooccurrence": [[a, b, count] for (a, b), count in self.pairs.most_common(top)],
+            "tenure": self.tenure.as_dict(),
+            "gaps": self.gaps.as_dict(),
+        }
+
+    def save(self, filepath: Union[str, Path], top: Optional[int] = 100) -> None:
+        """Writes the analytics to provided file as JSON."""
+        Path(filepath).write_text(json.dumps(self.as_dict(top), indent=2))
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+# placeholder for the validated file path within cached error messages as files
+# with identical content share cache entries
+FILEPATH_PLACEHOLDER = "{filepath}"
+
+
+class CacheEntry(NamedTuple):
+    """Represents the cached outcome of validating a rezume."""
+
+    valid: bool
+    error: Optional[str]
+
+
+def get_default_directory() -> Path:
+    """Returns the directory for the validation cache, which is `$REZUME_CACHE_DIR` if
+    set, otherwise a `rezume` directory within the user's cache directory.
+    """
+    if os.environ.get("REZUME_CACHE_DIR"):
+        return Path(os.environ["REZUME_CACHE_DIR"])
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "rezume" / "validation"
+
+
+def get_cache_salt() -> bytes:
+    """Returns the package version and a digest of the schema definitions, which are
+    mixed into cache keys so that upgrades invalidate previous outcomes.
+
+    Definitions are read from source, falling back to the generated JSON schema when
+    the source isn't available (e.g. zipped or bytecode-only installs).
+    """
+    from . import get_version
+
+    try:
+        schema = Path(__file__).with_name("models.py").read_bytes()
+    except OSError:
+        from .models import Rezume as RezumeModel
+
+        schema = RezumeModel.schema_json(sort_keys=True).encode()
+    return f"{get_version()}:{hashlib.sha256(schema).hexdigest()}:".encode()
+
+
+class ValidationCache:
+    """Persists the outcome of validating rezume files on disk, keyed by a hash of the
+    file content, so that unchanged files need not be validated again.
+
+    Every entry lives in its own file and is written atomically, hence concurrent
+    writers never expose partially written entries. The least recently used entries
+    are evicted once the cache holds more than `max_entries`, which is checked on the
+    first write and then every `max_entries // 10` writes, as checking scans every
+    entry.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_entries: int = 1000):
+        self.directory = directory or get_default_directory()
+        self.max_entries = max_entries
+        self.prune_interval = max(max_entries // 10, 1)
+        self._salt: Optional[bytes] = None
+        self._writes = 0
+
+    def _get_path(self, content: bytes) -> Path:
+        if self._salt is None:
+            self._salt = get_cache_salt()
+        key = hashlib.sha256(self._salt + content).hexdigest()
+        return self.directory / f"{key}.json"
+
+    def get(self, content: bytes) -> Optional[CacheEntry]:
+        """Returns the cached outcome for validating provided content if found."""
+        path = self._get_path(content)
+        try:
+            data = json.loads(path.read_text())
+            entry = CacheEntry(bool(data["valid"]), data.get("error"))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        try:
+            # record usage to have recently used entries survive eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def set(self, content: bytes, error: Optional[str] = None) -> None:
+        """Records the outcome for validating provided content; an error message
+        indicates that validation failed.
+        """
+        path = self._get_path(content)
+        data = json.dumps({"valid": error is None, "error": error})
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.directory), suffix=".tmp")
+            with os.fdopen(fd, "w") as fp:
+                fp.write(data)
+            os.replace(tmp_path, str(path))
+        except OSError:
+            # caching is an optimization, failing to persist an entry isn't fatal
+            return
+
+        if self._writes % self.prune_interval == 0:
+            self.prune()
+        self._writes += 1
+
+    def prune(self) -> None:
+        """Evicts the least recently used entries beyond the size limit."""
+        try:
+            entries = list(os.scandir(str(self.directory)))
+        except OSError:
+            return
+
+        entries = [e for e in entries if e.name.endswith(".json")]
+        if len(entries) <= self.max_entries:
+            return
+
+        def last_used(entry):
+            try:
+                return entry.stat().st_mtime
+            except OSError:
+                return 0
+
+        entries.sort(key=last_used)
+        for entry in entries[: len(entries) - self.max_entries]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                # already evicted by a concurrent writer
+                pass
+
+    def clear(self) -> None:
+        """Removes all cached entries."""
+        for path in self.directory.glob("*.json"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
@@ -1,19 +1,103 @@
+import sys
+from pathlib import Path
+from typing import List, Optional
+
 import typer
 
-from .commands import registry
+from .commands import LazyCommand, registry
+from .profiling import Profiler
+
+# global options which consume the argument following them
+GLOBAL_OPTIONS_WITH_VALUES = ("--profile", "--profile-top")
+
+
+def find_command(name: Optional[str]):
+    """Returns the registered command with the provided name if found."""
+    for cmd in registry:
+        if getattr(cmd, "name", None) == name:
+            return cmd
+    return None
+
+
+def main_callback(
+    ctx: typer.Context,
+    profile: Optional[Path] = typer.Option(  # noqa
+        None,
+        "--profile",
+        help="Profile the command and write stats to this file (pstats or .collapsed)",
+    ),
+    profile_top: int = typer.Option(  # noqa
+        20, "--profile-top", help="Number of hot functions to print when profiling"
+    ),
+):
+    """Rezume, validate and create text-based resumes easily."""
+    if profile is None:
+        return
+
+    profiler = Profiler(profile, top=profile_top)
+    cmd = find_command(ctx.invoked_subcommand)
+    if getattr(cmd, "profile_per_request", False):
+        # long running commands sample units of work themselves
+        profiler.activate()
+    else:
+        profiler.start()
+
+    def finalize():
+        profiler.stop()
+        if not profiler.collected:
+            typer.secho("No profile samples collected", fg=typer.colors.YELLOW, err=True)
+            return
+
+        profiler.save()
+        profiler.report()
+        typer.secho(f"Profile written to: {profile}", fg=typer.colors.BLUE, err=True)
+
+    ctx.call_on_close(finalize)
+
+
+def register_command(app: typer.Typer, cmd) -> None:
+    """Registers a command, or a group of subcommands, with the provided app."""
+    subcommands = getattr(cmd, "subcommands", None)
+    if subcommands:
+        # resolve lazy commands as dunder attributes aren't proxied
+        command = cmd.resolve() if isinstance(cmd, LazyCommand) else cmd
+        group = typer.Typer(help=command.__doc__)
+        for subcommand in subcommands:
+            register_command(group, subcommand)
+        app.add_typer(group, name=cmd.name)
+    elif hasattr(cmd, "name") and hasattr(cmd, "handler"):
+        app.command(cmd.name)(cmd.handler)
+
+
+def select_command(args: List[str]) -> Optional[str]:
+    """Returns the name of the registered command invoked by provided arguments."""
+    remaining = iter(args)
+    for arg in remaining:
+        if arg in GLOBAL_OPTIONS_WITH_VALUES:
+            next(remaining, None)
+        elif not arg.startswith("-"):
+            return arg if find_command(arg) else None
+    return None
+
 
+def create_app(command_name: Optional[str] = None):
+    """Creates the rezume CLI app, registering all commands or only the named one.
 
-def create_app():
+    Registering a command imports its module, hence only registering the invoked
+    command avoids importing modules (and dependencies) of other commands.
+    """
     app = typer.Typer()
+    app.callback()(main_callback)
     for cmd in registry:
-        if hasattr(cmd, "name") and hasattr(cmd, "handler"):
-            app.command(cmd.name)(cmd.handler)
+        if command_name and getattr(cmd, "name", None) != command_name:
+            continue
+        register_command(app, cmd)
 
     return app
 
 
 def main():
-    app = create_app()
+    app = create_app(select_command(sys.argv[1:]))
     app()
 
 
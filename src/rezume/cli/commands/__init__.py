@@ -1,15 +1,31 @@
-import typer
-from typing import Any
+from importlib import import_module
 from pathlib import Path
+from typing import Any, List
 
+import typer
 
 # CONSTANTS
 DEFAULT_FILENAME: Any = typer.Argument(Path("./rezume.yml"))
 
 
+def collect_files(paths: List[Path]) -> List[Path]:
+    """Returns provided rezume files along with the YAML files within directories."""
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted([*path.glob("*.yml"), *path.glob("*.yaml")]))
+        else:
+            files.append(path)
+    return files
+
+
 class Command:
     """Represents the class for all rezume commands"""
 
+    #: long running commands set this to have `--profile` sample units of work
+    #: (e.g. served requests) rather than the entire command run
+    profile_per_request = False
+
     def exit(self) -> None:
         """Raise typer Exit exception which terminates a running typer app."""
         raise typer.Exit()
@@ -19,9 +35,41 @@ class Command:
         raise NotImplementedError()
 
 
-# flake8: noqa
-from .init import InitCommand
-from .test import TestCommand
-from .serve import ServeCommand
+class LazyCommand:
+    """Represents a registered command whose module is only imported on first use of
+    the command, keeping startup cheap for commands which are not invoked.
+    """
+
+    def __init__(self, name: str, target: str):
+        self.name = name
+        self.target = target
+        self._command: Any = None
+
+    def __repr__(self):
+        return f"<LazyCommand {self.name}: {self.target}>"
+
+    def resolve(self) -> Any:
+        """Imports and returns the command class referenced as `module:ClassName`."""
+        if self._command is None:
+            module_name, class_name = self.target.split(":")
+            module = import_module(module_name, __name__)
+            self._command = getattr(module, class_name)
+        return self._command
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
 
-registry = [Command, InitCommand, TestCommand, ServeCommand]
+registry: List[Any] = [
+    Command,
+    LazyCommand("init", ".init:InitCommand"),
+    LazyCommand("test", ".test:TestCommand"),
+    LazyCommand("serve", ".serve:ServeCommand"),
+    LazyCommand("bench", ".bench:BenchCommand"),
+    LazyCommand("dedup", ".dedup:DedupCommand"),
+    LazyCommand("diff", ".diff:DiffCommand"),
+    LazyCommand("stats", ".stats:StatsCommand"),
+    LazyCommand("search", ".search:SearchCommand"),
+]
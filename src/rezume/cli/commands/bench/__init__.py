@@ -0,0 +1,117 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import urlencode
+
+import typer
+
+from .. import DEFAULT_FILENAME, Command
+from ..serve import ServeCommand
+from .loadgen import LoadGenerator, LoadReport, LocalServer
+
+
+class BenchServeCommand(Command):
+    """Measures request throughput and latency of the rezume server"""
+
+    name = "serve"
+
+    def __init__(
+        self,
+        filename: Path,
+        themes: List[str],
+        port: int,
+        clients: int,
+        requests: int,
+        warmup: int,
+        output: Optional[Path] = None,
+    ):
+        self.filename = filename
+        self.themes = themes
+        self.port = port
+        self.clients = clients
+        self.requests = requests
+        self.warmup = warmup
+        self.output = output
+
+    @staticmethod
+    def get_path(theme: str) -> str:
+        """Returns the request path which renders the rezume with provided theme."""
+        return f"/?{urlencode({'theme': theme})}" if theme else "/"
+
+    def drive(self, port: int) -> List[LoadReport]:
+        """Drives load for every theme against a rezume server on provided port."""
+        generator = LoadGenerator(port, self.clients)
+        reports = []
+        for theme in self.themes:
+            path = self.get_path(theme)
+            if self.warmup:
+                generator.run(path, self.warmup)
+            reports.append(generator.run(path, self.requests))
+        return reports
+
+    def print_reports(self, reports: List[LoadReport]) -> None:
+        def ms(value: Optional[float]) -> str:
+            return "-" if value is None else f"{value * 1000:.2f}"
+
+        typer.secho(
+            f"\n{'theme':<16} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10} "
+            f"{'p99 ms':>10} {'errors':>8}",
+            bold=True,
+        )
+        for theme, report in zip(self.themes, reports):
+            typer.secho(
+                f"{theme or '(json)':<16} {report.throughput:>10.1f} "
+                f"{ms(report.percentile(50)):>10} {ms(report.percentile(95)):>10} "
+                f"{ms(report.percentile(99)):>10} {report.error_rate:>8.1%}",
+                fg=typer.colors.RED if report.errors else None,
+            )
+
+    def measure(self) -> List[LoadReport]:
+        """Drives load against the rezume server, returns the reports per theme."""
+        if self.port:
+            reports = self.drive(self.port)
+        else:
+            if not self.filename.exists():
+                typer.secho(f"Rezume not found: {self.filename}", fg=typer.colors.RED)
+                self.exit()
+
+            # default theme is irrelevant as every request names a theme
+            serve = ServeCommand(self.filename, "", 0)
+            with LocalServer(serve.create_web_app()) as server:
+                reports = self.drive(server.port)
+
+        self.print_reports(reports)
+        if self.output:
+            results = {t or "json": r.as_dict() for t, r in zip(self.themes, reports)}
+            self.output.write_text(json.dumps(results, indent=2))
+        return reports
+
+    def run(self) -> None:
+        self.measure()
+
+    @staticmethod
+    def handler(
+        filename: Path = DEFAULT_FILENAME,
+        theme: List[str] = typer.Option(  # noqa
+            [""], show_default=False, help="Theme to request, repeat for several themes"
+        ),
+        port: int = typer.Option(  # noqa
+            0, help="Port of a running rezume server on localhost, serve in-process if 0"
+        ),
+        clients: int = typer.Option(4, help="Number of concurrent clients"),  # noqa
+        requests: int = typer.Option(200, help="Number of requests per theme"),  # noqa
+        warmup: int = typer.Option(10, help="Number of warm up requests per theme"),  # noqa
+        output: Optional[Path] = typer.Option(  # noqa
+            None, help="File to write results to as JSON"
+        ),
+    ):
+        """Measures request throughput and latency of the rezume server"""
+        command = BenchServeCommand(filename, theme, port, clients, requests, warmup, output)
+        command.run()
+
+
+class BenchCommand(Command):
+    """Runs benchmarks against rezume commands"""
+
+    name = "bench"
+    subcommands = [BenchServeCommand]
@@ -0,0 +1,201 @@
+import http.client
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from typing import Callable, List, Optional
+from wsgiref.simple_server import (
+    ServerHandler,
+    WSGIRequestHandler,
+    WSGIServer,
+    make_server,
+)
+
+LOCALHOST = "127.0.0.1"
+
+
+class QuietHandler(WSGIRequestHandler):
+    """Request handler which doesn't log every request to stderr."""
+
+    def log_message(self, *args, **kwargs):
+        pass
+
+
+class KeepAliveServerHandler(ServerHandler):
+    """WSGI handler responding over HTTP/1.1, closing the connection after responses
+    whose length is unknown as their end is then marked by closing it.
+    """
+
+    http_version = "1.1"
+
+    def cleanup_headers(self):
+        super().cleanup_headers()
+        if "Content-Length" not in self.headers:
+            self.headers["Connection"] = "close"
+            self.request_handler.close_connection = True
+
+
+class KeepAliveHandler(QuietHandler):
+    """Request handler serving every request of a persistent HTTP/1.1 connection,
+    whereas :class:`WSGIRequestHandler` serves a single request per connection.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, which would otherwise wait on delayed
+    # acknowledgements of persistent connections
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            self.handle_one_request()
+
+    def handle_one_request(self):
+        self.raw_requestline = self.rfile.readline(65537)
+        if len(self.raw_requestline) > 65536:
+            self.requestline = self.request_version = self.command = ""
+            self.send_error(414)
+            return
+        if not self.raw_requestline:
+            # the client closed the connection
+            self.close_connection = True
+            return
+        if not self.parse_request():
+            return
+
+        handler = KeepAliveServerHandler(
+            self.rfile, self.wfile, self.get_stderr(), self.get_environ(), multithread=True
+        )
+        handler.request_handler = self
+        handler.run(self.server.get_app())
+
+
+class ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    """WSGI server handling every connection in its own thread."""
+
+    daemon_threads = True
+
+
+class LocalServer:
+    """Serves a WSGI application on localhost from a background thread, handling
+    concurrent clients over persistent connections.
+    """
+
+    def __init__(self, app: Callable, port: int = 0):
+        self.httpd: WSGIServer = make_server(
+            LOCALHOST,
+            port,
+            app,
+            server_class=ThreadingWSGIServer,
+            handler_class=KeepAliveHandler,
+        )
+        self.port = self.httpd.server_port
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self._thread.join()
+
+
+class LoadReport:
+    """Represents the outcome of driving load against a served path."""
+
+    def __init__(self, path: str, latencies: List[float], errors: int, duration: float):
+        self.path = path
+        self.latencies = sorted(latencies)
+        self.errors = errors
+        self.duration = duration
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + self.errors
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of successful requests per second."""
+        return len(self.latencies) / self.duration if self.duration else 0.0
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Returns the latency, in seconds, at the given percentile (nearest rank)."""
+        if not self.latencies:
+            return None
+        rank = max(int(round(pct / 100 * len(self.latencies))), 1)
+        return self.latencies[rank - 1]
+
+    def as_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "throughput": self.throughput,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class LoadGenerator:
+    """Drives concurrent keep-alive HTTP clients against a server on localhost.
+
+    Every client holds a persistent :class:`http.client.HTTPConnection` which is
+    transparently re-opened whenever the server closes it (as HTTP/1.0 servers do).
+    """
+
+    def __init__(self, port: int, clients: int = 4, timeout: float = 30.0):
+        self.port = port
+        self.clients = clients
+        self.timeout = timeout
+
+    def _client(self, path: str, remaining: List[int], lock: threading.Lock):
+        latencies: List[float] = []
+        errors = 0
+        conn = http.client.HTTPConnection(LOCALHOST, self.port, timeout=self.timeout)
+        try:
+            while True:
+                with lock:
+                    if remaining[0] <= 0:
+                        break
+                    remaining[0] -= 1
+
+                started = time.perf_counter()
+                try:
+                    conn.request("GET", path)
+                    response = conn.getresponse()
+                    response.read()
+                    if response.status >= 400:
+                        errors += 1
+                        continue
+                    latencies.append(time.perf_counter() - started)
+                except (OSError, http.client.HTTPException):
+                    errors += 1
+                    conn.close()
+        finally:
+            conn.close()
+        return latencies, errors
+
+    def run(self, path: str, requests: int) -> LoadReport:
+        """Issues the given number of GET requests for `path` across all clients."""
+        remaining, lock = [requests], threading.Lock()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.clients) as executor:
+            futures = [
+                executor.submit(self._client, path, remaining, lock)
+                for _ in range(self.clients)
+            ]
+            results = [future.result() for future in futures]
+        duration = time.perf_counter() - started
+
+        latencies = [latency for result in results for latency in result[0]]
+        errors = sum(result[1] for result in results)
+        return LoadReport(path, latencies, errors, duration)
@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+
+import typer
+
+from ...base import RezumeError
+from . import Command, collect_files
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ...dedup import Cluster
+
+
+class DedupCommand(Command):
+    """Finds near-duplicate rezume files"""
+
+    name = "dedup"
+
+    def __init__(
+        self, paths: List[Path], threshold: float = 0.8, output: Optional[Path] = None
+    ):
+        self.paths = paths
+        self.threshold = threshold
+        self.output = output
+
+    def find(self) -> List["Cluster"]:
+        """Finds near-duplicates among the rezume files, returns the clusters shown."""
+        from ... import Rezume
+        from ...dedup import DuplicateFinder
+
+        try:
+            finder = DuplicateFinder(self.threshold)
+        except RezumeError as ex:
+            typer.secho(f"{ex}\n", fg=typer.colors.RED)
+            self.exit()
+
+        for path in collect_files(self.paths):
+            try:
+                finder.add(str(path), Rezume().load(path))
+            except RezumeError as ex:
+                typer.secho(f"Skipped {path}: {ex}", fg=typer.colors.YELLOW)
+
+        clusters = finder.clusters()
+        if not clusters:
+            message = f"No duplicates found among {len(finder)} rezumes"
+            typer.secho(message, fg=typer.colors.GREEN)
+        for number, cluster in enumerate(clusters, 1):
+            typer.secho(f"\nCluster {number}: {len(cluster.keys)} rezumes", bold=True)
+            for first, second, score in cluster.pairs:
+                typer.echo(f"  {score:.2f}  {first}  {second}")
+
+        if self.output:
+            results = [{"files": list(c.keys), "pairs": c.pairs} for c in clusters]
+            self.output.write_text(json.dumps(results, indent=2))
+        return clusters
+
+    def run(self) -> None:
+        self.find()
+
+    @staticmethod
+    def handler(
+        paths: List[Path] = typer.Argument(..., help="Rezume files or directories"),
+        threshold: float = typer.Option(  # noqa
+            0.8, help="Minimum estimated similarity of near-duplicates, from 0 to 1"
+        ),
+        output: Optional[Path] = typer.Option(  # noqa
+            None, help="File to write clusters to as JSON"
+        ),
+    ):
+        """Finds near-duplicate rezume files"""
+        command = DedupCommand(paths, threshold, output)
+        command.run()
@@ -0,0 +1,65 @@
+import json
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+
+from ...base import RezumeError
+from . import Command
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ...diff import RezumeDiff
+
+
+class DiffFormat(str, Enum):
+    text = "text"
+    json = "json"
+    patch = "patch"
+
+
+class DiffCommand(Command):
+    """Shows the changes between two versions of a rezume file"""
+
+    name = "diff"
+
+    def __init__(self, old: Path, new: Path, output_format: DiffFormat = DiffFormat.text):
+        self.old = old
+        self.new = new
+        self.output_format = output_format
+
+    def compare(self) -> "RezumeDiff":
+        """Shows the changes between the rezume files, returns the changes shown."""
+        from ... import Rezume
+        from ...diff import diff_rezumes
+
+        try:
+            changes = diff_rezumes(Rezume().load(self.old), Rezume().load(self.new))
+        except RezumeError as ex:
+            typer.secho(f"{ex}\n", fg=typer.colors.RED)
+            self.exit()
+
+        if self.output_format == DiffFormat.json:
+            typer.echo(json.dumps(changes.as_dict(), indent=2))
+        elif self.output_format == DiffFormat.patch:
+            typer.echo(json.dumps(changes.to_json_patch(), indent=2))
+        elif changes:
+            typer.echo(changes.to_text())
+        else:
+            typer.secho("No changes found", fg=typer.colors.GREEN)
+        return changes
+
+    def run(self) -> None:
+        self.compare()
+
+    @staticmethod
+    def handler(
+        old: Path = typer.Argument(..., help="Old version of the rezume file"),
+        new: Path = typer.Argument(..., help="New version of the rezume file"),
+        output_format: DiffFormat = typer.Option(  # noqa
+            DiffFormat.text, "--format", help="Output as text, JSON or JSON Patch"
+        ),
+    ):
+        """Shows the changes between two versions of a rezume file"""
+        command = DiffCommand(old, new, output_format)
+        command.run()
@@ -2,9 +2,8 @@ import sys
 from pathlib import Path
 
 import typer
-from pydantic import EmailStr
 
-from ... import Rezume, RezumeError
+from ...base import RezumeError
 from . import DEFAULT_FILENAME, Command
 
 
@@ -18,6 +17,10 @@ class InitCommand(Command):
 
     def create(self, name: str, email: str) -> None:
         """Creates a new rezume.yml file based on the template rezume."""
+        from pydantic import EmailStr
+
+        from ... import Rezume
+
         template_path = InitCommand.get_template_path()
         if not template_path.exists():
             typer.secho("\nrezume template file not found.\n", fg=typer.colors.RED)
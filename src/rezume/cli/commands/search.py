@@ -0,0 +1,62 @@
+from pathlib import Path
+from typing import TYPE_CHECKING, List
+
+import typer
+
+from ...base import RezumeError
+from . import Command, collect_files
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ...search import SearchHit
+
+
+class SearchCommand(Command):
+    """Searches the text of rezume files"""
+
+    name = "search"
+
+    def __init__(self, query: str, paths: List[Path], index: Path, limit: int = 10):
+        self.query = query
+        self.paths = paths
+        self.index = index
+        self.limit = limit
+
+    def search(self) -> List["SearchHit"]:
+        """Updates the search index with the rezume files, returns the matches shown."""
+        from ...search import SearchIndex
+
+        try:
+            index = SearchIndex(self.index)
+        except RezumeError as ex:
+            typer.secho(f"{ex}\n", fg=typer.colors.RED)
+            self.exit()
+
+        index.prune()
+        for path, error in index.update(collect_files(self.paths)).items():
+            typer.secho(f"Skipped {path}: {error}", fg=typer.colors.YELLOW)
+        index.save()
+
+        hits = index.search(self.query, self.limit)
+        if not hits:
+            typer.secho("No matches found", fg=typer.colors.YELLOW)
+        for hit in hits:
+            typer.echo(f"{hit.score:8.3f}  {hit.path}")
+        return hits
+
+    def run(self) -> None:
+        self.search()
+
+    @staticmethod
+    def handler(
+        query: str = typer.Argument(..., help='Words to search for, quote "exact phrases"'),
+        paths: List[Path] = typer.Argument(  # noqa
+            None, help="Rezume files or directories to index before searching"
+        ),
+        index: Path = typer.Option(  # noqa
+            Path(".rezume-search.json"), help="File holding the search index"
+        ),
+        limit: int = typer.Option(10, help="Maximum number of matches to show"),  # noqa
+    ):
+        """Searches the text of rezume files"""
+        command = SearchCommand(query, paths or [], index, limit)
+        command.run()
@@ -2,12 +2,17 @@ import json
 import logging
 import pkgutil
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
-from .... import Rezume, RezumeError
+from ....base import RezumeError
+from ...profiling import get_active_profiler
 from .. import DEFAULT_FILENAME, Command
-from . import itty3
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .... import Rezume
+    from . import itty3
 
 log = logging.getLogger(__name__)
 
@@ -28,7 +33,7 @@ def find_theme_module(theme: str):
     return finder.find_module(name).load_module(name)  # type: ignore
 
 
-def render_rezume(rezume: Rezume, theme: str):
+def render_rezume(rezume: "Rezume", theme: str):
     """Renders a Rezume based on a specified theme.
 
     :param rezume: rezume to be rendered
@@ -49,6 +54,7 @@ class ServeCommand(Command):
     """Serves a rezume for local viewing applying available themes."""
 
     name = "serve"
+    profile_per_request = True
 
     def __init__(self, filename: Path, theme: str, port: int):
         self.filename = filename
@@ -57,6 +63,17 @@ class ServeCommand(Command):
 
     def route_index(self, req):
         """HTTP GET request handler for the root route."""
+        profiler = get_active_profiler()
+        if profiler is None:
+            return self._render_index(req)
+
+        with profiler.sample():
+            return self._render_index(req)
+
+    def _render_index(self, req):
+        from .... import Rezume
+        from . import itty3
+
         theme = self.theme
         if req.query and "theme" in req.query:
             theme = req.query["theme"][0]
@@ -76,9 +93,16 @@ class ServeCommand(Command):
             log.error(ex)
             return self.app.render(req, f"Internal Server Error: {ex}", 500)
 
-    def _serve_web(self):
+    def create_web_app(self) -> "itty3.App":
+        """Creates the WSGI application which serves the rezume."""
+        from . import itty3
+
         self.app = app = itty3.App(debug=True)
         app.add_route(itty3.GET, "/", self.route_index)
+        return app
+
+    def _serve_web(self):
+        app = self.create_web_app()
         try:
             app.run(port=self.port, debug=True)
         except KeyboardInterrupt:
@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from ...base import RezumeError
+from . import Command
+
+
+def format_bytes(count: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(count) < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GiB"
+
+
+class StatsCommand(Command):
+    """Reports statistics on rezume files"""
+
+    name = "stats"
+
+    def __init__(
+        self,
+        filenames: List[Path],
+        memory: bool = False,
+        records: bool = False,
+        intern: bool = False,
+        output: Optional[Path] = None,
+    ):
+        self.filenames = filenames
+        self.memory = memory
+        self.records = records
+        self.intern = intern
+        self.output = output
+
+    def print_counts(self, rezumes: list) -> None:
+        typer.secho(f"\n{'section':<16} {'items':>10}", bold=True)
+        counts: dict = {"profiles": sum(len(r.profiles) for r in rezumes)}
+        for rezume in rezumes:
+            for section in rezume.sections:
+                counts[section.name] = counts.get(section.name, 0) + len(section)
+        for name, count in counts.items():
+            typer.echo(f"{name:<16} {count:>10}")
+
+    def print_memory(self, report) -> None:
+        typer.secho(f"\n{'file':<40} {'retained':>12} {'peak':>12}", bold=True)
+        for path, (retained, peak) in report.files.items():
+            typer.echo(f"{path:<40} {format_bytes(retained):>12} {format_bytes(peak):>12}")
+
+        typer.secho(f"\n{'held by':<40} {'bytes':>12}", bold=True)
+        for name, size in sorted(report.breakdown.items(), key=lambda kv: -kv[1]):
+            typer.echo(f"{name:<40} {format_bytes(size):>12}")
+
+    def collect(self) -> dict:
+        """Loads the rezume files and reports on them, returns the reported results."""
+        from ... import Rezume
+        from ...interning import Interner
+        from ...stats import measure_memory
+
+        for filename in self.filenames:
+            if not filename.exists():
+                typer.secho(f"Rezume not found: {filename}", fg=typer.colors.RED)
+                self.exit()
+
+        records, interner = self.records, Interner() if self.intern else None
+        results: dict = {"files": len(self.filenames)}
+        try:
+            if self.memory:
+                rezumes, report = measure_memory(
+                    self.filenames, records=records, interner=interner
+                )
+                results["memory"] = report.as_dict()
+            else:
+                rezumes = [
+                    Rezume().load(f, records=records, interner=interner)
+                    for f in self.filenames
+                ]
+        except RezumeError as ex:
+            typer.secho(f"{ex}\n", fg=typer.colors.RED)
+            self.exit()
+
+        self.print_counts(rezumes)
+        if self.memory:
+            self.print_memory(report)
+        if self.output:
+            self.output.write_text(json.dumps(results, indent=2))
+        return results
+
+    def run(self) -> None:
+        self.collect()
+
+    @staticmethod
+    def handler(
+        filenames: List[Path] = typer.Argument(  # noqa
+            None, help="Rezume files to report on [default: ./rezume.yml]"
+        ),
+        memory: bool = typer.Option(  # noqa
+            False, help="Report memory retained by the loaded rezumes and peak usage"
+        ),
+        records: bool = typer.Option(  # noqa
+            False, help="Load section items as read-only records"
+        ),
+        intern: bool = typer.Option(  # noqa
+            False, help="Share repeated strings and dates between rezumes"
+        ),
+        output: Optional[Path] = typer.Option(  # noqa
+            None, help="File to write results to as JSON"
+        ),
+    ):
+        """Reports statistics on rezume files"""
+        command = StatsCommand(
+            filenames or [Path("./rezume.yml")], memory, records, intern, output
+        )
+        command.run()
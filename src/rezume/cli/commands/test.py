@@ -2,7 +2,7 @@ from pathlib import Path
 
 import typer
 
-from ... import Rezume, RezumeError
+from ...base import RezumeError
 from . import DEFAULT_FILENAME, Command
 
 
@@ -11,22 +11,32 @@ class TestCommand(Command):
 
     name = "test"
 
-    def __init__(self, filename: Path):
+    def __init__(self, filename: Path, use_cache: bool = True):
         self.filename = filename
+        self.use_cache = use_cache
 
     def run(self) -> None:
         if not self.filename.exists():
             typer.secho(f"Rezume not found: {self.filename}", fg=typer.colors.RED)
             self.exit()
 
+        from ... import Rezume
+        from ...cache import ValidationCache
+
+        cache = ValidationCache() if self.use_cache else None
         try:
-            Rezume.validate(self.filename)
+            Rezume.validate(self.filename, cache)
             typer.secho("Rezume is valid!\n", fg=typer.colors.GREEN)
         except RezumeError as ex:
             typer.secho(f"{ex}\n", fg=typer.colors.RED)
 
     @staticmethod
-    def handler(filename: Path = DEFAULT_FILENAME):
+    def handler(
+        filename: Path = DEFAULT_FILENAME,
+        cache: bool = typer.Option(  # noqa
+            True, help="Skip validating files which are unchanged since last validated"
+        ),
+    ):
         """Validates correctness of a rezume.yml file"""
-        command = TestCommand(filename)
+        command = TestCommand(filename, cache)
         command.run()
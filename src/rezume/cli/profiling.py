@@ -0,0 +1,120 @@
+import cProfile
+import pstats
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional, TextIO
+
+# the profiler active for the running command, if any
+_active: Optional["Profiler"] = None
+
+
+def get_active_profiler() -> Optional["Profiler"]:
+    """Returns the profiler for the running command if profiling is enabled."""
+    return _active
+
+
+class Profiler:
+    """Collects cProfile statistics for a rezume command.
+
+    Statistics are either collected for the entire duration of a command (see
+    :meth:`start` and :meth:`stop`) or sampled around units of work such as the
+    requests handled by long running commands (see :meth:`sample`).
+    """
+
+    #: file suffixes for which collapsed stacks are written instead of pstats
+    COLLAPSED_SUFFIXES = (".collapsed", ".folded")
+
+    def __init__(self, filepath: Path, top: int = 20):
+        self.filepath = filepath
+        self.top = top
+        self.samples = 0
+        self.collected = False
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """Starts collecting statistics and marks this as the active profiler."""
+        global _active
+        _active = self
+        self.collected = True
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stops collecting statistics."""
+        global _active
+        self._profile.disable()
+        if _active is self:
+            _active = None
+
+    def activate(self) -> None:
+        """Marks this as the active profiler without collecting statistics so that
+        commands can sample units of work via :meth:`sample`.
+        """
+        global _active
+        _active = self
+
+    @contextmanager
+    def sample(self):
+        """Collects statistics only for the duration of the managed block."""
+        self.collected = True
+        self._profile.enable()
+        try:
+            yield self
+        finally:
+            self._profile.disable()
+            self.samples += 1
+
+    def get_stats(self, stream: TextIO = sys.stderr) -> pstats.Stats:
+        self._profile.create_stats()
+        return pstats.Stats(self._profile, stream=stream)
+
+    def save(self) -> None:
+        """Writes collected statistics to the profile output file.
+
+        Output is written in the pstats format readable by :mod:`pstats` and tools
+        like snakeviz, unless the file has a ``.collapsed`` or ``.folded`` suffix in
+        which case caller/callee stacks are written in the collapsed format read by
+        flamegraph tools.
+        """
+        stats = self.get_stats()
+        if self.filepath.suffix in self.COLLAPSED_SUFFIXES:
+            with self.filepath.open("w") as fp:
+                for line in collapse_stats(stats):
+                    fp.write(f"{line}\n")
+        else:
+            stats.dump_stats(str(self.filepath))
+
+    def report(self, stream: TextIO = sys.stderr) -> None:
+        """Prints the hottest functions by cumulative time."""
+        stats = self.get_stats(stream)
+        stats.sort_stats("cumulative").print_stats(self.top)
+
+
+def _label(func: tuple) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        # built-in functions have no source location
+        return name
+    return f"{Path(filename).name}:{lineno}({name})"
+
+
+def collapse_stats(stats: pstats.Stats):
+    """Yields collapsed stack lines, weighted by microseconds, from profile stats.
+
+    cProfile only records caller/callee pairs hence the stacks produced are two
+    frames deep; functions without recorded callers are reported as roots.
+    """
+    for func, (_, _, tottime, _, callers) in stats.stats.items():  # type: ignore
+        label = _label(func)
+        if not callers:
+            weight = int(tottime * 1e6)
+            if weight:
+                yield f"{label} {weight}"
+            continue
+
+        for caller, entry in callers.items():
+            # entries are (cc, nc, tt, ct) tuples; older versions record a count
+            caller_tottime = entry[2] if isinstance(entry, tuple) else tottime
+            weight = int(caller_tottime * 1e6)
+            if weight:
+                yield f"{_label(caller)};{label} {weight}"
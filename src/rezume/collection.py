@@ -0,0 +1,215 @@
+from datetime import date
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .base import RezumeError
+from .core import Rezume
+from .intervals import TIMELINED_SECTIONS, IntervalIndex, get_span
+
+
+def _keywords(section_name: str) -> Callable[[Rezume], Iterable[str]]:
+    def extract(rezume: Rezume) -> Iterable[str]:
+        for item in rezume[section_name]:
+            yield item.name
+            yield from item.keywords or ()
+
+    return extract
+
+
+def _field(section_name: str, field: str) -> Callable[[Rezume], Iterable[str]]:
+    def extract(rezume: Rezume) -> Iterable[str]:
+        return (getattr(item, field) for item in rezume[section_name])
+
+    return extract
+
+
+def normalize(value: str) -> str:
+    """Returns the form of provided value held by indexes, ignoring case and
+    surrounding whitespace.
+    """
+    return value.strip().casefold()
+
+
+class RezumeCollection:
+    """Represents an in-memory corpus of rezumes with secondary indexes.
+
+    Every index maps normalized values (e.g. skill keywords or employers) to the keys of
+    the rezumes holding them, so that lookups intersect key sets instead of scanning
+    the rezumes.
+    """
+
+    #: maps index names to functions returning the values indexed for a rezume
+    INDEXES: Dict[str, Callable[[Rezume], Iterable[Optional[str]]]] = {
+        "skill": _keywords("skills"),
+        "interest": _keywords("interests"),
+        "language": _field("languages", "language"),
+        "company": _field("work", "company"),
+        "position": _field("work", "position"),
+        "institution": _field("education", "institution"),
+        "study_type": _field("education", "study_type"),
+        "country_code": lambda rezume: [rezume.location.country_code],
+    }
+
+    def __init__(self, rezumes: Optional[Iterable[Rezume]] = None):
+        self._rezumes: Dict[Hashable, Rezume] = {}
+        self._indexes: Dict[str, Dict[str, Set[Hashable]]] = {
+            name: {} for name in self.INDEXES
+        }
+        # values indexed per rezume, used to update indexes on removal
+        self._terms: Dict[Hashable, Dict[str, Set[str]]] = {}
+        # interval indexes built on demand per combination of sections
+        self._intervals: Dict[Tuple[str, ...], IntervalIndex] = {}
+        self._next_key = 0
+
+        for rezume in rezumes or []:
+            self.add(rezume)
+
+    def __len__(self) -> int:
+        return len(self._rezumes)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rezumes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rezumes
+
+    def __getitem__(self, key: Hashable) -> Rezume:
+        return self._rezumes[key]
+
+    def add(self, rezume: Rezume, key: Hashable = None) -> Hashable:
+        """Adds a rezume to the collection and returns the key it is held by, replacing
+        the rezume previously held by the key if any.
+        """
+        if key is None:
+            while self._next_key in self._rezumes:
+                self._next_key += 1
+            key = self._next_key
+
+        if key in self._rezumes:
+            self.remove(key)
+
+        terms = {}
+        for name, extract in self.INDEXES.items():
+            values = {normalize(value) for value in extract(rezume) if value}
+            for value in values:
+                self._indexes[name].setdefault(value, set()).add(key)
+            terms[name] = values
+
+        self._rezumes[key] = rezume
+        self._terms[key] = terms
+        self._intervals.clear()
+        return key
+
+    def remove(self, key: Hashable) -> Rezume:
+        """Removes and returns the rezume held by provided key."""
+        if key not in self._rezumes:
+            raise RezumeError(f"Rezume not found: {key}")
+
+        for name, values in self._terms.pop(key).items():
+            index = self._indexes[name]
+            for value in values:
+                index[value].discard(key)
+                if not index[value]:
+                    del index[value]
+        self._intervals.clear()
+        return self._rezumes.pop(key)
+
+    def load_dir(
+        self, directory: Union[str, Path], pattern: str = "*.yml", **options: Any
+    ) -> "RezumeCollection":
+        """Loads the rezume files matching pattern within provided directory, keyed by
+        their paths. Options are passed on to :meth:`Rezume.load`.
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise RezumeError(f"Directory not found: {directory}")
+
+        for filepath in sorted(directory.glob(pattern)):
+            self.add(Rezume().load(filepath, **options), str(filepath))
+
+        # allows fluent method chaining on `load_dir`
+        return self
+
+    def values(self, index: str) -> Dict[str, int]:
+        """Returns the values held by an index along with the number of rezumes
+        holding each value.
+        """
+        return {value: len(keys) for value, keys in self._get_index(index).items()}
+
+    def find_keys(self, **criteria: Union[str, Iterable[str]]) -> Set[Hashable]:
+        """Returns the keys of rezumes matching all criteria, which map index names to
+        a value or to several values any of which is matched.
+        """
+        matches = []
+        for name, values in criteria.items():
+            index = self._get_index(name)
+            if isinstance(values, str):
+                values = [values]
+
+            keys: Set[Hashable] = set()
+            for value in values:
+                keys |= index.get(normalize(value), set())
+            matches.append(keys)
+
+        if not matches:
+            return set(self._rezumes)
+
+        # intersect from the smallest set to keep intersections cheap
+        matches.sort(key=len)
+        result = set(matches[0])
+        for keys in matches[1:]:
+            if not result:
+                break
+            result &= keys
+        return result
+
+    def find(self, **criteria: Union[str, Iterable[str]]) -> List[Rezume]:
+        """Returns the rezumes matching all criteria in no particular order, see
+        :meth:`find_keys`.
+        """
+        return [self._rezumes[key] for key in self.find_keys(**criteria)]
+
+    def get_interval_index(
+        self, sections: Iterable[str] = TIMELINED_SECTIONS
+    ) -> IntervalIndex:
+        """Returns the interval index over dated entries of provided sections across
+        the collection, holding tuples of rezume key, section name and entry.
+        """
+        sections = tuple(sections)
+        if sections not in self._intervals:
+            self._intervals[sections] = IntervalIndex(
+                (*get_span(entry), (key, name, entry))
+                for key, rezume in self._rezumes.items()
+                for name in sections
+                for entry in rezume[name]
+            )
+        return self._intervals[sections]
+
+    def find_active(
+        self,
+        start: date,
+        end: Optional[date] = None,
+        sections: Iterable[str] = ("work",),
+    ) -> Set[Hashable]:
+        """Returns the keys of rezumes with entries in provided sections overlapping
+        the period from `start` to `end`, e.g. rezumes of those employed within it.
+        """
+        index = self.get_interval_index(sections)
+        return {key for key, _, _ in index.overlapping(start, end)}
+
+    def _get_index(self, name: str) -> Dict[str, Set[Hashable]]:
+        if name not in self._indexes:
+            raise RezumeError(f"Index not found: {name}")
+        return self._indexes[name]
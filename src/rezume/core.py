@@ -0,0 +1,530 @@
+import hashlib
+import heapq
+import json
+import os
+from copy import copy
+from datetime import date, datetime
+from itertools import islice, repeat
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel, HttpUrl, ValidationError, parse_obj_as
+from yaml import Dumper, Loader, dump, load, parser
+
+from . import snapshot
+from .base import RezumeError
+from .cache import FILEPATH_PLACEHOLDER
+from .interning import Interner
+from .intervals import TIMELINED_SECTIONS
+from .models import DatedEntry, PersonalInfo  # noqa
+from .models import Rezume as RezumeModel
+from .records import Record, parse_records
+from .schema import get_validator
+from .sections import (  # noqa
+    AwardSet,
+    EducationSet,
+    ExperienceSet,
+    LanguageSet,
+    NamedKeywordsSet,
+    NamedSection,
+    PublicationSet,
+    ReferenceSet,
+    RezumeBase,
+    Section,
+    TimelinedSection,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import ValidationCache
+
+
+class Rezume(RezumeBase):
+    """Represents a resume."""
+
+    FIELDS = [
+        "name",
+        "email",
+        "label",
+        "location",
+        "phone",
+        "picture",
+        "summary",
+        "website",
+    ]
+
+    NAMED_SECTIONS = {
+        "work": ExperienceSet,
+        "volunteer": ExperienceSet,
+        "education": EducationSet,
+        "awards": AwardSet,
+        "publications": PublicationSet,
+        "skills": NamedKeywordsSet,
+        "languages": LanguageSet,
+        "interests": NamedKeywordsSet,
+        "references": ReferenceSet,
+    }
+
+    def __init__(self):
+        # raw data of sections which get validated on first access
+        self._pending: Dict[str, list] = {}
+        self._interner: Optional[Interner] = None
+        self._records = False
+
+        sections = [cls(name) for name, cls in self.NAMED_SECTIONS.items()]
+        super().__init__(sections)
+
+    def __getitem__(self, section_name):
+        if section_name in self._pending:
+            self._materialize(section_name)
+        return super().__getitem__(section_name)
+
+    def __iter__(self):
+        self._materialize_all()
+        return super().__iter__()
+
+    def clear_section(self, section_name: str):
+        # pending data is dropped rather than validated only to be cleared
+        if self._pending.pop(section_name, None) is not None:
+            return
+        super().clear_section(section_name)
+
+    @property
+    def sections(self) -> Iterable[NamedSection]:
+        """Returns the sections within a resume."""
+        self._materialize_all()
+        return super().sections
+
+    def clear(self):
+        self._pending.clear()
+        super().clear()
+        self.profiles.clear()
+
+        sections = [cls(name) for name, cls in self.NAMED_SECTIONS.items()]
+        for section in sections:
+            self.add(section)
+
+    def clone(self) -> "Rezume":
+        """Returns a copy of the rezume sharing its sections and their items with the
+        copy till either rezume changes them, hence cloning takes time proportional
+        to the number of sections rather than items.
+
+        Shared items are immutable models or records, hence the copy is edited by
+        swapping them (e.g. via :meth:`apply_patch`) without changing this rezume.
+        """
+        rezume = copy(self)
+        rezume._items = {name: section._copy() for name, section in self._items.items()}
+        rezume._cache = {}
+        rezume._pending = dict(self._pending)
+        rezume._profiles = self.profiles._copy()
+        return rezume
+
+    def timeline(
+        self,
+        sections: Iterable[str] = TIMELINED_SECTIONS,
+        reverse: bool = True,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple[str, DatedEntry]]:
+        """Returns an iterator over the entries of timelined sections in chronological
+        order, the latest first unless `reverse` is unset, as (section name, entry).
+
+        Entries are merged lazily from the sorted sections, and when a `limit` is set
+        only that many entries are selected from every section rather than sorting
+        the whole sections.
+        """
+        iterables = []
+        for section_name in sections:
+            section = self[section_name]
+            if section is None:
+                raise RezumeError(f"Section not found: {section_name}")
+            if not isinstance(section, TimelinedSection):
+                raise RezumeError(f"Section is not timelined: {section_name}")
+
+            if limit is None:
+                items: Iterable[DatedEntry] = section._get_sorted(reverse)
+            else:
+                items = section.top(limit, reverse)
+            iterables.append(zip(repeat(section_name), items))
+
+        # timelined sections are all sorted by start date
+        entries = heapq.merge(
+            *iterables, key=lambda entry: entry[1].start_date, reverse=reverse
+        )
+        return entries if limit is None else islice(entries, limit)
+
+    def dump_data(self, exclude_none=True) -> dict:
+        def sanitize(value):
+            return self._sanitize(value, exclude_none)
+
+        # dump basics
+        basics = {}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if not value and exclude_none:
+                continue
+            basics[field] = sanitize(value)
+
+        basics["profiles"] = list(map(sanitize, self.profiles))
+        data = {"basics": sanitize(PersonalInfo(**basics))}
+
+        # dump sections
+        for section in self.sections:
+            if not section:
+                continue
+            data[section.name] = list(map(sanitize, section))  # type: ignore
+
+        # validate data to be returned to ensure it's well formed
+        try:
+            RezumeModel(**data)
+            return data
+        except ValidationError as ex:
+            raise RezumeError(f"error: {ex}")
+
+    def apply_patch(self, operations: Iterable[dict]) -> "Rezume":
+        """Applies JSON Patch operations to the rezume in place, validating again only
+        the items they touch, see :mod:`rezume.patch`.
+        """
+        from .patch import apply_patch
+
+        # allows fluent method chaining on `apply_patch`
+        return apply_patch(self, operations)
+
+    def fingerprint(self) -> str:
+        """Returns a SHA-256 hex digest of the rezume content, which is the same for
+        rezumes dumping the same data whatever their formatting and ordering.
+
+        Digests of sections are cached till their items change, hence only basics and
+        changed sections are hashed again.
+        """
+        basics = {f: getattr(self, f) for f in self.FIELDS if getattr(self, f)}
+        digest = hashlib.sha256(self._get_canonical_data(self._sanitize(basics, True)))
+        sections: List[Tuple[str, Section]] = [("profiles", self.profiles)]
+        sections.extend(sorted((s.name, s) for s in self.sections if s))
+        for name, section in sections:
+            digest.update(f"\n{name}:".encode())
+            digest.update(section._get_cached("digest", lambda: self._get_digest(section)))
+        return digest.hexdigest()
+
+    def _get_digest(self, section: Section) -> bytes:
+        # items are hashed on their own and their digests sorted, so that the digest
+        # of a section doesn't depend on the order of its items
+        digests = sorted(
+            hashlib.sha256(self._get_canonical_data(self._sanitize(item, True))).digest()
+            for item in section._items.values()
+        )
+        return hashlib.sha256(b"".join(digests)).digest()
+
+    @staticmethod
+    def _get_canonical_data(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
+
+    def load_data(
+        self,
+        data: dict,
+        sections: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+        interner: Optional[Interner] = None,
+        records: bool = False,
+    ) -> "Rezume":
+        """Loads the provide rezume data.
+
+        :param sections: names of the sections to load, other sections are neither
+            validated nor loaded and are left empty
+        :param lazy: defers validating and loading every section till it's first
+            accessed; validation errors for a section are then raised on access
+        :param interner: deduplicates strings and dates repeated across the rezumes
+            loaded with the same interner
+        :param records: loads section items as compact read-only records instead of
+            models, see :mod:`rezume.records`
+        """
+        self.clear()
+        self._interner = interner
+        self._records = records
+        if sections is not None or lazy or records:
+            # records are validated per section, straight from the data
+            return self._load_sections(data, sections, lazy)
+
+        rezume = RezumeModel(**data)
+        if interner is not None:
+            interner.intern_model(rezume)
+        self._set_basics(rezume.basics)
+
+        # assign sections
+        for section_name in self.NAMED_SECTIONS:
+            if not hasattr(rezume, section_name):
+                continue
+
+            section = getattr(rezume, section_name)
+            if not section:
+                continue
+
+            for item in section:
+                self.add_item(section_name, item)
+
+        # allows fluent method chaining on `load_data`
+        return self
+
+    def _set_basics(self, basics: PersonalInfo):
+        # set attribbutes
+        for f in self.FIELDS:
+            value = getattr(basics, f)
+            setattr(self, f, value)
+
+        # set profiles
+        for profile in basics.profiles or []:
+            self.profiles.add(profile)
+
+    def _load_sections(
+        self, data: dict, sections: Optional[Iterable[str]], lazy: bool
+    ) -> "Rezume":
+        """Loads basics and the named sections, validating each section separately."""
+        if not isinstance(data, dict):
+            raise TypeError("rezume data must be a mapping")
+
+        section_names = list(self.NAMED_SECTIONS if sections is None else sections)
+        for section_name in section_names:
+            if section_name not in self.NAMED_SECTIONS:
+                raise RezumeError(f"Section not found: {section_name}")
+
+            field = RezumeModel.__fields__[section_name]
+            if field.required and data.get(section_name) is None:
+                raise RezumeError(f"error: section is required: {section_name}")
+
+        basics = PersonalInfo(**(data.get("basics") or {}))
+        if self._interner is not None:
+            self._interner.intern_model(basics)
+        self._set_basics(basics)
+        for section_name in section_names:
+            items = data.get(section_name)
+            if not items:
+                continue
+
+            if lazy:
+                self._pending[section_name] = items
+            else:
+                self._load_section(section_name, items)
+
+        return self
+
+    def _load_section(self, section_name: str, items: list):
+        model = RezumeModel.__fields__[section_name].type_
+        section = super().__getitem__(section_name)
+        intern = self._interner.intern_value if self._interner is not None else None
+        try:
+            # all items are validated before any is added to the section
+            if self._records:
+                parsed = parse_records(model, items, intern)
+            else:
+                parsed = parse_obj_as(List[model], items)  # type: ignore
+                if intern is not None:
+                    parsed = [intern(item) for item in parsed]
+        except ValidationError as ex:
+            raise RezumeError(f"error: {ex}")
+
+        for item in parsed:
+            section.add(item)
+
+    def _materialize(self, section_name: str):
+        # data is kept pending till loaded, so a failing section fails on every access
+        self._load_section(section_name, self._pending[section_name])
+        del self._pending[section_name]
+
+    def _materialize_all(self):
+        for section_name in list(self._pending):
+            self._materialize(section_name)
+
+    def load(
+        self,
+        filepath: Union[str, Path],
+        sections: Optional[Iterable[str]] = None,
+        lazy: bool = False,
+        interner: Optional[Interner] = None,
+        records: bool = False,
+    ) -> "Rezume":
+        """Loads the rezume file, see :meth:`load_data` for the loading options."""
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if not filepath.exists() or filepath.is_dir():
+            raise RezumeError(f"File not found: {filepath}")
+
+        return self._load_content(
+            filepath.read_bytes(),
+            filepath,
+            sections=sections,
+            lazy=lazy,
+            interner=interner,
+            records=records,
+        )
+
+    def _load_content(self, content: bytes, filepath: Path, **options) -> "Rezume":
+        """Loads rezume data from the YAML content read from provided file."""
+        try:
+            self.load_data(load(content, Loader=Loader), **options)
+        except (TypeError, parser.ParserError):
+            raise RezumeError(f"Invalid file format: {filepath}")
+        except ValidationError as ex:
+            raise RezumeError(f"error: {ex}")
+        else:
+            # allows fluent method chaining on `load`
+            return self
+
+    def save(self, filepath: Path, overwrite=False, exclude_none=True) -> None:
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if filepath.exists() and not overwrite:
+            raise RezumeError("File already exist, set overwrite if intended")
+
+        try:
+            with filepath.open("w") as fp:
+                content = dump(self.dump_data(exclude_none), Dumper=Dumper)
+                fp.write(content)
+        except Exception as ex:
+            raise RezumeError(f"Save operation failed: {ex}")
+
+    def save_snapshot(
+        self, filepath: Union[str, Path], overwrite=False, compress=True
+    ) -> None:
+        """Saves the rezume as a compact binary snapshot which loads much faster than
+        YAML as its data isn't validated again when loaded.
+        """
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if filepath.exists() and not overwrite:
+            raise RezumeError("File already exist, set overwrite if intended")
+
+        # write to a temporary file first so readers never see partial snapshots
+        tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_bytes(snapshot.dumps(self, compress))
+            os.replace(str(tmp_path), str(filepath))
+        except Exception as ex:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise RezumeError(f"Save operation failed: {ex}")
+
+    def load_snapshot(self, filepath: Union[str, Path], records: bool = False) -> "Rezume":
+        """Loads a snapshot saved via :meth:`save_snapshot`, optionally loading section
+        items as read-only records.
+        """
+        if not isinstance(filepath, Path):
+            filepath = Path(filepath)
+
+        if not filepath.exists() or filepath.is_dir():
+            raise RezumeError(f"File not found: {filepath}")
+
+        # allows fluent method chaining on `load_snapshot`
+        return snapshot.loads(self, filepath.read_bytes(), records)
+
+    def _sanitize(self, value: Any, exclude_none) -> Any:
+        def sanitize(val):
+            return self._sanitize(val, exclude_none)
+
+        if isinstance(value, (BaseModel, Record)):
+            return sanitize(value.dict(by_alias=True, exclude_none=exclude_none))
+        elif isinstance(value, HttpUrl):
+            return str(value)
+        elif isinstance(value, (date, datetime)):
+            return value.isoformat()
+        elif isinstance(value, (list, tuple)):
+            return list(map(sanitize, value))
+        elif isinstance(value, dict):
+            return {key: sanitize(value) for key, value in value.items() if value}
+        else:
+            return str(value)
+
+    @classmethod
+    def is_valid(cls, source: Union[dict, str, Path]) -> bool:
+        try:
+            cls.validate(source)
+            return True
+        except RezumeError:
+            return False
+
+    @classmethod
+    def validate(
+        cls, source: Union[dict, str, Path], cache: Optional["ValidationCache"] = None
+    ):
+        """Validates rezume data or file, raising :class:`RezumeError` if invalid.
+
+        Data is checked against the schema without building any sections. When a
+        validation cache is provided, files whose content was validated before aren't
+        validated again and the cached outcome is used instead.
+        """
+        if isinstance(source, str):
+            source = Path(source)
+
+        if isinstance(source, dict):
+            cls._validate_data(source)
+            return
+
+        if not source.exists() or source.is_dir():
+            raise RezumeError(f"File not found: {source}")
+
+        content = source.read_bytes()
+        if cache is None:
+            cls._validate_content(content, source)
+            return
+
+        entry = cache.get(content)
+        if entry is not None:
+            if entry.error is not None:
+                raise RezumeError(entry.error.replace(FILEPATH_PLACEHOLDER, str(source)))
+            return
+
+        try:
+            cls._validate_content(content, source)
+        except RezumeError as ex:
+            cache.set(content, str(ex).replace(str(source), FILEPATH_PLACEHOLDER))
+            raise
+        cache.set(content)
+
+    @classmethod
+    def _validate_content(cls, content: bytes, filepath: Path):
+        try:
+            data = load(content, Loader=Loader)
+        except parser.ParserError:
+            raise RezumeError(f"Invalid file format: {filepath}")
+
+        if not isinstance(data, dict):
+            raise RezumeError(f"Invalid file format: {filepath}")
+        cls._validate_data(data)
+
+    @staticmethod
+    def _validate_data(data: dict):
+        # cheap structural checks reject malformed data ahead of model validation
+        get_validator()(data)
+        try:
+            RezumeModel(**data)
+        except ValidationError as ex:
+            raise RezumeError(f"error: {ex}")
+        except TypeError as ex:
+            raise RezumeError(f"Invalid rezume data: {ex}")
+
+    @classmethod
+    def validate_many(
+        cls, sources: Iterable[Union[str, Path]], cache: Optional["ValidationCache"] = None
+    ) -> Dict[Path, Optional[str]]:
+        """Validates rezume files and returns the error message for every invalid file,
+        or None for valid ones, keyed by file path.
+        """
+        results: Dict[Path, Optional[str]] = {}
+        for source in sources:
+            filepath = Path(source)
+            try:
+                cls.validate(filepath, cache)
+                results[filepath] = None
+            except RezumeError as ex:
+                results[filepath] = str(ex)
+        return results
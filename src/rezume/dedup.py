@@ -0,0 +1,175 @@
+"""Detection of near-duplicate rezumes with MinHash and locality-sensitive hashing.
+
+Every rezume is reduced to a set of features: the keys identifying its section items
+(as generated by the sections to tell items apart), its identity (name, email and
+profiles), and word shingles of its free text. The Jaccard similarity of two feature
+sets is estimated by the share of equal values within their MinHash signatures.
+
+Signatures are split into bands and rezumes sharing any band land in the same bucket,
+making them candidate duplicates; only candidates are compared, which takes near
+linear time rather than comparing every pair. Candidates similar enough are grouped
+into clusters with a union-find.
+
+MinHash signatures are computed with NumPy, installed with the ``numpy`` extra.
+"""
+import zlib
+from typing import TYPE_CHECKING, Any, Dict, Hashable, List, NamedTuple, Set, Tuple
+
+from .base import RezumeError
+from .collection import normalize
+from .search import get_texts, tokenize
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Rezume
+
+SHINGLE_SIZE = 3
+
+
+def hash_feature(feature: str) -> int:
+    """Returns a 32-bit hash of a feature which, unlike :func:`hash`, is stable across
+    runs; the hash functions applied to hashes make up for CRC32's weaker mixing.
+    """
+    return zlib.crc32(feature.encode())
+
+
+def get_features(rezume: "Rezume") -> Set[str]:
+    """Returns the features of a rezume compared for near-duplicate detection."""
+    features = {f"name:{normalize(rezume.name)}", f"email:{normalize(rezume.email)}"}
+    for profile in rezume.profiles:
+        features.add(f"profile:{normalize(profile.network)}:{normalize(profile.username)}")
+
+    for section in rezume.sections:
+        for item in section:
+            features.add(f"{section.name}:{normalize(section._generate_key(item))}")
+
+    for field, text in get_texts(rezume):
+        tokens = tokenize(text)
+        for index in range(max(len(tokens) - SHINGLE_SIZE + 1, 1)):
+            features.add(f"{field}:{' '.join(tokens[index : index + SHINGLE_SIZE])}")
+    return features
+
+
+def get_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Returns the number of bands and rows per band splitting signatures of `num_perm`
+    values so that pairs become candidates around the similarity threshold.
+    """
+
+    def get_threshold(option: Tuple[int, int]) -> float:
+        # pairs with similarity s share a band with probability 1 - (1 - s^rows)^bands,
+        # which rises steeply around (1 / bands)^(1 / rows)
+        bands, rows = option
+        return (1 / bands) ** (1 / rows)
+
+    options = [(bands, num_perm // bands) for bands in range(1, num_perm + 1)]
+    options = [(bands, rows) for bands, rows in options if bands * rows == num_perm]
+    # err towards lower thresholds as false candidates get discarded once compared,
+    # while missed candidates are missed duplicates
+    below = [option for option in options if get_threshold(option) <= threshold]
+    if not below:
+        return min(options, key=get_threshold)
+    return max(below, key=get_threshold)
+
+
+class Cluster(NamedTuple):
+    """Represents a group of near-duplicate rezumes."""
+
+    keys: Tuple[Hashable, ...]
+    #: pairs of keys within the cluster along with their estimated similarity
+    pairs: List[Tuple[Hashable, Hashable, float]]
+
+
+class DuplicateFinder:
+    """Finds clusters of near-duplicate rezumes, see :mod:`rezume.dedup`.
+
+    Only signatures are held for added rezumes, hence rezumes can be loaded one after
+    the other and discarded once added.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, seed: int = 1):
+        if np is None:
+            raise RezumeError("Deduplication requires numpy: pip install rezume[numpy]")
+
+        self.threshold = threshold
+        self.bands, self.rows = get_bands(num_perm, threshold)
+        generator = np.random.RandomState(seed)
+        # coefficients of the multiply-shift hash functions ((a * x + b) mod 2^64) >> 32
+        # with odd multipliers, standing in for random permutations
+        self._a = generator.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) * 2 + 1
+        self._b = generator.randint(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+        self.keys: List[Hashable] = []
+        self.signatures: List[Any] = []
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get_signature(self, features: Set[str]) -> Any:
+        """Returns the MinHash signature of a feature set."""
+        hashes = np.fromiter(map(hash_feature, features), dtype=np.uint64, count=len(features))
+        if not len(hashes):
+            hashes = np.zeros(1, dtype=np.uint64)
+        # computed in place, relying on unsigned integers wrapping around
+        values = np.multiply.outer(hashes, self._a)
+        values += self._b
+        values >>= np.uint64(32)
+        return values.min(axis=0).astype(np.uint32)
+
+    def add(self, key: Hashable, rezume: "Rezume") -> None:
+        """Adds the signature of a rezume held by provided key."""
+        index = len(self.keys)
+        signature = self.get_signature(get_features(rezume))
+        self.keys.append(key)
+        self.signatures.append(signature)
+
+        for band in range(self.bands):
+            chunk = signature[band * self.rows : (band + 1) * self.rows].tobytes()
+            self._buckets.setdefault((band, chunk), []).append(index)
+
+    def similarity(self, first: int, second: int) -> float:
+        """Returns the estimated similarity of rezumes at provided indexes."""
+        return float(np.mean(self.signatures[first] == self.signatures[second]))
+
+    def clusters(self) -> List[Cluster]:
+        """Returns the clusters of rezumes with similarity at or above the threshold,
+        largest clusters first.
+        """
+        candidates: Set[Tuple[int, int]] = set()
+        for indexes in self._buckets.values():
+            for position, first in enumerate(indexes):
+                candidates.update((first, second) for second in indexes[position + 1 :])
+
+        parents = list(range(len(self.keys)))
+
+        def find(index: int) -> int:
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        pairs = []
+        for first, second in sorted(candidates):
+            score = self.similarity(first, second)
+            if score >= self.threshold:
+                pairs.append((first, second, score))
+                parents[find(second)] = find(first)
+
+        cluster_pairs: Dict[int, list] = {}
+        for first, second, score in pairs:
+            cluster_pairs.setdefault(find(first), []).append(
+                (self.keys[first], self.keys[second], score)
+            )
+        members: Dict[int, list] = {}
+        for index, key in enumerate(self.keys):
+            root = find(index)
+            if root in cluster_pairs:
+                members.setdefault(root, []).append(key)
+
+        clusters = [Cluster(tuple(members[root]), cluster_pairs[root]) for root in members]
+        return sorted(clusters, key=lambda cluster: -len(cluster.keys))
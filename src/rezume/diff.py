@@ -0,0 +1,201 @@
+"""Structural diff between two versions of a rezume.
+
+Items of each section are matched across versions by the key their section identifies
+them by (e.g. start month and position for work entries), hence matching takes linear
+time and an edited item shows up as modified, along with its changed fields, rather
+than as removed and added. Changes are reported as text or as a JSON Patch (RFC 6902)
+turning the data dumped for the old version into that of the new version.
+"""
+import json
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Rezume
+    from .sections import Section
+
+ADDED = "add"
+REMOVED = "remove"
+MODIFIED = "modify"
+
+SYMBOLS = {ADDED: "+", REMOVED: "-", MODIFIED: "~"}
+
+
+class Change(NamedTuple):
+    """Represents a change to an item of a section, or to basics."""
+
+    op: str
+    section: str
+    key: str
+    #: position of the item within the old version, None for added items
+    position: Optional[int]
+    old: Any
+    new: Any
+    #: maps the changed fields of modified items to their old and new values, either
+    #: being None for fields added or removed
+    fields: Dict[str, Tuple[Any, Any]]
+
+
+def get_path(section: str) -> str:
+    """Returns the JSON Pointer of a section within dumped rezume data."""
+    return "/basics/profiles" if section == "profiles" else f"/{section}"
+
+
+def diff_fields(old: dict, new: dict) -> Dict[str, Tuple[Any, Any]]:
+    return {
+        field: (old.get(field), new.get(field))
+        for field in [*old, *(field for field in new if field not in old)]
+        if old.get(field) != new.get(field)
+    }
+
+
+class RezumeDiff:
+    """Represents the changes between two versions of a rezume, see :mod:`rezume.diff`."""
+
+    def __init__(self, changes: List[Change], empty_sections: Dict[str, Tuple[bool, bool]]):
+        self.changes = changes
+        # whether each changed section is empty in the old and new versions, as empty
+        # sections are left out of dumped data
+        self._empty_sections = empty_sections
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def as_dict(self) -> List[dict]:
+        results = []
+        for change in self.changes:
+            result: Dict[str, Any] = {
+                "op": change.op,
+                "section": change.section,
+                "key": change.key,
+            }
+            if change.op == MODIFIED:
+                result["fields"] = {f: list(values) for f, values in change.fields.items()}
+            else:
+                result["item"] = change.new if change.op == ADDED else change.old
+            results.append(result)
+        return results
+
+    def to_text(self) -> str:
+        """Returns the changes as human readable text."""
+        lines = []
+        section = None
+        for change in self.changes:
+            if change.section != section:
+                section = change.section
+                lines.append(section)
+
+            if change.section == "basics":
+                for field, (old, new) in change.fields.items():
+                    lines.append(f"  ~ {field}: {json.dumps(old)} -> {json.dumps(new)}")
+                continue
+
+            lines.append(f"  {SYMBOLS[change.op]} {change.key}")
+            for field, (old, new) in change.fields.items():
+                lines.append(f"      {field}: {json.dumps(old)} -> {json.dumps(new)}")
+        return "\n".join(lines)
+
+    def to_json_patch(self) -> List[dict]:
+        """Returns the changes as JSON Patch operations applying to the data dumped for
+        the old version.
+
+        Fields and items are replaced and removed by their positions within the old
+        version, removals running from the last position so that the positions of
+        preceding items hold, and added items get appended.
+        """
+        operations: List[dict] = []
+        sections: Dict[str, List[Change]] = {}
+        for change in self.changes:
+            sections.setdefault(change.section, []).append(change)
+
+        for section, changes in sections.items():
+            path = get_path(section)
+            if section == "basics":
+                for field, (old, new) in changes[0].fields.items():
+                    operations.append(self._get_field_operation(f"/basics/{field}", old, new))
+                continue
+
+            was_empty, is_empty = self._empty_sections[section]
+            if was_empty:
+                added = [change.new for change in changes]
+                operations.append({"op": "add", "path": path, "value": added})
+                continue
+            elif is_empty:
+                operations.append({"op": "remove", "path": path})
+                continue
+
+            for change in changes:
+                if change.op == MODIFIED:
+                    for field, (old, new) in change.fields.items():
+                        field_path = f"{path}/{change.position}/{field}"
+                        operations.append(self._get_field_operation(field_path, old, new))
+            removed: List[int] = []
+            for change in changes:
+                if change.op == REMOVED and change.position is not None:
+                    removed.append(change.position)
+            for position in sorted(removed, reverse=True):
+                operations.append({"op": "remove", "path": f"{path}/{position}"})
+            for change in changes:
+                if change.op == ADDED:
+                    operations.append({"op": "add", "path": f"{path}/-", "value": change.new})
+        return operations
+
+    @staticmethod
+    def _get_field_operation(path: str, old: Any, new: Any) -> dict:
+        if old is None:
+            return {"op": "add", "path": path, "value": new}
+        elif new is None:
+            return {"op": "remove", "path": path}
+        return {"op": "replace", "path": path, "value": new}
+
+
+def _diff_section(name: str, old: "Section", new: "Section", sanitize) -> Iterable[Change]:
+    old_items = {old._generate_key(item): (i, item) for i, item in enumerate(old)}
+    new_items = {new._generate_key(item): item for item in new}
+
+    for key, (position, item) in old_items.items():
+        if key not in new_items:
+            yield Change(REMOVED, name, str(key), position, sanitize(item), None, {})
+            continue
+
+        new_item = new_items[key]
+        if new_item is item or new_item == item:
+            continue
+        old_data, new_data = sanitize(item), sanitize(new_item)
+        fields = diff_fields(old_data, new_data)
+        if fields:
+            yield Change(MODIFIED, name, str(key), position, old_data, new_data, fields)
+
+    for key, item in new_items.items():
+        if key not in old_items:
+            yield Change(ADDED, name, str(key), None, None, sanitize(item), {})
+
+
+def diff_rezumes(old: "Rezume", new: "Rezume") -> RezumeDiff:
+    """Returns the changes turning the old version of a rezume into the new version."""
+
+    def sanitize(value: Any) -> Any:
+        return old._sanitize(value, exclude_none=True)
+
+    changes = []
+    old_basics = {f: sanitize(getattr(old, f)) for f in old.FIELDS if getattr(old, f)}
+    new_basics = {f: sanitize(getattr(new, f)) for f in new.FIELDS if getattr(new, f)}
+    fields = diff_fields(old_basics, new_basics)
+    if fields:
+        changes.append(Change(MODIFIED, "basics", "", None, old_basics, new_basics, fields))
+
+    empty_sections = {}
+    pairs: List[Tuple[str, "Section", "Section"]] = [("profiles", old.profiles, new.profiles)]
+    pairs.extend((section.name, section, new[section.name]) for section in old.sections)
+    for name, old_section, new_section in pairs:
+        section_changes = list(_diff_section(name, old_section, new_section, sanitize))
+        if section_changes:
+            changes.extend(section_changes)
+            # profiles are always dumped, even if there are none
+            empty_sections[name] = (
+                name != "profiles" and not old_section,
+                name != "profiles" and not new_section,
+            )
+    return RezumeDiff(changes, empty_sections)
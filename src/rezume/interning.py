@@ -0,0 +1,61 @@
+import sys
+from datetime import date
+from typing import Any, Dict
+
+from pydantic import BaseModel
+
+# only exact types are pooled; subclasses (e.g. URLs) carry more than their value
+INTERNED_TYPES = (str, date)
+
+
+class Interner:
+    """Deduplicates equal strings and dates held by models so that rezumes loaded with
+    the same interner share a single instance of every repeated value, e.g. company
+    and institution names, fluency levels, keywords and country codes.
+    """
+
+    def __init__(self):
+        self._pool: Dict[Any, Any] = {}
+        self.hits = 0
+        self.saved_bytes = 0
+
+    def __len__(self):
+        return len(self._pool)
+
+    def intern(self, value: Any) -> Any:
+        """Returns the pooled instance equal to provided value, pooling it if new."""
+        if type(value) not in INTERNED_TYPES:
+            return value
+
+        pooled = self._pool.setdefault(value, value)
+        if pooled is not value:
+            self.hits += 1
+            self.saved_bytes += sys.getsizeof(value)
+        return pooled
+
+    def intern_value(self, value: Any) -> Any:
+        """Interns provided value along with values nested within models and lists."""
+        if isinstance(value, BaseModel):
+            return self.intern_model(value)
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self.intern_value(item)
+            return value
+        return self.intern(value)
+
+    def intern_model(self, model: BaseModel) -> BaseModel:
+        """Interns the field values of provided model in place."""
+        values = model.__dict__
+        for name, value in values.items():
+            values[name] = self.intern_value(value)
+        return model
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of pooled values, of duplicates replaced by pooled values
+        and the approximate number of bytes saved by doing so.
+        """
+        return {"values": len(self._pool), "hits": self.hits, "saved_bytes": self.saved_bytes}
+
+    def clear(self) -> None:
+        self._pool.clear()
+        self.hits = self.saved_bytes = 0
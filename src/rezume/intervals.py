@@ -0,0 +1,152 @@
+"""Interval indexes over dated entries (work, volunteer and education).
+
+Entries span the closed range from their start date to their end date, with ongoing
+entries (without an end date) extending indefinitely.
+"""
+import heapq
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Rezume
+
+T = TypeVar("T")
+
+#: sections holding dated entries
+TIMELINED_SECTIONS = ("work", "volunteer", "education")
+
+
+def get_span(entry: Any) -> Tuple[date, date]:
+    """Returns the start and end dates of a dated entry, ongoing entries end at
+    :data:`datetime.date.max`.
+    """
+    return entry.start_date, entry.end_date or date.max
+
+
+class IntervalIndex(Generic[T]):
+    """Represents a static interval tree answering overlap queries in logarithmic time.
+
+    Intervals are kept sorted by start date and viewed as an implicit balanced binary
+    search tree, the middle interval of every range being the root of its subtree.
+    Every node also records the latest end date within its subtree, allowing queries
+    to skip subtrees which end before the queried range. Intervals added after the
+    index is built are merged in on the next query.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[date, date, T]] = ()):
+        self._intervals: List[Tuple[date, date, T]] = list(intervals)
+        self._starts: List[date] = []
+        self._max_ends: List[date] = []
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[T]) -> "IntervalIndex[T]":
+        """Returns the index over dated entries, holding the entries themselves."""
+        return cls((*get_span(entry), entry) for entry in entries)
+
+    @staticmethod
+    def from_rezume(
+        rezume: "Rezume", sections: Iterable[str] = TIMELINED_SECTIONS
+    ) -> "IntervalIndex[Tuple[str, Any]]":
+        """Returns the index over dated entries of a rezume, holding pairs of section
+        name and entry.
+        """
+        return IntervalIndex(
+            (*get_span(entry), (name, entry))
+            for name in sections
+            for entry in rezume[name]
+        )
+
+    def add(self, start: date, end: Optional[date], value: T) -> None:
+        self._intervals.append((start, end or date.max, value))
+        self._dirty = True
+
+    def _build(self) -> None:
+        self._intervals.sort(key=lambda interval: interval[0])
+        self._starts = [start for start, _, _ in self._intervals]
+        self._max_ends = [end for _, end, _ in self._intervals]
+
+        def build(lo: int, hi: int) -> date:
+            mid = (lo + hi) // 2
+            max_end = self._max_ends[mid]
+            if lo < mid:
+                max_end = max(max_end, build(lo, mid))
+            if mid + 1 < hi:
+                max_end = max(max_end, build(mid + 1, hi))
+            self._max_ends[mid] = max_end
+            return max_end
+
+        if self._intervals:
+            build(0, len(self._intervals))
+        self._dirty = False
+
+    def overlapping(self, start: date, end: Optional[date] = None) -> List[T]:
+        """Returns the values of intervals overlapping the closed range from `start` to
+        `end`, ordered by start date; the range is unbounded if `end` is omitted.
+        """
+        if self._dirty:
+            self._build()
+
+        end = end or date.max
+        # intervals starting after `end` can't overlap, which bounds the search
+        limit = bisect_right(self._starts, end)
+        found: List[T] = []
+
+        def search(lo: int, size: int) -> None:
+            # visits the subtree spanning `size` intervals from `lo`
+            if size <= 0 or lo >= limit:
+                return
+            mid = lo + size // 2
+            if self._max_ends[mid] < start:
+                return
+            search(lo, size // 2)
+            if mid < limit:
+                if self._intervals[mid][1] >= start:
+                    found.append(self._intervals[mid][2])
+                search(mid + 1, size - size // 2 - 1)
+
+        search(0, len(self._intervals))
+        return found
+
+    def at(self, day: date) -> List[T]:
+        """Returns the values of intervals spanning provided day."""
+        return self.overlapping(day, day)
+
+
+def find_gaps(entries: Iterable[Any], min_days: int = 1) -> List[Tuple[date, date]]:
+    """Returns the periods of at least `min_days` days not covered by any of provided
+    dated entries, between the earliest start and the latest end, as pairs of first
+    and last uncovered days.
+    """
+    gaps = []
+    covered_until: Optional[date] = None
+    for start, end in sorted(get_span(entry) for entry in entries):
+        if covered_until is not None and (start - covered_until).days - 1 >= min_days:
+            gaps.append((covered_until + timedelta(days=1), start - timedelta(days=1)))
+        if covered_until is None or end > covered_until:
+            covered_until = end
+    return gaps
+
+
+def find_overlaps(entries: Iterable[T]) -> List[Tuple[T, T]]:
+    """Returns the pairs of provided dated entries whose periods overlap, the entry
+    starting first (or listed first for equal starts) leading every pair.
+    """
+    spans = sorted(
+        ((*get_span(entry), index, entry) for index, entry in enumerate(entries)),
+        key=lambda span: (span[0], span[2]),
+    )
+
+    pairs = []
+    active: List[Tuple[date, int, Any]] = []  # heap of entries by end date
+    for start, end, index, entry in spans:
+        while active and active[0][0] < start:
+            heapq.heappop(active)
+        for _, _, other in sorted(active, key=lambda item: item[1]):
+            pairs.append((other, entry))
+        heapq.heappush(active, (end, index, entry))
+    return pairs
@@ -0,0 +1,159 @@
+"""Ranking of rezumes against job descriptions by TF-IDF similarity.
+
+Skills, interests, summaries and highlights of every rezume are weighed by TF-IDF
+into a sparse document-term matrix held as NumPy arrays in compressed sparse column
+(CSC) form, i.e. per term the rows (rezumes) holding it. Scoring a job description
+then only touches the columns of its terms, scattering their weights into per-rezume
+scores with a single :func:`numpy.bincount`, instead of looping over rezumes.
+
+NumPy is an optional dependency, installed with the ``matching`` extra.
+"""
+import math
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, NamedTuple, Tuple
+
+from .base import RezumeError
+from .search import tokenize
+
+np: Any
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .collection import RezumeCollection
+    from .core import Rezume
+
+
+def get_match_texts(rezume: "Rezume") -> Iterable[str]:
+    """Yields the texts of a rezume which are matched against job descriptions."""
+    if rezume.summary:
+        yield rezume.summary
+    for section_name in ("skills", "interests"):
+        for item in rezume[section_name]:
+            yield item.name
+            yield from item.keywords or ()
+    for section_name in ("work", "volunteer"):
+        for item in rezume[section_name]:
+            yield item.position
+            if item.summary:
+                yield item.summary
+            yield from item.highlights or ()
+
+
+class Match(NamedTuple):
+    """Represents a rezume matching a job description."""
+
+    key: Hashable
+    score: float
+    #: terms of the job description found in the rezume
+    terms: Tuple[str, ...]
+
+
+class Matcher:
+    """Ranks rezumes by the cosine similarity of their TF-IDF vectors to that of a job
+    description, see :mod:`rezume.matching`.
+    """
+
+    def __init__(self, rezumes: Iterable[Tuple[Hashable, "Rezume"]]):
+        if np is None:
+            raise RezumeError("Matching requires numpy: pip install rezume[matching]")
+
+        self.keys: List[Hashable] = []
+        self.vocabulary: Dict[str, int] = {}
+        columns: List[int] = []
+        rows: List[int] = []
+        counts: List[int] = []
+        for row, (key, rezume) in enumerate(rezumes):
+            self.keys.append(key)
+            frequencies = Counter(t for text in get_match_texts(rezume) for t in tokenize(text))
+            for term, count in frequencies.items():
+                columns.append(self.vocabulary.setdefault(term, len(self.vocabulary)))
+                rows.append(row)
+                counts.append(count)
+
+        size, term_count = len(self.keys), len(self.vocabulary)
+        column_array = np.array(columns, dtype=np.int32)
+        row_array = np.array(rows, dtype=np.int32)
+
+        # smoothed inverse document frequency and sub-linear term frequency
+        df = np.bincount(column_array, minlength=term_count)
+        self.idf = (np.log((1 + size) / (1 + df)) + 1).astype(np.float32)
+        weights = (1 + np.log(np.array(counts, dtype=np.float32))) * self.idf[column_array]
+        norms = np.sqrt(np.bincount(row_array, weights=weights ** 2, minlength=size))
+        weights /= norms[row_array].astype(np.float32)
+
+        # group entries per term; the stable sort keeps rows ascending within columns
+        order = np.argsort(column_array, kind="stable")
+        self.indices = row_array[order]
+        self.data = weights[order]
+        self.indptr = np.zeros(term_count + 1, dtype=np.int64)
+        np.cumsum(df, out=self.indptr[1:])
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_collection(cls, collection: "RezumeCollection") -> "Matcher":
+        return cls((key, collection[key]) for key in collection)
+
+    def _get_query(self, text: str) -> List[Tuple[str, int, float]]:
+        """Returns the terms of provided text known to the vocabulary, along with their
+        columns and normalized TF-IDF weights.
+        """
+        query = []
+        for term, count in Counter(tokenize(text)).items():
+            col = self.vocabulary.get(term)
+            if col is not None:
+                query.append((term, col, (1 + math.log(count)) * float(self.idf[col])))
+
+        norm = math.sqrt(sum(weight ** 2 for _, _, weight in query)) or 1.0
+        return [(term, col, weight / norm) for term, col, weight in query]
+
+    def _score(self, query: List[Tuple[str, int, float]]) -> Any:
+        if not query:
+            return np.zeros(len(self.keys))
+
+        rows, weights = [], []
+        for _, col, weight in query:
+            start, end = self.indptr[col], self.indptr[col + 1]
+            rows.append(self.indices[start:end])
+            weights.append(self.data[start:end] * weight)
+        return np.bincount(
+            np.concatenate(rows), weights=np.concatenate(weights), minlength=len(self.keys)
+        )
+
+    def score(self, text: str) -> Any:
+        """Returns the similarity of every rezume to provided text as a NumPy array."""
+        return self._score(self._get_query(text))
+
+    def top(self, text: str, k: int = 10) -> List[Match]:
+        """Returns the `k` rezumes most similar to provided text, along with the terms
+        of the text they hold. Rezumes holding none of the terms are never returned.
+        """
+        if k <= 0:
+            return []
+
+        query = self._get_query(text)
+        scores = self._score(query)
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > k:
+            # partial selection of the k best is linear in the number of candidates
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # rank by descending score, ties by insertion order
+        candidates = candidates[np.lexsort((candidates, -scores[candidates]))]
+
+        matched: Dict[int, List[str]] = {int(row): [] for row in candidates}
+        for term, col, _ in query:
+            rows = self.indices[self.indptr[col] : self.indptr[col + 1]]
+            positions = np.searchsorted(rows, candidates)
+            found = positions < len(rows)
+            found[found] = rows[positions[found]] == candidates[found]
+            for row in candidates[found]:
+                matched[int(row)].append(term)
+
+        return [
+            Match(self.keys[row], float(scores[row]), tuple(sorted(matched[row])))
+            for row in map(int, candidates)
+        ]
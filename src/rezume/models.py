@@ -1,11 +1,109 @@
+from collections import OrderedDict
 from datetime import date
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr, HttpUrl
+from pydantic import AnyUrl, BaseConfig, BaseModel, EmailStr, HttpUrl
+from pydantic.fields import ModelField
+from pydantic.validators import str_validator
+
+
+class ValidationMemo:
+    """Represents a bounded LRU memo of validated values with hit and miss counters.
+
+    Values failing validation raise and are never memoized.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._values: "OrderedDict[Any, Any]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._values)
+
+    def get(self, key: Any, validate: Callable[[], Any]) -> Any:
+        """Returns the memoized value for key, calling `validate` on a miss."""
+        try:
+            value = self._values[key]
+            self._values.move_to_end(key)
+            self.hits += 1
+            return value
+        except KeyError:
+            pass
+
+        self.misses += 1
+        value = validate()
+        self._values[key] = value
+        if len(self._values) > self.maxsize:
+            self._values.popitem(last=False)
+        return value
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._values),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self) -> None:
+        self._values.clear()
+        self.hits = self.misses = 0
+
+
+# memos for values repeated across documents in bulk loads, e.g. company websites
+EMAIL_MEMO = ValidationMemo()
+URL_MEMO = ValidationMemo()
+
+
+def get_validation_memo_info() -> Dict[str, Dict[str, int]]:
+    """Returns hit and miss counters for the email and URL validation memos."""
+    return {"email": EMAIL_MEMO.info(), "url": URL_MEMO.info()}
+
+
+def clear_validation_memos() -> None:
+    EMAIL_MEMO.clear()
+    URL_MEMO.clear()
+
+
+class CachedEmailStr(EmailStr):
+    """Represents an email address whose validation is memoized."""
+
+    @classmethod
+    def __get_validators__(cls):
+        yield str_validator
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        return EMAIL_MEMO.get(value, lambda: EmailStr.validate(value))
+
+
+class CachedHttpUrl(HttpUrl):
+    """Represents an HTTP URL whose validation is memoized.
+
+    Memoized values are keyed by the URL only as all models share the same config
+    and URL fields have no constraints of their own.
+    """
+
+    @classmethod
+    def validate(cls, value: Any, field: ModelField, config: BaseConfig) -> AnyUrl:
+        if value.__class__ == cls or not isinstance(value, str):
+            return super().validate(value, field, config)
+
+        def validate() -> AnyUrl:
+            return super(CachedHttpUrl, cls).validate(value, field, config)
+
+        return URL_MEMO.get(value, validate)
 
 
 class Model(BaseModel):
     class Config:
+        # items are shared by sections, their cached values and clones, hence they are
+        # swapped for updated copies (e.g. ``model.copy(update=...)``) rather than changed
+        allow_mutation = False
+
         @classmethod
         def alias_generator(cls, value: str) -> str:
             [word, *words] = value.split("_")
@@ -45,7 +143,7 @@ class Profile(Model):
 
     network: str
     username: str
-    url: Optional[HttpUrl]
+    url: Optional[CachedHttpUrl]
 
 
 class PersonalInfo(Model):
@@ -53,12 +151,12 @@ class PersonalInfo(Model):
 
     name: str
     label: str
-    email: EmailStr
+    email: CachedEmailStr
     location: Location
     phone: Optional[str]
     picture: Optional[str]
     summary: Optional[str]
-    website: Optional[HttpUrl]
+    website: Optional[CachedHttpUrl]
     profiles: List[Profile]
 
 
@@ -88,7 +186,7 @@ class Experience(DatedEntry):
 
     position: str
     summary: Optional[str]
-    website: Optional[HttpUrl]
+    website: Optional[CachedHttpUrl]
     highlights: Optional[List[str]]
 
 
@@ -141,7 +239,7 @@ class Publication(Model):
     publisher: str
     release_date: date
     summary: Optional[str]
-    website: Optional[HttpUrl]
+    website: Optional[CachedHttpUrl]
 
 
 # =============================================================================
@@ -0,0 +1,257 @@
+"""Application of JSON Patch (RFC 6902) operations to a loaded rezume.
+
+Paths point into the data dumped for a rezume (see :meth:`Rezume.dump_data`), section
+items being at their positions in the dumped order, e.g. ``/work/0/highlights/-``,
+``/basics/profiles/1/url`` or ``/basics/label``. As within a JSON document, positions
+hold for the whole patch: items don't move as their dates change till the patch is
+applied, hence patches from :meth:`rezume.diff.RezumeDiff.to_json_patch` apply as is.
+
+Rather than dumping and loading the whole rezume, only the items touched by operations
+are dumped, patched and validated again, then swapped for the former items within their
+sections. Every operation is checked and every touched item validated before the
+rezume is changed, so a failing patch leaves it unchanged.
+"""
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Set, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from .base import RezumeError
+from .models import PersonalInfo, Profile
+from .models import Rezume as RezumeModel
+from .records import Record, to_record
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Rezume
+
+OPERATIONS = ("add", "remove", "replace", "move", "copy", "test")
+
+
+def parse_pointer(pointer: str) -> List[str]:
+    """Returns the unescaped reference tokens of a JSON Pointer (RFC 6901)."""
+    if not isinstance(pointer, str) or (pointer and not pointer.startswith("/")):
+        raise RezumeError(f"Invalid patch path: {pointer}")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer.split("/")[1:]]
+
+
+def get_index(container: list, token: str, path: str, adding: bool = False) -> int:
+    if adding and token == "-":
+        return len(container)
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise RezumeError(f"Invalid patch path: {path}")
+
+    index = int(token)
+    if index > len(container) or (index == len(container) and not adding):
+        raise RezumeError(f"Patch path not found: {path}")
+    return index
+
+
+class _Document:
+    """Represents the parts of a rezume's dumped data touched by a patch.
+
+    Sections (and profiles) are held as lists of their items in dumped order, holding
+    loaded items till they get changed and are replaced by their dumped data.
+    """
+
+    def __init__(self, rezume: "Rezume"):
+        self.rezume = rezume
+        self.roots: Dict[str, Any] = {}
+        self.changed: Set[str] = set()
+
+    def dump(self, value: Any) -> Any:
+        if isinstance(value, (BaseModel, Record)):
+            return self.rezume._sanitize(value, exclude_none=True)
+        elif isinstance(value, list):
+            return list(map(self.dump, value))
+        return value
+
+    def resolve(self, path: str) -> Tuple[str, List[str]]:
+        """Returns the name of the section (or basics) and the tokens within it."""
+        tokens = parse_pointer(path)
+        if tokens[:2] == ["basics", "profiles"]:
+            return "profiles", tokens[2:]
+        elif tokens and (tokens[0] == "basics" or tokens[0] in self.rezume.NAMED_SECTIONS):
+            return tokens[0], tokens[1:]
+        raise RezumeError(f"Invalid patch path: {path}")
+
+    def get_root(self, name: str) -> Any:
+        if name not in self.roots:
+            rezume = self.rezume
+            if name == "basics":
+                fields = ((f, getattr(rezume, f)) for f in rezume.FIELDS)
+                self.roots[name] = {f: self.dump(value) for f, value in fields if value}
+            elif name == "profiles":
+                self.roots[name] = list(rezume.profiles)
+            else:
+                self.roots[name] = list(rezume[name])
+        return self.roots[name]
+
+    def get(self, path: str) -> Any:
+        name, tokens = self.resolve(path)
+        if name == "basics" and not tokens:
+            return {**self.get_root(name), "profiles": self.get("/basics/profiles")}
+
+        value = self.get_root(name)
+        for token in tokens:
+            if isinstance(value, (BaseModel, Record)):
+                value = self.dump(value)
+            if isinstance(value, list):
+                value = value[get_index(value, token, path)]
+            elif isinstance(value, dict) and token in value:
+                value = value[token]
+            else:
+                raise RezumeError(f"Patch path not found: {path}")
+        return self.dump(value)
+
+    def set(self, op: str, path: str, value: Any = None) -> None:
+        """Adds, replaces or removes the value at provided path."""
+        name, tokens = self.resolve(path)
+        if not tokens:
+            self._set_root(op, name, path, value)
+            return
+
+        self.changed.add(name)
+        parent = self.get_root(name)
+        for token in tokens[:-1]:
+            if isinstance(parent, list):
+                index = get_index(parent, token, path)
+                if isinstance(parent[index], (BaseModel, Record)):
+                    # a loaded item gets swapped for its data once changed
+                    parent[index] = self.dump(parent[index])
+                parent = parent[index]
+            elif isinstance(parent, dict) and token in parent:
+                parent = parent[token]
+            else:
+                raise RezumeError(f"Patch path not found: {path}")
+
+        token = tokens[-1]
+        if isinstance(parent, list):
+            index = get_index(parent, token, path, adding=op == "add")
+            if op == "add":
+                parent.insert(index, value)
+            elif op == "replace":
+                parent[index] = value
+            else:
+                del parent[index]
+        elif isinstance(parent, dict):
+            if op != "add" and token not in parent:
+                raise RezumeError(f"Patch path not found: {path}")
+            if op == "remove":
+                del parent[token]
+            else:
+                parent[token] = value
+        else:
+            raise RezumeError(f"Patch path not found: {path}")
+
+    def _set_root(self, op: str, name: str, path: str, value: Any) -> None:
+        if name == "basics":
+            if op == "remove" or not isinstance(value, dict):
+                raise RezumeError(f"Invalid patch value: {path}")
+            value = dict(value)
+            self._set_root(op, "profiles", "/basics/profiles", value.pop("profiles", []))
+        elif op == "remove":
+            value = []
+        elif not isinstance(value, list):
+            raise RezumeError(f"Invalid patch value: {path}")
+
+        self.roots[name] = value
+        self.changed.add(name)
+
+    def apply(self, operation: dict) -> None:
+        op, path = operation.get("op"), operation.get("path")
+        if op not in OPERATIONS:
+            raise RezumeError(f"Invalid patch operation: {op}")
+        if not isinstance(path, str):
+            raise RezumeError(f"Invalid patch path: {path}")
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise RezumeError(f"Invalid patch operation, missing value: {path}")
+
+        if op == "test":
+            if self.get(path) != operation["value"]:
+                raise RezumeError(f"Patch test failed: {path}")
+        elif op in ("move", "copy"):
+            source = operation.get("from")
+            if not isinstance(source, str):
+                raise RezumeError(f"Invalid patch path: {source}")
+            if op == "move" and f"{path}/".startswith(f"{source}/"):
+                raise RezumeError(f"Invalid patch operation, moved into itself: {path}")
+            value = self.get(source)
+            if op == "move":
+                self.set("remove", source)
+            self.set("add", path, value)
+        else:
+            self.set(op, path, deepcopy(operation.get("value")))
+
+    def validate(self) -> Dict[str, Any]:
+        """Returns the changed basics and sections with their changed items validated,
+        loaded items being kept as is.
+        """
+        results: Dict[str, Any] = {}
+        try:
+            for name in self.changed:
+                value = self.roots[name]
+                if name == "basics":
+                    results[name] = PersonalInfo(**value, profiles=[])
+                    continue
+
+                if name == "profiles":
+                    model = Profile
+                else:
+                    field = RezumeModel.__fields__[name]
+                    if field.required and not value:
+                        raise RezumeError(f"error: section is required: {name}")
+                    model = field.type_
+                results[name] = [
+                    item if isinstance(item, (BaseModel, Record)) else model.parse_obj(item)
+                    for item in value
+                ]
+                self._check_keys(name, results[name])
+        except ValidationError as ex:
+            raise RezumeError(f"error: {ex}")
+        except TypeError as ex:
+            raise RezumeError(f"Invalid patch value: {ex}")
+        return results
+
+    def _check_keys(self, name: str, items: List[Any]) -> None:
+        """Raises if items of a section share a key, as the section would keep only one."""
+        section = self.rezume.profiles if name == "profiles" else self.rezume[name]
+        keys: Set[Any] = set()
+        for item in items:
+            key = section._generate_key(item)
+            if key in keys:
+                raise RezumeError(f"Invalid patch, duplicate item in {name}: {key}")
+            keys.add(key)
+
+
+def apply_patch(rezume: "Rezume", operations: Iterable[dict]) -> "Rezume":
+    """Applies JSON Patch operations to a rezume in place, see :mod:`rezume.patch`."""
+    document = _Document(rezume)
+    for operation in operations:
+        if not isinstance(operation, dict):
+            raise RezumeError(f"Invalid patch operation: {operation}")
+        document.apply(operation)
+
+    interner = rezume._interner
+    for name, value in document.validate().items():
+        if name == "basics":
+            if interner is not None:
+                interner.intern_model(value)
+            rezume._set_basics(value)
+            continue
+
+        section = rezume.profiles if name == "profiles" else rezume[name]
+        # items still held by the section are kept as is, others were patched
+        loaded = {id(item) for item in section}
+        kept = {id(item) for item in value} & loaded
+        for item in list(section):
+            if id(item) not in kept:
+                section.discard(item)
+
+        for item in value:
+            if id(item) in loaded:
+                continue
+            if interner is not None:
+                interner.intern_model(item)
+            section.add(to_record(item) if rezume._records and name != "profiles" else item)
+
+    return rezume
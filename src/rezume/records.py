@@ -0,0 +1,142 @@
+"""Compact, read-only records for section items.
+
+Records are generated from the model definitions and hold the same fields as the
+model they are generated from within ``__slots__``, without a per-instance
+``__dict__`` or ``__fields_set__``, hence they take a fraction of the memory and
+construction time of models. They suit read-heavy workloads over validated data.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, parse_obj_as, validate_model
+
+
+class Record:
+    """Represents the base class for read-only records generated from models."""
+
+    __slots__ = ()
+
+    _model: Type[BaseModel]
+    _fields: Tuple[str, ...] = ()
+    _aliases: Tuple[str, ...] = ()
+
+    def __init__(self, **values: Any):
+        model_fields = self._model.__fields__
+        for name in self._fields:
+            value = values[name] if name in values else model_fields[name].get_default()
+            if isinstance(value, list):
+                # lists become tuples to keep records immutable
+                value = tuple(value)
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash(self._values())
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        return (_restore, (self._model, dict(zip(self._fields, self._values()))))
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def dict(self, by_alias: bool = False, exclude_none: bool = False) -> Dict[str, Any]:
+        """Returns the record fields as a dict, like :meth:`pydantic.BaseModel.dict`."""
+        keys = self._aliases if by_alias else self._fields
+        data = {}
+        for key, name in zip(keys, self._fields):
+            value = getattr(self, name)
+            if value is None and exclude_none:
+                continue
+            if isinstance(value, tuple):
+                value = list(value)
+            data[key] = value
+        return data
+
+    def to_model(self) -> BaseModel:
+        """Returns the model for the record, without validating it again."""
+        return self._model.construct(**self.dict())
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "Record":
+        return cls._from_values(model.__dict__)
+
+    @classmethod
+    def _from_values(cls, values: Dict[str, Any]) -> "Record":
+        """Returns the record holding provided values of every field, as validated,
+        skipping the lookup of defaults.
+        """
+        record = object.__new__(cls)
+        for name in cls._fields:
+            value = values[name]
+            object.__setattr__(record, name, tuple(value) if isinstance(value, list) else value)
+        return record
+
+
+_record_types: Dict[Type[BaseModel], Type[Record]] = {}
+
+
+def get_record_type(model: Type[BaseModel]) -> Type[Record]:
+    """Returns the record type generated for provided model type."""
+    if model not in _record_types:
+        fields = tuple(model.__fields__)
+        namespace = {
+            "__slots__": fields,
+            "__doc__": f"Represents a read-only record of {model.__name__} data.",
+            "_model": model,
+            "_fields": fields,
+            "_aliases": tuple(field.alias for field in model.__fields__.values()),
+        }
+        _record_types[model] = type(f"{model.__name__}Record", (Record,), namespace)
+    return _record_types[model]
+
+
+def to_record(model: BaseModel) -> Record:
+    """Returns a read-only record holding the data of provided model."""
+    return get_record_type(type(model)).from_model(model)
+
+
+def parse_records(
+    model: Type[BaseModel], items: Any, intern: Optional[Callable[[Any], Any]] = None
+) -> List[Record]:
+    """Returns read-only records of provided items validated against the model, like
+    ``parse_obj_as(List[model], items)`` yet without creating model instances.
+
+    :param intern: function returning the value to hold in place of a field value
+    """
+    record_type = get_record_type(model)
+    records = []
+    if isinstance(items, list):
+        for item in items:
+            if not isinstance(item, dict):
+                break
+            values, _, error = validate_model(model, item)
+            if error is not None:
+                break
+            if intern is not None:
+                values = {name: intern(value) for name, value in values.items()}
+            records.append(record_type._from_values(values))
+        else:
+            return records
+
+    # left to pydantic, which raises the same errors as validating models would
+    models = parse_obj_as(List[model], items)  # type: ignore
+    if intern is not None:
+        models = [intern(item) for item in models]
+    return [to_record(item) for item in models]
+
+
+def _restore(model: Type[BaseModel], values: Dict[str, Any]) -> Record:
+    return get_record_type(model)(**values)
@@ -0,0 +1,115 @@
+"""Structural validation of rezume data compiled from the JSON Schema of the models.
+
+The compiled validator checks the shape of a document (mappings, lists, scalars and
+required keys) which is cheap compared to full model validation, allowing malformed
+documents to be rejected before the costly email, URL and date checks run. It only
+rejects what model validation would reject too, hence documents passing it must
+still be validated against the models.
+"""
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
+
+from .base import RezumeError
+
+Validator = Callable[[Any, Tuple], None]
+
+SEQUENCE_TYPES = (list, tuple, set, frozenset)
+CONTAINER_TYPES = (dict, list, tuple, set, frozenset)
+
+
+def _fail(loc: Tuple, message: str):
+    location = " -> ".join(map(str, loc)) or "__root__"
+    raise RezumeError(f"error: {location}\n  {message}")
+
+
+def _accept(value: Any, loc: Tuple) -> None:
+    pass
+
+
+def _compile(schema: dict, definitions: dict, compiled: dict) -> Validator:
+    if "$ref" in schema:
+        name = schema["$ref"].rsplit("/", 1)[-1]
+        if name not in compiled:
+            # register a forwarding validator first to support recursive definitions
+            compiled[name] = _accept
+            validator = _compile(definitions[name], definitions, compiled)
+            compiled[name] = validator
+        return lambda value, loc: compiled[name](value, loc)
+
+    if "allOf" in schema:
+        validators = [_compile(sub, definitions, compiled) for sub in schema["allOf"]]
+
+        def validate_all(value, loc):
+            for validator in validators:
+                validator(value, loc)
+
+        return validate_all
+
+    kind = schema.get("type")
+    if kind == "object":
+        return _compile_object(schema, definitions, compiled)
+    elif kind == "array":
+        items = _compile(schema.get("items", {}), definitions, compiled)
+
+        def validate_array(value, loc):
+            if not isinstance(value, SEQUENCE_TYPES):
+                _fail(loc, "value is not a valid list")
+            for index, item in enumerate(value):
+                items(item, loc + (index,))
+
+        return validate_array
+    elif kind == "string":
+
+        def validate_string(value, loc):
+            if isinstance(value, CONTAINER_TYPES):
+                _fail(loc, "str type expected")
+
+        return validate_string
+
+    return _accept
+
+
+def _compile_object(schema: dict, definitions: dict, compiled: dict) -> Validator:
+    required: List[str] = schema.get("required", [])
+    properties = [
+        (key, key in required, _compile(prop, definitions, compiled))
+        for key, prop in schema.get("properties", {}).items()
+    ]
+
+    def validate_object(value, loc):
+        if not isinstance(value, dict):
+            if isinstance(value, list):
+                # models accept sequences of key/value pairs, defer to them
+                return
+            _fail(loc, "value is not a valid dict")
+
+        for key, is_required, validator in properties:
+            field = value.get(key)
+            if field is None:
+                if is_required:
+                    message = "none is not an allowed value" if key in value else ""
+                    _fail(loc + (key,), message or "field required")
+                continue
+            validator(field, loc + (key,))
+
+    return validate_object
+
+
+def compile_schema(schema: dict) -> Callable[[Any], None]:
+    """Compiles a JSON Schema, as generated for pydantic models, into a validator which
+    raises :class:`RezumeError` for documents not matching the schema's structure.
+    """
+    validator = _compile(schema, schema.get("definitions", {}), {})
+
+    def validate(value: Any) -> None:
+        validator(value, ())
+
+    return validate
+
+
+@lru_cache(maxsize=None)
+def get_validator() -> Callable[[Any], None]:
+    """Returns the structural validator for rezume documents."""
+    from .models import Rezume
+
+    return compile_schema(Rezume.schema(by_alias=True))
@@ -0,0 +1,270 @@
+"""Full-text search over the free text of rezumes.
+
+Rezume files are indexed into an inverted index mapping every term to the rezumes
+holding it, along with its frequency within each field and its positions, which is
+persisted as JSON and updated incrementally: only files whose content changed since
+they were indexed are indexed again.
+
+Results are ranked with BM25, field boosts weighting term frequencies and lengths of
+fields (BM25F). Quoted phrases in queries only match rezumes holding the words of the
+phrase next to one another within the same text.
+"""
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .base import RezumeError
+
+INDEX_VERSION = 1
+
+#: fields holding searchable text, per section
+SEARCH_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "basics": ("summary",),
+    "work": ("position", "summary", "highlights"),
+    "volunteer": ("position", "summary", "highlights"),
+    "awards": ("title", "summary"),
+    "publications": ("name", "summary"),
+    "references": ("reference",),
+}
+
+#: weights for term frequencies per `section.field`, fields not listed weigh 1
+DEFAULT_BOOSTS: Dict[str, float] = {
+    "basics.summary": 1.5,
+    "work.position": 2.0,
+    "volunteer.position": 1.5,
+    "awards.title": 2.0,
+    "publications.name": 2.0,
+}
+
+TOKEN_PATTERN = re.compile(r"\w+")
+QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.casefold() for token in TOKEN_PATTERN.findall(text)]
+
+
+def get_texts(rezume) -> Iterable[Tuple[str, str]]:
+    """Yields the searchable texts of a rezume along with the fields holding them."""
+    for section_name, fields in SEARCH_FIELDS.items():
+        items = [rezume] if section_name == "basics" else rezume[section_name]
+        for item in items:
+            for field in fields:
+                value = getattr(item, field)
+                for text in [value] if isinstance(value, str) else value or ():
+                    yield f"{section_name}.{field}", text
+
+
+class SearchHit(NamedTuple):
+    """Represents a rezume matching a search query."""
+
+    path: str
+    score: float
+
+
+class SearchIndex:
+    """Represents a persistent inverted index over rezume files, see :mod:`rezume.search`.
+
+    Postings map every term to the documents (rezume file paths) holding it, and for
+    each document to the term frequency per field and the term positions. Positions
+    run across all texts of a document with a gap between texts, so that phrases never
+    match across texts.
+    """
+
+    k1 = 1.2
+    b = 0.75
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else None
+        #: maps paths to the content digest and field lengths of indexed documents
+        self._docs: Dict[str, dict] = {}
+        self._postings: Dict[str, Dict[str, list]] = {}
+        self._averages: Dict[tuple, float] = {}
+
+        if self.path and self.path.exists():
+            self._read(self.path)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, path: Union[str, Path]) -> bool:
+        return str(Path(path).resolve()) in self._docs
+
+    def _read(self, path: Path) -> None:
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as ex:
+            raise RezumeError(f"Invalid search index: {path}: {ex}")
+
+        # indexes written by other versions are rebuilt as files get indexed again
+        fields = json.loads(json.dumps(SEARCH_FIELDS))
+        if data.get("version") == INDEX_VERSION and data.get("fields") == fields:
+            self._docs = data["docs"]
+            self._postings = data["postings"]
+
+    def save(self, path: Optional[Union[str, Path]] = None) -> None:
+        """Writes the index atomically to provided path or the path it was read from."""
+        path = Path(path) if path else self.path
+        if path is None:
+            raise RezumeError("No path provided for the search index")
+
+        data = {
+            "version": INDEX_VERSION,
+            "fields": SEARCH_FIELDS,
+            "docs": self._docs,
+            "postings": self._postings,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        with os.fdopen(fd, "w") as fp:
+            json.dump(data, fp, separators=(",", ":"))
+        os.replace(tmp_path, str(path))
+
+    def add(self, doc_id: str, texts: Iterable[Tuple[str, str]], digest: str = "") -> None:
+        """Indexes a document from its texts and the fields holding them, replacing any
+        document previously indexed under the same id.
+        """
+        if doc_id in self._docs:
+            self.remove(doc_id)
+
+        lengths: Dict[str, int] = {}
+        # per term, the field frequencies and positions within the document
+        entries: Dict[str, list] = {}
+        position = 0
+        for field, text in texts:
+            tokens = tokenize(text)
+            lengths[field] = lengths.get(field, 0) + len(tokens)
+            for token in tokens:
+                frequencies, positions = entries.setdefault(token, [{}, []])
+                frequencies[field] = frequencies.get(field, 0) + 1
+                positions.append(position)
+                position += 1
+            # leave a gap so that phrases don't match across texts
+            position += 1
+
+        self._averages.clear()
+        for term, entry in entries.items():
+            self._postings.setdefault(term, {})[doc_id] = entry
+        self._docs[doc_id] = {"digest": digest, "lengths": lengths, "terms": list(entries)}
+
+    def remove(self, doc_id: str) -> None:
+        """Removes a document from the index."""
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return
+
+        self._averages.clear()
+        for term in doc["terms"]:
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+
+    def update(self, filepaths: Iterable[Union[str, Path]]) -> Dict[str, str]:
+        """Indexes rezume files which are new or changed since they were indexed and
+        returns the errors for files which failed to load, keyed by path.
+        """
+        from .core import Rezume
+
+        sections = [name for name in SEARCH_FIELDS if name != "basics"]
+        errors = {}
+        for filepath in filepaths:
+            filepath = Path(filepath).resolve()
+            doc_id = str(filepath)
+            try:
+                content = filepath.read_bytes()
+            except OSError as ex:
+                errors[doc_id] = str(ex)
+                continue
+
+            digest = hashlib.sha256(content).hexdigest()
+            if self._docs.get(doc_id, {}).get("digest") == digest:
+                continue
+
+            try:
+                rezume = Rezume()._load_content(content, filepath, sections=sections)
+            except RezumeError as ex:
+                errors[doc_id] = str(ex)
+                self.remove(doc_id)
+                continue
+            self.add(doc_id, get_texts(rezume), digest)
+        return errors
+
+    def prune(self) -> List[str]:
+        """Removes documents whose files no longer exist and returns their paths."""
+        missing = [doc_id for doc_id in self._docs if not os.path.exists(doc_id)]
+        for doc_id in missing:
+            self.remove(doc_id)
+        return missing
+
+    def _matches_phrase(self, doc_id: str, terms: List[str]) -> bool:
+        starts = set(self._postings[terms[0]][doc_id][1])
+        for offset, term in enumerate(terms[1:], 1):
+            positions = set(self._postings[term][doc_id][1])
+            starts = {start for start in starts if start + offset in positions}
+            if not starts:
+                return False
+        return True
+
+    def search(
+        self, query: str, limit: int = 10, boosts: Optional[Dict[str, float]] = None
+    ) -> List[SearchHit]:
+        """Returns the best matches for a query, ranked by BM25.
+
+        Words in the query are optional, though documents holding more of them (and in
+        boosted fields) rank higher, while quoted phrases are required.
+        """
+        boosts = DEFAULT_BOOSTS if boosts is None else boosts
+        terms: List[str] = []
+        phrases: List[List[str]] = []
+        for phrase, word in QUERY_PATTERN.findall(query):
+            tokens = tokenize(phrase or word)
+            terms.extend(tokens)
+            if phrase and tokens:
+                phrases.append(tokens)
+
+        candidates: Optional[Set[str]] = None
+        for phrase_terms in phrases:
+            if any(term not in self._postings for term in phrase_terms):
+                return []
+            docs = set.intersection(*(set(self._postings[t]) for t in phrase_terms))
+            if len(phrase_terms) > 1:
+                docs = {doc for doc in docs if self._matches_phrase(doc, phrase_terms)}
+            candidates = docs if candidates is None else candidates & docs
+
+        if not self._docs or candidates == set():
+            return []
+
+        def weigh(counts: Dict[str, int]) -> float:
+            return sum(boosts.get(field, 1.0) * count for field, count in counts.items())
+
+        # the average document length only changes with the index or boosts
+        boosts_key = tuple(sorted(boosts.items()))
+        if boosts_key not in self._averages:
+            total = sum(weigh(doc["lengths"]) for doc in self._docs.values())
+            self._averages[boosts_key] = total / len(self._docs) or 1.0
+        average = self._averages[boosts_key]
+
+        scores: Dict[str, float] = {}
+        for term in set(terms):
+            postings = self._postings.get(term, {})
+            df = len(postings)
+            idf = math.log(1 + (len(self._docs) - df + 0.5) / (df + 0.5))
+            for doc_id, (frequencies, _) in postings.items():
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                tf = weigh(frequencies)
+                length = weigh(self._docs[doc_id]["lengths"])
+                norm = self.k1 * (1 - self.b + self.b * length / average)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (
+                    tf + norm
+                )
+
+        ranked = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [SearchHit(doc_id, score) for doc_id, score in ranked]
@@ -1,5 +1,7 @@
+import heapq
 from collections.abc import MutableSet
-from typing import Any, Iterable, Optional
+from copy import copy
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, TypeVar
 
 from pydantic import EmailStr, HttpUrl
 
@@ -17,20 +19,29 @@ from .models import (
     Reference,
 )
 
+S = TypeVar("S", bound="Section")
+
 
 class Section(MutableSet):
-    """Represents a section within a Resume."""
+    """Represents a section within a Resume.
+
+    Values derived from the items, such as their sorted order, are cached till items
+    get added or discarded; items are immutable, hence swapped rather than changed.
+    """
+
+    #: whether the items are shared with copies of the section, see :meth:`_copy`
+    _shared = False
 
     def __init__(self, items: Iterable[Any] = None):
         self._items = {self._generate_key(i): i for i in items or []}
+        self._cache: Dict[Any, Any] = {}
 
     def __contains__(self, item: Any) -> bool:
         key = self._generate_key(item)
         return key in self._items
 
     def __iter__(self):
-        items = sorted(self._items.values(), key=self._sorter)
-        return iter(items)
+        return iter(self._get_sorted())
 
     def __len__(self):
         return len(self._items)
@@ -41,15 +52,58 @@ class Section(MutableSet):
     def _sorter(self, item):
         return self._generate_key(item)
 
+    def _get_cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Returns the cached value derived from the items, computing it if missing."""
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _get_sorted(self, reverse: bool = False) -> list:
+        """Returns the items in sorted order, which is only sorted again once changed.
+
+        The returned list is shared and mustn't be modified.
+        """
+        return self._get_cached(
+            ("sorted", reverse),
+            lambda: sorted(self._items.values(), key=self._sorter, reverse=reverse),
+        )
+
+    def _invalidate(self):
+        """Drops the values derived from the items."""
+        # replaced rather than cleared as the cache may be shared with copies
+        self._cache = {}
+
+    def _copy(self: S) -> S:
+        """Returns a copy of the section sharing its items (and cached values) till
+        either section changes them, which takes constant time.
+        """
+        section = copy(self)
+        self._shared = section._shared = True
+        return section
+
+    def _unshare(self):
+        if self._shared:
+            self._items = dict(self._items)
+            self._shared = False
+
     def add(self, item: Any):
         key = self._generate_key(item)
         if key not in self._items:
+            self._unshare()
             self._items[key] = item
+            self._invalidate()
 
     def discard(self, item: Any):
         key = self._generate_key(item)
         if key in self._items:
+            self._unshare()
             del self._items[key]
+            self._invalidate()
+
+    def clear(self):
+        self._items = {}
+        self._shared = False
+        self._invalidate()
 
 
 class NamedSection(Section):
@@ -70,8 +124,20 @@ class TimelinedSection(NamedSection):
         self.reverse = reverse
 
     def __iter__(self):
-        items = sorted(self._items.values(), key=self._sorter, reverse=self.reverse)
-        return iter(items)
+        return iter(self._get_sorted(self.reverse))
+
+    def top(self, n: int, reverse: Optional[bool] = None) -> list:
+        """Returns the first `n` items in timeline order, the latest first unless
+        `reverse` is unset, selecting them rather than sorting every item.
+        """
+        reverse = self.reverse if reverse is None else reverse
+        items = self._cache.get(("sorted", reverse))
+        if items is not None:
+            return items[:n]
+
+        # same order as sorting, ties included, in O(len * log(n))
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(n, self._items.values(), key=self._sorter)
 
 
 class NamedKeywordsSet(NamedSection):
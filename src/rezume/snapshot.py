@@ -0,0 +1,183 @@
+"""Compact binary snapshots of validated rezumes.
+
+A snapshot holds the data of a rezume which has already been validated, hence
+loading one reconstructs models without validating them again which is far faster
+than parsing and validating YAML. Snapshots are written with :mod:`marshal` and only
+contain plain data (no code or pickled objects) making them safe to share between
+worker processes; they have the layout below (all integers big-endian):
+
+* magic bytes ``RZSNAP``
+* format version (unsigned short)
+* marshal version used to encode the payload (unsigned byte)
+* flags (unsigned byte), see :data:`FLAG_COMPRESSED`
+* payload length (unsigned int)
+* payload CRC32 checksum (unsigned int)
+* payload, optionally zlib-compressed
+"""
+import marshal
+import struct
+import zlib
+from datetime import date
+from typing import TYPE_CHECKING, Any, Dict, Type
+
+from pydantic import BaseModel, HttpUrl
+
+from . import models
+from .base import RezumeError
+from .records import Record, get_record_type
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Rezume
+
+MAGIC = b"RZSNAP"
+FORMAT_VERSION = 1
+FLAG_COMPRESSED = 0x01
+
+HEADER = struct.Struct("!6sHBBII")
+
+# tags identifying encoded values which aren't plain marshal-able data
+TAG_DATE = "d"
+TAG_MODEL = "m"
+TAG_URL = "u"
+
+URL_PARTS = (
+    "scheme",
+    "user",
+    "password",
+    "host",
+    "tld",
+    "host_type",
+    "port",
+    "path",
+    "query",
+    "fragment",
+)
+
+# only these types are ever constructed from snapshot data
+MODEL_TYPES: Dict[str, Type[BaseModel]] = {
+    name: value
+    for name, value in vars(models).items()
+    if isinstance(value, type) and issubclass(value, models.Model)
+}
+URL_TYPES: Dict[str, Type[HttpUrl]] = {
+    "HttpUrl": HttpUrl,
+    "CachedHttpUrl": models.CachedHttpUrl,
+}
+
+
+def encode(value: Any) -> Any:
+    """Returns provided value as marshal-able data."""
+    if isinstance(value, BaseModel):
+        fields = {name: encode(field) for name, field in value.__dict__.items()}
+        return (TAG_MODEL, type(value).__name__, fields, sorted(value.__fields_set__))
+    elif isinstance(value, Record):
+        fields = {name: encode(getattr(value, name)) for name in value._fields}
+        return (TAG_MODEL, value._model.__name__, fields, sorted(fields))
+    elif isinstance(value, HttpUrl):
+        parts = {part: getattr(value, part) for part in URL_PARTS}
+        return (TAG_URL, type(value).__name__, str(value), parts)
+    elif isinstance(value, date):
+        return (TAG_DATE, value.toordinal())
+    elif isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+    elif isinstance(value, dict):
+        return {key: encode(item) for key, item in value.items()}
+    elif isinstance(value, str):
+        # drop str subclasses (e.g. EmailStr) which marshal can't serialize
+        return str(value)
+    return value
+
+
+def decode(value: Any) -> Any:
+    """Returns the value encoded by :func:`encode`, constructing models without
+    validation as snapshots only ever hold validated data.
+    """
+    if isinstance(value, tuple):
+        tag = value[0]
+        if tag == TAG_DATE:
+            return date.fromordinal(value[1])
+        elif tag == TAG_URL:
+            return URL_TYPES[value[1]](value[2], **value[3])
+        elif tag == TAG_MODEL:
+            model = MODEL_TYPES[value[1]]
+            fields = {name: decode(field) for name, field in value[2].items()}
+            return model.construct(_fields_set=set(value[3]), **fields)
+        raise ValueError(f"unknown tag: {tag}")
+    elif isinstance(value, list):
+        return [decode(item) for item in value]
+    elif isinstance(value, dict):
+        return {key: decode(item) for key, item in value.items()}
+    return value
+
+
+def decode_record(value: Any) -> Any:
+    """Returns the record for an encoded model, see :mod:`rezume.records`."""
+    if not (isinstance(value, tuple) and value[0] == TAG_MODEL):
+        return decode(value)
+
+    record_type = get_record_type(MODEL_TYPES[value[1]])
+    return record_type(**{name: decode(field) for name, field in value[2].items()})
+
+
+def dumps(rezume: "Rezume", compress: bool = True) -> bytes:
+    """Returns the snapshot of provided rezume."""
+    document = {
+        "fields": {field: encode(getattr(rezume, field)) for field in rezume.FIELDS},
+        "profiles": [encode(profile) for profile in rezume.profiles],
+        "sections": {
+            section.name: [encode(item) for item in section]
+            for section in rezume.sections
+            if section
+        },
+    }
+
+    payload = marshal.dumps(document)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= FLAG_COMPRESSED
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, marshal.version, flags, len(payload), zlib.crc32(payload)
+    )
+    return header + payload
+
+
+def loads(rezume: "Rezume", content: bytes, records: bool = False) -> "Rezume":
+    """Loads the snapshot content into provided rezume, loading section items as
+    read-only records if `records` is set.
+    """
+    try:
+        magic, version, marshal_version, flags, length, checksum = HEADER.unpack_from(
+            content
+        )
+    except struct.error:
+        raise RezumeError("Invalid snapshot: truncated header")
+
+    if magic != MAGIC:
+        raise RezumeError("Invalid snapshot: unrecognized format")
+    if version != FORMAT_VERSION or marshal_version > marshal.version:
+        raise RezumeError(f"Unsupported snapshot version: {version}")
+
+    payload = content[HEADER.size :]
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        raise RezumeError("Invalid snapshot: corrupted payload")
+
+    try:
+        if flags & FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+        document = marshal.loads(payload)
+
+        rezume.clear()
+        for field, value in document["fields"].items():
+            setattr(rezume, field, decode(value))
+        for profile in document["profiles"]:
+            rezume.profiles.add(decode(profile))
+        decode_item = decode_record if records else decode
+        for section_name, items in document["sections"].items():
+            for item in items:
+                rezume.add_item(section_name, decode_item(item))
+    except (zlib.error, EOFError, ValueError, TypeError, KeyError) as ex:
+        raise RezumeError(f"Invalid snapshot: {ex}")
+
+    return rezume
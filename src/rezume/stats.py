@@ -0,0 +1,149 @@
+"""Memory accounting for loaded rezumes.
+
+Rezumes are loaded under :mod:`tracemalloc` to find the bytes each one retains once
+loaded and the peak allocated while parsing and validating it. The retained objects
+are then walked to break the bytes down by what holds them:
+
+* a bucket per :class:`~rezume.sections.Section` subclass for the section objects and
+  their containers (e.g. ``ExperienceSet`` covers both ``work`` and ``volunteer``)
+* ``models`` for section item models (or records) and their non-string values
+* ``profiles`` for the profiles section including its models and strings
+* ``strings`` for string data outside profiles
+* ``rezume`` for the rezume object along with the raw data of sections not yet loaded
+
+Objects shared between rezumes (e.g. interned strings) are only counted once.
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple, Union
+
+from pydantic import BaseModel
+
+from .interning import Interner
+from .records import Record
+from .sections import ProfileSet, RezumeBase, Section
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .core import Rezume
+
+
+def _get_slots(cls: type) -> Tuple[str, ...]:
+    slots: List[str] = []
+    for klass in cls.__mro__:
+        names = klass.__dict__.get("__slots__", ())
+        slots.extend([names] if isinstance(names, str) else names)
+    return tuple(name for name in slots if name not in ("__dict__", "__weakref__"))
+
+
+def _get_children(value: Any) -> Iterable[Any]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield key
+            yield item
+        return
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        yield from value
+        return
+
+    if hasattr(value, "__dict__"):
+        yield value.__dict__
+    for name in _get_slots(type(value)):
+        if hasattr(value, name):
+            yield getattr(value, name)
+
+
+def get_memory_breakdown(rezumes: Iterable["Rezume"]) -> Dict[str, int]:
+    """Returns the bytes held by provided rezumes, bucketed by what holds them."""
+    totals: Dict[str, int] = {}
+    seen = set()
+    stack: List[Tuple[Any, str]] = [(rezume, "rezume") for rezume in rezumes]
+
+    while stack:
+        value, category = stack.pop()
+        if id(value) in seen or isinstance(value, (type, Interner)):
+            continue
+        seen.add(id(value))
+
+        if isinstance(value, ProfileSet):
+            category = "profiles"
+        elif category != "profiles":
+            if isinstance(value, str):
+                category = "strings"
+            elif isinstance(value, (BaseModel, Record)):
+                category = "models"
+            elif isinstance(value, Section) and not isinstance(value, RezumeBase):
+                category = type(value).__name__
+
+        totals[category] = totals.get(category, 0) + sys.getsizeof(value)
+        if type(value) is not str:
+            stack.extend((child, category) for child in _get_children(value))
+
+    return totals
+
+
+class MemoryReport:
+    """Represents the memory used by rezumes loaded by :func:`measure_memory`."""
+
+    def __init__(
+        self,
+        files: Dict[str, Tuple[int, int]],
+        breakdown: Dict[str, int],
+    ):
+        #: maps each file to the bytes retained by its rezume and the peak bytes
+        #: allocated while loading it
+        self.files = files
+        self.breakdown = breakdown
+
+    @property
+    def retained(self) -> int:
+        return sum(retained for retained, _ in self.files.values())
+
+    @property
+    def peak(self) -> int:
+        return max((peak for _, peak in self.files.values()), default=0)
+
+    def as_dict(self) -> dict:
+        return {
+            "retained": self.retained,
+            "peak": self.peak,
+            "breakdown": dict(sorted(self.breakdown.items())),
+            "files": {
+                path: {"retained": retained, "peak": peak}
+                for path, (retained, peak) in self.files.items()
+            },
+        }
+
+
+def measure_memory(
+    filepaths: Iterable[Union[str, Path]], **options: Any
+) -> Tuple[List["Rezume"], MemoryReport]:
+    """Loads provided rezume files under tracemalloc and reports the memory they use.
+
+    Options are passed on to :meth:`Rezume.load`, making it possible to compare the
+    effect of loading options (e.g. `records` or a shared `interner`) on memory. Files
+    are loaded one after the other and kept in memory, hence the bytes retained for a
+    file exclude values it shares with previously loaded files.
+    """
+    from .core import Rezume
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    rezumes: List[Rezume] = []
+    files: Dict[str, Tuple[int, int]] = {}
+    try:
+        for filepath in filepaths:
+            gc.collect()
+            tracemalloc.clear_traces()
+            rezume = Rezume().load(filepath, **options)
+            gc.collect()
+            files[str(filepath)] = tracemalloc.get_traced_memory()
+            rezumes.append(rezume)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+    return rezumes, MemoryReport(files, get_memory_breakdown(rezumes))
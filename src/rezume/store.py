@@ -0,0 +1,405 @@
+"""SQLite storage for large archives of rezumes.
+
+:class:`RezumeStore` maps rezumes into normalized tables generated from the models:
+``basics`` (with the nested location flattened into ``location_*`` columns),
+``profiles`` and a table per named section, rows of the same rezume being linked by
+``rezume_id`` and ordered by ``seq``. List fields (e.g. highlights) are held as JSON
+and dates as ISO strings, which sort chronologically. Dates, names and the values of
+the :class:`~rezume.collection.RezumeCollection` indexes (held by the ``terms``
+table, e.g. skill keywords) are indexed, so that lookups run within SQLite rather
+than loading rezumes.
+
+Rezumes are ingested in batches with ``executemany`` within a transaction per batch.
+The database is opened in WAL mode, so that readers don't block the writer, with a
+connection per thread as SQLite connections can't be shared across threads.
+"""
+import json
+import sqlite3
+import threading
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_SINGLETON
+
+from .base import RezumeError
+from .collection import RezumeCollection, normalize
+from .core import Rezume
+from .intervals import TIMELINED_SECTIONS
+from .models import PersonalInfo, Profile
+from .models import Rezume as RezumeModel
+from .sections import Section
+
+#: columns indexed along with date columns, per table
+INDEXED_COLUMNS = {
+    "basics": ("name", "email"),
+    "profiles": ("network", "username"),
+    "work": ("company", "position"),
+    "volunteer": ("organization", "position"),
+    "education": ("institution",),
+    "awards": ("title",),
+    "publications": ("name",),
+    "skills": ("name",),
+    "languages": ("language",),
+    "interests": ("name",),
+    "references": ("name",),
+}
+
+
+class Column(NamedTuple):
+    """Represents a column holding a model field."""
+
+    name: str
+    #: names of the field and the models holding it, e.g. ("location", "city")
+    fields: Tuple[str, ...]
+    #: aliases of the same within dumped data, e.g. ("location", "countryCode")
+    path: Tuple[str, ...]
+    is_json: bool
+    is_date: bool
+
+
+def get_columns(
+    model: Any, fields: Tuple[str, ...] = (), path: Tuple[str, ...] = ()
+) -> List[Column]:
+    """Returns the columns holding the fields of a model, flattening nested models."""
+    columns = []
+    for field in model.__fields__.values():
+        field_names, aliases = (*fields, field.name), (*path, field.alias)
+        if field.shape == SHAPE_SINGLETON and issubclass(field.type_, BaseModel):
+            columns.extend(get_columns(field.type_, field_names, aliases))
+        else:
+            is_json = field.shape != SHAPE_SINGLETON
+            name = "_".join(field_names)
+            columns.append(Column(name, field_names, aliases, is_json, field.type_ is date))
+    return columns
+
+
+def get_value(item: Any, column: Column) -> Any:
+    """Returns the value held by a column for an item (or the basics of a rezume)."""
+    value = item
+    for field in column.fields:
+        value = getattr(value, field, None)
+    # empty values are left out as when dumping rezumes
+    if not value:
+        return None
+    elif column.is_json:
+        return json.dumps(list(map(str, value)))
+    elif column.is_date:
+        return value.isoformat()
+    return str(value)
+
+
+def get_tables() -> Dict[str, List[Column]]:
+    """Returns the columns of every table holding rezume data."""
+    basics = [c for c in get_columns(PersonalInfo) if c.name != "profiles"]
+    tables = {"basics": basics, "profiles": get_columns(Profile)}
+    for section_name in Rezume.NAMED_SECTIONS:
+        tables[section_name] = get_columns(RezumeModel.__fields__[section_name].type_)
+    return tables
+
+
+def get_schema(tables: Dict[str, List[Column]]) -> List[str]:
+    """Returns the statements creating the tables and their indexes."""
+    statements = [
+        "CREATE TABLE IF NOT EXISTS rezumes (id INTEGER PRIMARY KEY, key TEXT NOT NULL UNIQUE)",
+        "CREATE TABLE IF NOT EXISTS terms ("
+        "rezume_id INTEGER NOT NULL REFERENCES rezumes (id) ON DELETE CASCADE, "
+        "name TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (name, value, rezume_id)"
+        ") WITHOUT ROWID",
+        "CREATE INDEX IF NOT EXISTS terms_rezume_id ON terms (rezume_id)",
+    ]
+    for table, columns in tables.items():
+        definitions = ", ".join(f'"{column.name}" TEXT' for column in columns)
+        key = "rezume_id" if table == "basics" else "rezume_id, seq"
+        seq = "" if table == "basics" else "seq INTEGER NOT NULL, "
+        statements.append(
+            f'CREATE TABLE IF NOT EXISTS "{table}" ('
+            "rezume_id INTEGER NOT NULL REFERENCES rezumes (id) ON DELETE CASCADE, "
+            f"{seq}{definitions}, PRIMARY KEY ({key}))"
+        )
+
+        indexed = [c.name for c in columns if c.is_date] + list(INDEXED_COLUMNS[table])
+        for column in indexed:
+            statements.append(
+                f'CREATE INDEX IF NOT EXISTS "{table}_{column}" ON "{table}" ("{column}")'
+            )
+    return statements
+
+
+class RezumeStore:
+    """Represents rezumes held by a SQLite database, see :mod:`rezume.store`.
+
+    Rezumes are held by keys (e.g. file paths) like within a
+    :class:`~rezume.collection.RezumeCollection`, which the lookups mirror.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._tables = get_tables()
+        self._local = threading.local()
+
+        connection = self._get_connection()
+        with connection:
+            for statement in get_schema(self._tables):
+                connection.execute(statement)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Returns the connection of the calling thread, connecting if needed."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            try:
+                connection = sqlite3.connect(str(self.path), timeout=30)
+            except sqlite3.Error as ex:
+                raise RezumeError(f"Store not available: {self.path}: {ex}")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA foreign_keys = ON")
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Closes the connection of the calling thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def __len__(self) -> int:
+        return self._get_connection().execute("SELECT COUNT(*) FROM rezumes").fetchone()[0]
+
+    def __iter__(self) -> Iterator[str]:
+        cursor = self._get_connection().execute("SELECT key FROM rezumes ORDER BY id")
+        return (key for key, in cursor)
+
+    def __contains__(self, key: str) -> bool:
+        query = "SELECT 1 FROM rezumes WHERE key = ?"
+        return self._get_connection().execute(query, (key,)).fetchone() is not None
+
+    def __getitem__(self, key: str) -> Rezume:
+        return self.get(key)
+
+    def add(self, rezume: Rezume, key: str) -> str:
+        """Adds a rezume held by provided key, replacing the rezume previously held by
+        the key if any.
+        """
+        self.add_many([(key, rezume)])
+        return key
+
+    def add_many(self, rezumes: Iterable[Tuple[str, Rezume]], batch_size: int = 1000) -> int:
+        """Adds rezumes along with their keys in batches, each written within a
+        single transaction, and returns the number of rezumes added.
+        """
+        count = 0
+        rezumes = iter(rezumes)
+        while True:
+            # the last rezume held by a key within a batch replaces the others
+            batch = dict(islice(rezumes, batch_size))
+            if not batch:
+                return count
+            self._write(batch)
+            count += len(batch)
+
+    def _write(self, batch: Dict[str, Rezume]) -> None:
+        # rows are built ahead of the transaction, holding the position of their rezume
+        # within the batch in place of its id
+        rows: Dict[str, list] = {table: [] for table in self._tables}
+        terms: List[Tuple[int, str, str]] = []
+        for offset, rezume in enumerate(batch.values()):
+            for table, table_rows in self._get_rows(rezume).items():
+                rows[table].extend((offset, *row) for row in table_rows)
+            for name, extract in RezumeCollection.INDEXES.items():
+                values = {normalize(value) for value in extract(rezume) if value}
+                terms.extend((offset, name, value) for value in values)
+
+        connection = self._get_connection()
+        with connection:
+            # takes the write lock up front so that ids assigned below hold
+            connection.execute("BEGIN IMMEDIATE")
+            keys = [(key,) for key in batch]
+            connection.executemany("DELETE FROM rezumes WHERE key = ?", keys)
+            query = "SELECT COALESCE(MAX(id), 0) + 1 FROM rezumes"
+            base = connection.execute(query).fetchone()[0]
+
+            connection.executemany(
+                "INSERT INTO rezumes (id, key) VALUES (?, ?)",
+                ((base + offset, key) for offset, key in enumerate(batch)),
+            )
+            connection.executemany(
+                "INSERT INTO terms (rezume_id, name, value) VALUES (?, ?, ?)",
+                ((base + offset, *row) for offset, *row in terms),
+            )
+            for table, table_rows in rows.items():
+                connection.executemany(
+                    self._get_insert(table), ((base + row[0], *row[1:]) for row in table_rows)
+                )
+
+    def _get_insert(self, table: str) -> str:
+        names = ["rezume_id"] + (["seq"] if table != "basics" else [])
+        names.extend(column.name for column in self._tables[table])
+        columns = ", ".join(f'"{name}"' for name in names)
+        return f'INSERT INTO "{table}" ({columns}) VALUES ({", ".join("?" * len(names))})'
+
+    def _get_rows(self, rezume: Rezume) -> Dict[str, List[tuple]]:
+        """Returns the rows of every table for a rezume, without their rezume id."""
+        rows = {"basics": [tuple(get_value(rezume, c) for c in self._tables["basics"])]}
+        sections: List[Tuple[str, Section]] = [("profiles", rezume.profiles)]
+        sections.extend((section.name, section) for section in rezume.sections)
+        for name, section in sections:
+            columns = self._tables[name]
+            rows[name] = [
+                (seq, *(get_value(item, column) for column in columns))
+                for seq, item in enumerate(section)
+            ]
+        return rows
+
+    def remove(self, key: str) -> None:
+        """Removes the rezume held by provided key."""
+        connection = self._get_connection()
+        with connection:
+            cursor = connection.execute("DELETE FROM rezumes WHERE key = ?", (key,))
+        if not cursor.rowcount:
+            raise RezumeError(f"Rezume not found: {key}")
+
+    def load_dir(
+        self,
+        directory: Union[str, Path],
+        pattern: str = "*.yml",
+        batch_size: int = 1000,
+        **options: Any,
+    ) -> "RezumeStore":
+        """Loads the rezume files matching pattern within provided directory, keyed by
+        their paths, a batch at a time. Options are passed on to :meth:`Rezume.load`.
+        """
+        directory = Path(directory)
+        if not directory.is_dir():
+            raise RezumeError(f"Directory not found: {directory}")
+
+        rezumes = (
+            (str(filepath), Rezume().load(filepath, **options))
+            for filepath in sorted(directory.glob(pattern))
+        )
+        self.add_many(rezumes, batch_size)
+
+        # allows fluent method chaining on `load_dir`
+        return self
+
+    def get(self, key: str, **options: Any) -> Rezume:
+        """Returns the rezume held by provided key. Options are passed on to
+        :meth:`Rezume.load_data`, e.g. to load items as records.
+        """
+        connection = self._get_connection()
+        # a read transaction sees the rezume as a whole, even while it gets replaced
+        with connection:
+            connection.execute("BEGIN")
+            row = connection.execute("SELECT id FROM rezumes WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                raise RezumeError(f"Rezume not found: {key}")
+            data = self._get_data(connection, row[0])
+        return Rezume().load_data(data, **options)
+
+    def _get_data(self, connection: sqlite3.Connection, rezume_id: int) -> dict:
+        """Returns the data of a rezume as dumped by :meth:`Rezume.dump_data`."""
+        data: Dict[str, Any] = {}
+        for table, columns in self._tables.items():
+            names = ", ".join(f'"{column.name}"' for column in columns)
+            order = "" if table == "basics" else " ORDER BY seq"
+            query = f'SELECT {names} FROM "{table}" WHERE rezume_id = ?{order}'
+
+            items = []
+            for row in connection.execute(query, (rezume_id,)):
+                item: Dict[str, Any] = {}
+                for column, value in zip(columns, row):
+                    if value is None:
+                        continue
+                    target = item
+                    for alias in column.path[:-1]:
+                        target = target.setdefault(alias, {})
+                    target[column.path[-1]] = json.loads(value) if column.is_json else value
+                items.append(item)
+
+            if table == "basics":
+                data["basics"] = items[0] if items else {}
+            elif table == "profiles":
+                data["basics"]["profiles"] = items
+            elif items:
+                data[table] = items
+        return data
+
+    def values(self, index: str) -> Dict[str, int]:
+        """Returns the values held by an index along with the number of rezumes
+        holding each value.
+        """
+        self._check_index(index)
+        query = "SELECT value, COUNT(*) FROM terms WHERE name = ? GROUP BY value"
+        return dict(self._get_connection().execute(query, (index,)))
+
+    def find_keys(self, **criteria: Union[str, Iterable[str]]) -> Set[str]:
+        """Returns the keys of rezumes matching all criteria, which map the index
+        names of :class:`~rezume.collection.RezumeCollection` to a value or to several
+        values any of which is matched.
+        """
+        if not criteria:
+            return set(self)
+
+        queries, params = [], []
+        for name, values in criteria.items():
+            self._check_index(name)
+            values = [values] if isinstance(values, str) else list(values)
+            placeholders = ", ".join("?" * len(values))
+            queries.append(
+                f"SELECT rezume_id FROM terms WHERE name = ? AND value IN ({placeholders})"
+            )
+            params.extend([name, *map(normalize, values)])
+
+        query = f"SELECT key FROM rezumes WHERE id IN ({' INTERSECT '.join(queries)})"
+        return {key for key, in self._get_connection().execute(query, params)}
+
+    def find(self, **criteria: Union[str, Iterable[str]]) -> Iterator[Rezume]:
+        """Returns an iterator over the rezumes matching all criteria, loaded one at a
+        time, see :meth:`find_keys`.
+        """
+        return (self.get(key) for key in sorted(self.find_keys(**criteria)))
+
+    def find_active(
+        self,
+        start: date,
+        end: Optional[date] = None,
+        sections: Iterable[str] = ("work",),
+    ) -> Set[str]:
+        """Returns the keys of rezumes with entries in provided sections overlapping
+        the period from `start` to `end`, e.g. rezumes of those employed within it.
+        """
+        queries, params = [], []
+        for section_name in sections:
+            if section_name not in TIMELINED_SECTIONS:
+                raise RezumeError(f"Section is not timelined: {section_name}")
+
+            query = f'SELECT rezume_id FROM "{section_name}" WHERE '
+            query += "(end_date IS NULL OR end_date >= ?)"
+            params.append(start.isoformat())
+            if end is not None:
+                query += " AND start_date <= ?"
+                params.append(end.isoformat())
+            queries.append(query)
+
+        if not queries:
+            return set()
+        query = f"SELECT key FROM rezumes WHERE id IN ({' UNION '.join(queries)})"
+        return {key for key, in self._get_connection().execute(query, params)}
+
+    def _check_index(self, name: str) -> None:
+        if name not in RezumeCollection.INDEXES:
+            raise RezumeError(f"Index not found: {name}")
@@ -4,6 +4,14 @@ from pathlib import Path
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def validation_cache_dir(tmp_path, monkeypatch):
+    """Keeps the validation cache used by commands out of the user's cache directory."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("REZUME_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 @pytest.fixture
 def rezume_mini():
     """Returns the path to the rezume-mini.yml fixture file."""
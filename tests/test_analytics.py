@@ -0,0 +1,83 @@
+import json
+from copy import deepcopy
+from datetime import date
+
+import pytest
+
+from rezume import Rezume, RezumeError
+
+np = pytest.importorskip("numpy")
+
+from rezume.analytics import CorpusStats, get_career_spans  # noqa: E402
+
+
+def career(*spans):
+    starts = np.array([start for start, _ in spans], dtype="datetime64[D]")
+    ends = np.array([end for _, end in spans], dtype="datetime64[D]")
+    return get_career_spans(starts, ends)
+
+
+def test_career_spans():
+    tenure, gaps = career(("2010-01-01", "2010-01-10"))
+    assert tenure == 10 and gaps.tolist() == []
+
+    # overlapping days count once, and periods needn't be sorted
+    tenure, gaps = career(("2010-01-05", "2010-01-20"), ("2010-01-01", "2010-01-10"))
+    assert tenure == 20 and gaps.tolist() == []
+
+    tenure, gaps = career(
+        ("2010-01-01", "2010-01-31"), ("2010-03-01", "2010-03-31"), ("2010-01-15", "2010-02-10")
+    )
+    assert tenure == 31 + 10 + 31 and gaps.tolist() == [18]
+
+
+@pytest.fixture
+def rezume_dir(tmp_path, sample_rezume):
+    corpus = [
+        (["Python", "Django"], [("2010-01-01", "2011-12-31"), ("2012-03-01", None)]),
+        (["python", "Rust"], [("2015-01-01", "2016-12-31")]),
+        (["Go"], []),
+    ]
+    for index, (keywords, spans) in enumerate(corpus):
+        data = deepcopy(sample_rezume)
+        data["skills"] = [{"name": "Backend", "level": "Master", "keywords": keywords}]
+        data["interests"] = [{"name": "Chess"}]
+        data["work"] = [
+            {"company": "Acme", "position": "Dev", "startDate": start, "endDate": end}
+            for start, end in spans
+        ]
+        Rezume().load_data(data).save(tmp_path / f"rezume-{index}.yml")
+    (tmp_path / "rezume-invalid.yml").write_text("basics: [")
+    return tmp_path
+
+
+def test_corpus_stats_from_directory(rezume_dir, tmp_path):
+    stats = CorpusStats.from_directory(rezume_dir, today=date(2020, 2, 29))
+
+    assert stats.rezumes == 3
+    assert list(stats.errors) == [str(rezume_dir / "rezume-invalid.yml")]
+    assert stats.skills == {"backend": 3, "python": 2, "django": 1, "rust": 1, "go": 1}
+    assert stats.interests == {"chess": 3}
+    assert stats.pairs[("backend", "python")] == 2
+    assert stats.pairs[("django", "rust")] == 0
+
+    assert len(stats.tenure) == 2
+    assert stats.tenure.maximum == 730 + (date(2020, 2, 29) - date(2012, 3, 1)).days + 1
+    assert len(stats.gaps) == 1 and stats.gaps.total == 60
+
+    terms, entries = stats.cooccurrence_matrix()
+    assert entries.shape == (len(stats.pairs), 3)
+    row, col, count = entries[entries[:, 2].argmax()]
+    assert (terms[row], terms[col], count) == ("backend", "python", 2)
+
+    output = tmp_path / "analytics.json"
+    stats.save(output, top=2)
+    data = json.loads(output.read_text())
+    assert data["skills"] == {"backend": 3, "python": 2}
+    assert data["tenure"]["count"] == 2
+    assert data["gaps"]["p50_days"] == 60
+
+
+def test_corpus_stats_from_missing_directory(tmp_path):
+    with pytest.raises(RezumeError):
+        CorpusStats.from_directory(tmp_path / "missing")
@@ -0,0 +1,48 @@
+import pytest
+
+from benchmarks.suite import compare_results
+from benchmarks.synthetic import generate_corpus, generate_rezume
+from rezume import Rezume
+
+
+@pytest.mark.parametrize("items", [1, 10, 50])
+def test_synthetic_rezume_is_valid(items):
+    data = generate_rezume(items, profiles=8)
+    rezume = Rezume().load_data(data)
+
+    assert len(rezume.profiles) == 8
+    for name in Rezume.NAMED_SECTIONS:
+        assert len(rezume[name]) == items
+
+
+def test_synthetic_rezumes_are_reproducible():
+    assert generate_rezume(5, seed=3) == generate_rezume(5, seed=3)
+    assert generate_corpus(2, 5) == [generate_rezume(5, seed=0), generate_rezume(5, seed=1)]
+
+
+@pytest.mark.parametrize(
+    "better, base, value, regressed",
+    [
+        ("lower", 1.0, 1.05, False),
+        ("lower", 1.0, 1.2, True),
+        ("higher", 100.0, 120.0, False),
+        ("higher", 100.0, 80.0, True),
+    ],
+)
+def test_compare_flags_regressions_past_threshold(better, base, value, regressed):
+    baseline = {"metrics": {"m": {"value": base, "better": better}}}
+    current = {"metrics": {"m": {"value": value, "better": better}, "new": {"value": 1}}}
+
+    [result] = compare_results(baseline, current, threshold=0.1)
+    assert result["metric"] == "m"
+    assert result["regressed"] == regressed
+
+
+def test_compare_flags_missing_metrics():
+    baseline = {"metrics": {"m": {"value": 1.0, "unit": "s"}, "gone": {"value": 2.0}}}
+    current = {"metrics": {"m": {"value": 1.0}}}
+
+    kept, missing = compare_results(baseline, current)
+    assert not kept["regressed"]
+    assert missing["metric"] == "gone"
+    assert missing["regressed"] and missing["current"] is None
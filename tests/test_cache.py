@@ -0,0 +1,102 @@
+import os
+import time
+from pathlib import Path
+
+import pretend
+import pytest
+
+from rezume import Rezume, RezumeError
+from rezume.cache import ValidationCache, get_cache_salt, get_default_directory
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ValidationCache(tmp_path / "validation", max_entries=3)
+
+
+def test_default_directory_honours_environment(validation_cache_dir):
+    assert get_default_directory() == validation_cache_dir
+
+
+def test_cache_records_outcomes(cache):
+    assert cache.get(b"content") is None
+
+    cache.set(b"content")
+    cache.set(b"other", "error: invalid")
+    assert cache.get(b"content") == (True, None)
+    assert cache.get(b"other") == (False, "error: invalid")
+
+
+def test_cache_evicts_least_recently_used_entries(cache):
+    for index in range(3):
+        cache.set(f"entry-{index}".encode())
+        # ensure distinct modification times across entries
+        path = cache._get_path(f"entry-{index}".encode())
+        os.utime(path, (time.time() - 100 + index, time.time() - 100 + index))
+
+    assert cache.get(b"entry-0") is not None  # marks entry-0 as recently used
+    cache.set(b"entry-3")
+
+    assert len(list(cache.directory.glob("*.json"))) == 3
+    assert cache.get(b"entry-1") is None
+    assert cache.get(b"entry-0") is not None
+
+
+def test_cache_prunes_every_few_writes(tmp_path, monkeypatch):
+    cache = ValidationCache(tmp_path / "validation", max_entries=30)
+    prune = pretend.call_recorder(lambda: None)
+    monkeypatch.setattr(cache, "prune", prune)
+
+    for index in range(7):
+        cache.set(f"entry-{index}".encode())
+    # on the first write, then every max_entries // 10 writes
+    assert len(prune.calls) == 3
+
+
+def test_cache_salt_without_source(monkeypatch):
+    salt = get_cache_salt()
+
+    def read_bytes(self):
+        raise OSError("not a file")
+
+    monkeypatch.setattr(Path, "read_bytes", read_bytes)
+    fallback = get_cache_salt()
+    assert fallback != salt and fallback == get_cache_salt()
+
+
+def test_corrupt_entries_are_treated_as_misses(cache):
+    cache.set(b"content")
+    cache._get_path(b"content").write_text("{not json")
+    assert cache.get(b"content") is None
+
+
+def test_validate_skips_unchanged_files(cache, rezume_mini, monkeypatch):
+    Rezume.validate(rezume_mini, cache)
+
+    load_content = pretend.call_recorder(lambda *a: None)
+    monkeypatch.setattr(Rezume, "_load_content", load_content)
+    Rezume.validate(rezume_mini, cache)
+    assert load_content.calls == []
+
+
+def test_validate_caches_failures(cache, tmp_path):
+    filepath = tmp_path / "malformed.yml"
+    filepath.write_text("basics: {}\n")
+    with pytest.raises(RezumeError) as first:
+        Rezume.validate(filepath, cache)
+
+    copy = tmp_path / "copy.yml"
+    copy.write_text("basics: {}\n")
+    with pytest.raises(RezumeError) as second:
+        Rezume.validate(copy, cache)
+
+    assert str(second.value) == str(first.value).replace(str(filepath), str(copy))
+
+
+def test_validate_many_reports_errors_per_file(cache, rezume_mini, tmp_path):
+    invalid = tmp_path / "invalid.yml"
+    invalid.write_text("- not a rezume\n")
+
+    results = Rezume.validate_many([rezume_mini, invalid], cache)
+    assert results[rezume_mini] is None
+    assert "Invalid file format" in results[invalid]
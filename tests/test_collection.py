@@ -0,0 +1,71 @@
+from copy import deepcopy
+
+import pytest
+
+from rezume import Rezume, RezumeCollection, RezumeError
+
+
+@pytest.fixture
+def collection(sample_rezume):
+    python = deepcopy(sample_rezume)
+    python["skills"] = [{"name": "Python", "level": "Master", "keywords": ["Django"]}]
+    python["languages"] = [{"language": "English", "fluency": "Native"}]
+
+    french = deepcopy(python)
+    french["languages"] = [{"language": "French", "fluency": "Fluent"}]
+
+    rust = deepcopy(sample_rezume)
+    rust["skills"] = [{"name": "Rust", "level": "Beginner"}]
+    rust["languages"] = [{"language": "English", "fluency": "Native"}]
+
+    collection = RezumeCollection()
+    for key, data in (("python", python), ("french", french), ("rust", rust)):
+        collection.add(Rezume().load_data(data), key)
+    return collection
+
+
+def test_find_intersects_indexes(collection):
+    assert collection.find_keys(skill="python") == {"python", "french"}
+    assert collection.find_keys(skill="django", language="english") == {"python"}
+    assert collection.find_keys(skill=["rust", "django"], language=" ENGLISH ") == {
+        "python",
+        "rust",
+    }
+    assert collection.find_keys(skill="python", institution="nowhere") == set()
+    assert collection.find_keys(institution="university", country_code="ng") == set(
+        collection
+    )
+    assert [r.name for r in collection.find(language="french")] == ["John Doe"]
+
+
+def test_removing_rezumes_updates_indexes(collection):
+    collection.remove("french")
+    assert "french" not in collection
+    assert "french" not in collection.values("language")
+    assert collection.values("skill") == {"python": 1, "django": 1, "rust": 1}
+
+    with pytest.raises(RezumeError):
+        collection.remove("french")
+
+
+def test_adding_under_existing_key_replaces_rezume(collection, sample_rezume):
+    collection.add(Rezume().load_data(sample_rezume), "python")
+    assert len(collection) == 3
+    assert collection.find_keys(skill="django") == {"french"}
+
+
+def test_unknown_index_fails(collection):
+    with pytest.raises(RezumeError):
+        collection.find_keys(hobby="chess")
+
+
+def test_load_dir(tmp_path, sample_rezume):
+    for index in range(3):
+        Rezume().load_data(deepcopy(sample_rezume)).save(tmp_path / f"r{index}.yml")
+
+    collection = RezumeCollection().load_dir(tmp_path, lazy=True)
+    assert sorted(collection) == [str(tmp_path / f"r{i}.yml") for i in range(3)]
+    assert len(collection.find(institution="University")) == 3
+
+    with pytest.raises(RezumeError):
+        RezumeCollection().load_dir(tmp_path / "missing")
@@ -1,3 +1,7 @@
+import http.client
+import json
+import pstats
+import subprocess
 import sys
 import types
 from pathlib import Path
@@ -8,9 +12,22 @@ from typer.testing import CliRunner
 
 import rezume
 from rezume import Rezume
-from rezume.cli import create_app, registry
+from rezume.cli import create_app, registry, select_command
+from rezume.cli.commands.bench import BenchCommand, BenchServeCommand
+from rezume.cli.commands.bench.loadgen import LOCALHOST, LoadReport, LocalServer
 from rezume.cli.commands.init import InitCommand
 from rezume.cli.commands.serve import ServeCommand, find_theme_module, render_rezume
+from rezume.cli.commands.stats import StatsCommand
+from rezume.cli.commands.test import TestCommand as ValidateCommand
+from rezume.cli.profiling import get_active_profiler
+
+
+@pytest.fixture(autouse=True)
+def restore_registry():
+    """Restores the command registry which tests replace with patched commands."""
+    commands = list(registry)
+    yield
+    registry[:] = commands
 
 
 def test_presense_of_rezume_template():
@@ -60,6 +77,81 @@ def test_render_rezume(sample_rezume, theme_name, has_result):
     assert isinstance(result, str) == has_result
 
 
+@pytest.mark.parametrize(
+    "args, name",
+    [
+        (["test", "serve"], "test"),
+        (["--profile", "init", "serve"], "serve"),
+        (["--profile-top=5", "bench", "serve"], "bench"),
+        (["--help"], None),
+        (["unknown"], None),
+    ],
+)
+def test_select_command_from_arguments(args, name):
+    assert select_command(args) == name
+
+
+def test_only_invoked_command_is_imported():
+    """Checks that creating the app for a command doesn't import other commands."""
+    code = (
+        "import sys; from rezume.cli import create_app; create_app('test');"
+        "print(sorted(m for m in sys.modules if m.startswith('rezume.cli.commands.')))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert output.stdout.strip() == "['rezume.cli.commands.test']"
+
+
+def test_lazy_command_groups_show_their_help():
+    result = CliRunner().invoke(create_app(), ["--help"])
+    assert "Runs benchmarks against rezume commands" in result.output
+
+
+def test_load_report_percentiles():
+    report = LoadReport("/", [i / 100 for i in range(100, 0, -1)], errors=0, duration=2.0)
+    assert report.throughput == 50
+    assert report.percentile(50) == 0.5
+    assert report.percentile(99) == 0.99
+    assert LoadReport("/", [], errors=3, duration=1.0).error_rate == 1.0
+
+
+def test_local_server_keeps_connections_alive():
+    def app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return [environ["PATH_INFO"].encode()]
+
+    with LocalServer(app) as server:
+        conn = http.client.HTTPConnection(LOCALHOST, server.port, timeout=5)
+        sockets = []
+        for path in ("/a", "/b"):
+            conn.request("GET", path)
+            response = conn.getresponse()
+            assert response.version == 11
+            assert response.read() == path.encode()
+            sockets.append(conn.sock)
+        conn.close()
+
+    assert sockets[0] is not None and sockets[0] is sockets[1]
+
+
+def test_bench_serve_drives_in_process_server(rezume_mini):
+    command = BenchServeCommand(rezume_mini, ["", "invalid"], 0, 2, 6, 0)
+    reports = command.measure()
+
+    assert [report.path for report in reports] == ["/", "/?theme=invalid"]
+    assert all(report.requests == 6 and report.errors == 0 for report in reports)
+
+
+def test_stats_reports_memory(tmp_path, rezume_mini):
+    output = tmp_path / "stats.json"
+    results = StatsCommand([rezume_mini], memory=True, records=True, output=output).collect()
+
+    memory = results["memory"]
+    assert memory["retained"] > 0
+    assert memory["peak"] >= memory["files"][str(rezume_mini)]["retained"]
+    assert {"EducationSet", "models", "profiles", "strings"} <= set(memory["breakdown"])
+    assert json.loads(output.read_text()) == results
+
+
 class TestCommands:
     runner = CliRunner()
 
@@ -112,3 +204,63 @@ class TestCommands:
         assert serve_obj.filename.name == filename
         assert serve_obj.theme == theme
         assert serve_obj.port == port
+
+    def test_profile_writes_pstats_output(self, tmp_path, rezume_mini):
+        registry.clear()
+        registry.append(ValidateCommand)
+
+        output = tmp_path / "test.prof"
+        args = ["--profile", str(output), "test", str(rezume_mini)]
+        result = self.runner.invoke(create_app(), args)
+        assert result.exit_code == 0
+        assert output.exists()
+        assert get_active_profiler() is None
+
+        stats = pstats.Stats(str(output))
+        assert any(name == "validate" for (_, _, name) in stats.stats)  # type: ignore
+
+    def test_profile_writes_collapsed_output(self, tmp_path, rezume_mini):
+        registry.clear()
+        registry.append(ValidateCommand)
+
+        output = tmp_path / "test.collapsed"
+        args = ["--profile", str(output), "test", str(rezume_mini)]
+        result = self.runner.invoke(create_app(), args)
+        assert result.exit_code == 0
+
+        lines = output.read_text().splitlines()
+        assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    def test_profile_samples_requests_for_serve(self, monkeypatch, tmp_path):
+        # stub out serving so only the profiler activation is exercised
+        profilers = []
+        serve_run = pretend.call_recorder(lambda *a: profilers.append(get_active_profiler()))
+        monkeypatch.setattr(ServeCommand, "run", serve_run)
+
+        registry.clear()
+        registry.append(ServeCommand)
+
+        output = tmp_path / "serve.prof"
+        result = self.runner.invoke(create_app(), ["--profile", str(output), "serve"])
+        assert result.exit_code == 0
+        assert profilers[0] is not None
+        assert profilers[0].samples == 0
+
+        # nothing is written when no request got sampled
+        assert not output.exists()
+
+    def test_bench_serve_is_registered_as_subcommand(self, monkeypatch):
+        bench_run = pretend.call_recorder(lambda *a, **kw: [])
+        monkeypatch.setattr(BenchServeCommand, "run", bench_run)
+
+        registry.clear()
+        registry.append(BenchCommand)
+
+        args = ["bench", "serve", "--theme", "a", "--theme", "b", "--clients", 8]
+        result = self.runner.invoke(create_app(), args)
+        assert result.exit_code == 0
+
+        bench_obj = bench_run.calls[0].args[0]
+        assert bench_obj.themes == ["a", "b"]
+        assert bench_obj.clients == 8
+        assert bench_obj.port == 0
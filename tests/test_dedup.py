@@ -0,0 +1,80 @@
+import json
+from copy import deepcopy
+
+import pytest
+
+from rezume import Rezume
+from rezume.cli.commands.dedup import DedupCommand
+
+pytest.importorskip("numpy")
+
+from rezume.dedup import DuplicateFinder, get_bands, get_features  # noqa: E402
+
+
+def make_rezume(sample_rezume, name, highlights, **basics):
+    data = deepcopy(sample_rezume)
+    data["basics"].update(name=name, **basics)
+    data["work"] = [
+        {
+            "company": f"Company {index}",
+            "position": f"Engineer {index}",
+            "startDate": f"20{10 + index}-01-01",
+            "summary": f"Worked on {name} projects for company {index}",
+            "highlights": highlights,
+        }
+        for index in range(4)
+    ]
+    data["skills"] = [{"name": f"Skill {index}", "level": "Master"} for index in range(6)]
+    return Rezume().load_data(data)
+
+
+@pytest.fixture
+def rezumes(sample_rezume):
+    highlights = ["Reduced latency of payment services by half", "Mentored new engineers"]
+    original = make_rezume(sample_rezume, "John Doe", highlights)
+    edited = make_rezume(sample_rezume, "John Doe", highlights[:1], phone="0800-000-0000")
+    other = make_rezume(sample_rezume, "Jane Roe", ["Designed a data pipeline"])
+    other.discard_item("skills", next(iter(other["skills"])))
+    return {"original": original, "edited": edited, "other": other}
+
+
+def test_features_use_section_keys(rezumes):
+    features = get_features(rezumes["original"])
+    assert "education:university:software engineering:bachelor" in features
+    assert "work:201001:engineer 0" in features
+    assert "work.highlights:mentored new engineers" in features
+
+
+def test_bands_match_threshold():
+    assert get_bands(128, 0.8) == (16, 8)
+    assert get_bands(128, 0.5) == (32, 4)
+    assert get_bands(128, 0.001) == (128, 1)
+
+
+def test_finder_clusters_near_duplicates(rezumes):
+    finder = DuplicateFinder(threshold=0.7)
+    for key, rezume in rezumes.items():
+        finder.add(key, rezume)
+
+    [cluster] = finder.clusters()
+    assert cluster.keys == ("original", "edited")
+    [(first, second, score)] = cluster.pairs
+    assert (first, second) == ("original", "edited")
+    assert 0.7 <= score < 1
+
+    assert DuplicateFinder(threshold=0.99).clusters() == []
+
+
+def test_dedup_command(tmp_path, rezumes):
+    for key, rezume in rezumes.items():
+        rezume.save(tmp_path / f"{key}.yml")
+    (tmp_path / "copy.yml").write_bytes((tmp_path / "other.yml").read_bytes())
+
+    output = tmp_path / "clusters.json"
+    clusters = DedupCommand([tmp_path], threshold=0.7, output=output).find()
+
+    assert [len(cluster.keys) for cluster in clusters] == [2, 2]
+    results = sorted(json.loads(output.read_text()), key=lambda cluster: cluster["files"])
+    assert results[0]["files"] == [str(tmp_path / "copy.yml"), str(tmp_path / "other.yml")]
+    assert results[0]["pairs"][0][2] == 1.0
+    assert results[1]["files"] == [str(tmp_path / "edited.yml"), str(tmp_path / "original.yml")]
@@ -0,0 +1,113 @@
+import json
+from copy import deepcopy
+
+import pytest
+
+from rezume import Rezume
+from rezume.cli.commands.diff import DiffCommand, DiffFormat
+from rezume.diff import ADDED, MODIFIED, REMOVED, diff_rezumes
+
+
+def apply_json_patch(data: dict, operations: list) -> dict:
+    """Applies the subset of JSON Patch operations emitted for rezume diffs."""
+    data = deepcopy(data)
+    for operation in operations:
+        *parents, last = operation["path"].lstrip("/").split("/")
+        target = data
+        for part in parents:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        if operation["op"] == "remove":
+            del target[int(last) if isinstance(target, list) else last]
+        elif last == "-":
+            target.append(operation["value"])
+        elif isinstance(target, list):
+            target.insert(int(last), operation["value"])
+        else:
+            target[last] = operation["value"]
+    return data
+
+
+def work(position, start, **fields):
+    return {"company": "Acme", "position": position, "startDate": start, **fields}
+
+
+@pytest.fixture
+def versions(sample_rezume):
+    old = deepcopy(sample_rezume)
+    old["work"] = [
+        work("Developer", "2014-01-01", summary="Built APIs"),
+        work("Engineer", "2016-01-01", highlights=["Led migration"]),
+        work("Intern", "2012-06-01"),
+    ]
+
+    new = deepcopy(old)
+    new["basics"]["label"] = "Engineer"
+    new["basics"]["phone"] = "0800-000-0000"
+    new["basics"]["profiles"].append({"network": "github", "username": "john"})
+    new["work"][0]["summary"] = "Built APIs and services"
+    new["work"][1]["highlights"] = ["Led migration", "Mentored"]
+    new["work"][1]["summary"] = "Platform team"
+    del new["work"][2]
+    new["work"].append(work("Lead", "2019-01-01"))
+    new["skills"] = [{"name": "Python", "level": "Master"}]
+    return Rezume().load_data(old), Rezume().load_data(new)
+
+
+def test_diff_matches_items_by_key(versions):
+    changes = diff_rezumes(*versions)
+    summary = [(c.op, c.section, c.key) for c in changes]
+    assert summary == [
+        (MODIFIED, "basics", ""),
+        (ADDED, "profiles", "github"),
+        (MODIFIED, "work", "201601:Engineer"),
+        (MODIFIED, "work", "201401:Developer"),
+        (REMOVED, "work", "201206:Intern"),
+        (ADDED, "work", "201901:Lead"),
+        (ADDED, "skills", "Python"),
+    ]
+
+    basics, _, engineer, developer, *_ = changes
+    assert basics.fields == {
+        "label": ("Programmer", "Engineer"),
+        "phone": ("0807-0000-1111", "0800-000-0000"),
+    }
+    assert engineer.fields == {
+        "summary": (None, "Platform team"),
+        "highlights": (["Led migration"], ["Led migration", "Mentored"]),
+    }
+    assert developer.fields == {"summary": ("Built APIs", "Built APIs and services")}
+    assert not diff_rezumes(versions[0], versions[0])
+
+
+def test_json_patch_turns_old_into_new(versions):
+    old, new = versions
+    patch = diff_rezumes(old, new).to_json_patch()
+
+    patched = Rezume().load_data(apply_json_patch(old.dump_data(), patch))
+    assert patched.dump_data() == new.dump_data()
+
+    # removing every item of a section removes the section
+    patch = diff_rezumes(new, old).to_json_patch()
+    assert {"op": "remove", "path": "/skills"} in patch
+    assert Rezume().load_data(apply_json_patch(new.dump_data(), patch)).dump_data() == (
+        old.dump_data()
+    )
+
+
+def test_text_output(versions):
+    text = diff_rezumes(*versions).to_text()
+    assert '  ~ label: "Programmer" -> "Engineer"' in text
+    assert "  - 201206:Intern" in text
+    assert '      summary: "Built APIs" -> "Built APIs and services"' in text
+
+
+def test_diff_command(tmp_path, capsys, versions):
+    old_path, new_path = tmp_path / "old.yml", tmp_path / "new.yml"
+    versions[0].save(old_path)
+    versions[1].save(new_path)
+
+    changes = DiffCommand(old_path, new_path, DiffFormat.patch).compare()
+    assert json.loads(capsys.readouterr().out) == changes.to_json_patch()
+
+    assert not DiffCommand(old_path, old_path).compare()
+    assert "No changes found" in capsys.readouterr().out
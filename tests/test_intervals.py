@@ -0,0 +1,91 @@
+import random
+from copy import deepcopy
+from datetime import date, timedelta
+
+import pytest
+
+from rezume import Rezume, RezumeCollection
+from rezume.intervals import IntervalIndex, find_gaps, find_overlaps
+from rezume.models import Work
+
+
+def work(start: str, end: str = None, company="Acme") -> Work:
+    return Work(company=company, position="Engineer", startDate=start, endDate=end)
+
+
+def test_overlapping_matches_full_scan():
+    rnd = random.Random(0)
+    intervals = []
+    for value in range(300):
+        start = date(2000, 1, 1) + timedelta(days=rnd.randrange(7000))
+        end = None if value % 10 == 0 else start + timedelta(days=rnd.randrange(900))
+        intervals.append((start, end, value))
+
+    index = IntervalIndex()
+    for interval in intervals:
+        index.add(*interval)
+
+    for _ in range(100):
+        start = date(2000, 1, 1) + timedelta(days=rnd.randrange(8000))
+        end = start + timedelta(days=rnd.randrange(400))
+        expected = [v for s, e, v in intervals if s <= end and (e or date.max) >= start]
+        assert sorted(index.overlapping(start, end)) == sorted(expected)
+
+
+def test_index_over_rezume(sample_rezume):
+    rezume = Rezume().load_data(sample_rezume)
+    rezume.add_item("work", work("2012-01-01", "2016-06-30"))
+    index = IntervalIndex.from_rezume(rezume)
+
+    assert [name for name, _ in index.at(date(2021, 1, 1))] == ["education"]
+    assert [name for name, _ in index.overlapping(date(2015, 1, 1))] == [
+        "work",
+        "education",
+    ]
+    assert index.overlapping(date(2017, 1, 1), date(2019, 1, 1)) == []
+
+
+@pytest.mark.parametrize(
+    "spans, gaps",
+    [
+        ([], []),
+        ([("2010-01-01", "2010-12-31"), ("2011-01-01", None)], []),
+        (
+            [("2010-01-01", "2010-12-31"), ("2011-03-01", "2012-01-31")],
+            [(date(2011, 1, 1), date(2011, 2, 28))],
+        ),
+        ([("2010-01-01", None), ("2015-01-01", "2016-01-01")], []),
+    ],
+)
+def test_find_gaps(spans, gaps):
+    assert find_gaps([work(start, end) for start, end in spans]) == gaps
+
+
+def test_find_gaps_honours_minimum_length():
+    entries = [work("2010-01-01", "2010-12-31"), work("2011-01-10", "2011-12-31")]
+    assert len(find_gaps(entries, min_days=9)) == 1
+    assert find_gaps(entries, min_days=10) == []
+
+
+def test_find_overlaps():
+    first = work("2010-01-01", "2012-12-31", "A")
+    second = work("2012-06-01", None, "B")
+    third = work("2013-01-01", "2013-06-30", "C")
+    fourth = work("2009-01-01", "2009-12-31", "D")
+    assert find_overlaps([first, second, third, fourth]) == [(first, second), (second, third)]
+
+
+def test_collection_finds_active_rezumes(sample_rezume):
+    collection = RezumeCollection()
+    spans = {"a": ("2014-01-01", "2016-01-01"), "b": ("2019-01-01", None)}
+    for key, (start, end) in spans.items():
+        data = deepcopy(sample_rezume)
+        data["work"] = [work(start, end).dict(by_alias=True)]
+        collection.add(Rezume().load_data(data), key)
+
+    assert collection.find_active(date(2015, 1, 1), date(2018, 12, 31)) == {"a"}
+    assert collection.find_active(date(2025, 1, 1)) == {"b"}
+    assert collection.find_active(date(2021, 1, 1), sections=["education"]) == {"a", "b"}
+
+    collection.remove("b")
+    assert collection.find_active(date(2025, 1, 1)) == set()
@@ -0,0 +1,51 @@
+from copy import deepcopy
+
+import pytest
+
+from rezume import Rezume, RezumeCollection, RezumeError, matching
+from rezume.matching import Matcher
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def collection(sample_rezume):
+    skills = {
+        "python": ["Python", "Django", "PostgreSQL"],
+        "frontend": ["JavaScript", "React", "CSS"],
+        "fullstack": ["Python", "JavaScript", "React"],
+    }
+    collection = RezumeCollection()
+    for key, keywords in skills.items():
+        data = deepcopy(sample_rezume)
+        data["skills"] = [{"name": "Development", "level": "Master", "keywords": keywords}]
+        collection.add(Rezume().load_data(data), key)
+    collection.add(Rezume().load_data(sample_rezume), "empty")
+    return collection
+
+
+def test_top_ranks_by_similarity(collection):
+    matcher = Matcher.from_collection(collection)
+
+    matches = matcher.top("Senior Python engineer, Django and PostgreSQL")
+    assert [m.key for m in matches] == ["python", "fullstack"]
+    assert matches[0].terms == ("django", "postgresql", "python")
+    assert matches[1].terms == ("python",)
+    assert 0 < matches[1].score < matches[0].score <= 1
+
+    assert [m.key for m in matcher.top("react javascript python", k=1)] == ["fullstack"]
+    assert matcher.top("kubernetes") == []
+    assert matcher.top("python", k=0) == []
+
+
+def test_scores_cover_all_rezumes(collection):
+    scores = Matcher.from_collection(collection).score("react")
+    assert scores.shape == (4,)
+    assert scores[0] == scores[3] == 0
+    assert scores[1] > 0 and scores[2] > 0
+
+
+def test_matching_requires_numpy(monkeypatch, collection):
+    monkeypatch.setattr(matching, "np", None)
+    with pytest.raises(RezumeError):
+        Matcher.from_collection(collection)
@@ -0,0 +1,137 @@
+from copy import deepcopy
+
+import pytest
+
+from rezume import Rezume
+from rezume.base import RezumeError
+from rezume.diff import diff_rezumes
+
+
+@pytest.fixture
+def data(sample_rezume):
+    sample_rezume["work"] = [
+        {"company": "Acme", "position": "Developer", "startDate": "2014-01-01"},
+        {
+            "company": "Acme",
+            "position": "Engineer",
+            "startDate": "2016-01-01",
+            "highlights": ["Led migration"],
+        },
+    ]
+    return sample_rezume
+
+
+def test_patch_changes_touched_items_only(data):
+    rezume = Rezume().load_data(data)
+    engineer, developer = rezume["work"]
+    education = list(rezume["education"])
+
+    rezume.apply_patch(
+        [
+            {"op": "add", "path": "/work/0/highlights/-", "value": "Mentored"},
+            {"op": "add", "path": "/work/1/endDate", "value": "2015-12-31"},
+            {"op": "replace", "path": "/basics/label", "value": "Engineer"},
+            {"op": "remove", "path": "/basics/profiles/0/url"},
+        ]
+    )
+
+    patched_engineer, patched_developer = rezume["work"]
+    assert patched_engineer.highlights == ["Led migration", "Mentored"]
+    assert str(patched_developer.end_date) == "2015-12-31"
+    assert patched_engineer is not engineer and patched_developer is not developer
+    assert list(rezume["education"]) == education
+    assert list(rezume["education"])[0] is education[0]
+
+    assert rezume.label == "Engineer"
+    assert list(rezume.profiles)[0].url is None
+
+    data["work"][1]["highlights"].append("Mentored")
+    data["work"][0]["endDate"] = "2015-12-31"
+    data["basics"]["label"] = "Engineer"
+    del data["basics"]["profiles"][0]["url"]
+    assert rezume.dump_data() == Rezume().load_data(data).dump_data()
+
+
+def test_patch_positions_hold_till_applied(data):
+    rezume = Rezume().load_data(data)
+    rezume.apply_patch(
+        [
+            # moves the engineer entry (first) after the developer entry (second)
+            {"op": "replace", "path": "/work/0/startDate", "value": "2010-01-01"},
+            {"op": "replace", "path": "/work/0/position", "value": "Intern"},
+            {"op": "add", "path": "/work/-", "value": {**data["work"][0], "position": "Lead"}},
+            {"op": "remove", "path": "/work/1"},
+        ]
+    )
+    assert [item.position for item in rezume["work"]] == ["Lead", "Intern"]
+
+
+def test_patch_applies_diffs(data):
+    old = Rezume().load_data(data)
+    new_data = deepcopy(data)
+    new_data["work"][1]["highlights"] = ["Mentored"]
+    new_data["work"][0]["position"] = "Lead"
+    new_data["skills"] = [{"name": "Python", "level": "Master"}]
+    new_data["basics"]["profiles"].append({"network": "github", "username": "john"})
+    new = Rezume().load_data(new_data)
+
+    patch = diff_rezumes(old, new).to_json_patch()
+    assert old.apply_patch(patch).dump_data() == new.dump_data()
+    assert old.apply_patch(diff_rezumes(old, Rezume().load_data(data)).to_json_patch())
+    assert old.dump_data() == Rezume().load_data(data).dump_data()
+
+
+def test_failing_patch_leaves_rezume_unchanged(data):
+    rezume = Rezume().load_data(data)
+    expected = rezume.dump_data()
+
+    failing = [
+        [{"op": "replace", "path": "/work/0/startDate", "value": "not a date"}],
+        [{"op": "remove", "path": "/education"}],
+        [{"op": "remove", "path": "/work/5"}],
+        [{"op": "add", "path": "/unknown", "value": []}],
+        [{"op": "test", "path": "/work/0/position", "value": "Developer"}],
+        [{"op": "merge", "path": "/work"}],
+        [
+            {"op": "replace", "path": "/basics/label", "value": "Engineer"},
+            {"op": "replace", "path": "/basics/email", "value": "invalid"},
+        ],
+        [{"op": "copy", "path": "/work/-"}],
+        # the engineer entry (first) would get the key of the developer entry
+        [
+            {"op": "replace", "path": "/work/0/position", "value": "Developer"},
+            {"op": "replace", "path": "/work/0/startDate", "value": "2014-01-01"},
+        ],
+    ]
+    for operations in failing:
+        with pytest.raises(RezumeError):
+            rezume.apply_patch(operations)
+        assert rezume.dump_data() == expected
+
+
+def test_patch_move_copy_and_test(data):
+    rezume = Rezume().load_data(data)
+    rezume.apply_patch(
+        [
+            {"op": "test", "path": "/work/0/position", "value": "Engineer"},
+            {"op": "copy", "from": "/work/0/highlights", "path": "/work/1/highlights"},
+            {"op": "move", "from": "/basics/summary", "path": "/work/1/summary"},
+        ]
+    )
+    engineer, developer = rezume["work"]
+    assert developer.highlights == engineer.highlights == ["Led migration"]
+    assert developer.summary == "A summary of john doe..."
+    assert not rezume.summary
+
+
+def test_patch_records_and_lazy_sections(data):
+    rezume = Rezume().load_data(data, lazy=True, records=True)
+    skills = [{"name": "Go", "level": "Pro"}]
+    rezume.apply_patch([{"op": "add", "path": "/skills", "value": skills}])
+    assert [skill.name for skill in rezume["skills"]] == ["Go"]
+
+    rezume.apply_patch([{"op": "replace", "path": "/work/1/position", "value": "Junior"}])
+    item = list(rezume["work"])[1]
+    assert item.position == "Junior"
+    with pytest.raises(AttributeError):
+        item.position = "Senior"
@@ -1,10 +1,26 @@
+import pickle
+import subprocess
+import sys
+from copy import deepcopy
 from pathlib import Path
 
+import pretend
 import pytest
-from pydantic import ValidationError
-
-from rezume import Rezume, RezumeError, get_version
-from rezume.models import Education, Experience
+import yaml
+from pydantic import HttpUrl, ValidationError
+
+import rezume
+from rezume import Rezume, RezumeError, get_version, records
+from rezume.interning import Interner
+from rezume.models import (
+    Education,
+    Experience,
+    ValidationMemo,
+    clear_validation_memos,
+    get_validation_memo_info,
+)
+from rezume.records import Record, get_record_type, to_record
+from rezume.stats import get_memory_breakdown
 
 
 def test_version():
@@ -13,6 +29,24 @@ def test_version():
     assert len(version.split(".")) == 3
 
 
+def test_package_import_defers_heavy_dependencies():
+    code = (
+        "import sys, rezume; rezume.RezumeError; rezume.get_version();"
+        "print(sorted({'pydantic', 'yaml', 'rezume.models'} & set(sys.modules)))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert output.stdout.strip() == "[]"
+
+
+def test_lazy_attributes_resolve_on_access():
+    from rezume.models import Rezume as RezumeModel
+
+    assert rezume.RezumeModel is RezumeModel
+    assert "Rezume" in dir(rezume)
+    with pytest.raises(AttributeError):
+        rezume.NoSuchAttribute
+
+
 class TestResume:
     def test_instance_is_prepopulated_with_data_sections(self):
         rezume = Rezume()
@@ -186,3 +220,346 @@ class TestResume:
 
     def test_can_validate_data_via_is_valid_api(self, sample_rezume):
         assert Rezume.is_valid(sample_rezume) is True
+
+
+class TestPartialLoading:
+    @pytest.fixture
+    def rezume_data(self, sample_rezume):
+        sample_rezume["skills"] = [{"name": "Python", "level": "Master"}]
+        sample_rezume["work"] = [{"position": "Dev", "startDate": "2020-01-01"}]
+        return sample_rezume
+
+    def test_projection_only_loads_named_sections(self, rezume_data):
+        rezume = Rezume().load_data(rezume_data, sections=["skills"])
+
+        assert rezume.name == "John Doe"
+        assert len(rezume.profiles) == 1
+        assert len(rezume["skills"]) == 1
+        assert len(rezume["education"]) == 0
+
+    def test_projection_skips_validating_other_sections(self, rezume_data):
+        # work entry is invalid as it has no company but isn't part of projection
+        rezume = Rezume().load_data(rezume_data, sections=["education"])
+        assert len(rezume["education"]) == 1
+
+    def test_projection_fails_for_invalid_section(self, rezume_data, tmp_path):
+        with pytest.raises(RezumeError):
+            Rezume().load_data(rezume_data, sections=["work"])
+
+        filepath = tmp_path / "rezume.yml"
+        filepath.write_text(yaml.dump(rezume_data))
+        with pytest.raises(RezumeError):
+            Rezume().load(filepath, sections=["work"])
+
+    def test_projection_fails_for_unknown_section(self, rezume_data):
+        with pytest.raises(RezumeError):
+            Rezume().load_data(rezume_data, sections=["hobbies"])
+
+    def test_lazy_sections_are_validated_on_access(self, rezume_data):
+        rezume = Rezume().load_data(rezume_data, lazy=True)
+        assert set(rezume._pending) == {"education", "skills", "work"}
+
+        assert len(rezume["skills"]) == 1
+        assert "skills" not in rezume._pending
+
+        with pytest.raises(RezumeError):
+            rezume["work"]
+
+    def test_lazy_section_fails_on_every_access(self, rezume_data):
+        rezume = Rezume().load_data(rezume_data, lazy=True)
+        for _ in range(2):
+            with pytest.raises(RezumeError):
+                rezume["work"]
+
+        assert "work" in rezume._pending
+
+    def test_clearing_lazy_section_skips_validation(self, rezume_data):
+        rezume = Rezume().load_data(rezume_data, lazy=True)
+        rezume.clear_section("work")
+
+        assert "work" not in rezume._pending
+        assert len(rezume["work"]) == 0
+
+    def test_lazy_loading_matches_eager_loading(self, rezume_mini):
+        eager = Rezume().load(rezume_mini)
+        lazy = Rezume().load(rezume_mini, lazy=True)
+
+        assert lazy.dump_data() == eager.dump_data()
+        assert not lazy._pending
+
+    def test_lazy_loading_requires_mandatory_sections(self, rezume_data):
+        del rezume_data["education"]
+        with pytest.raises(RezumeError):
+            Rezume().load_data(rezume_data, lazy=True)
+
+
+class TestValidationMemo:
+    def test_memo_evicts_least_recently_used_values(self):
+        memo = ValidationMemo(maxsize=2)
+        assert memo.get("a", lambda: "A") == "A"
+        assert memo.get("b", lambda: "B") == "B"
+        assert memo.get("a", lambda: pytest.fail("expected a hit")) == "A"
+
+        memo.get("c", lambda: "C")
+        assert memo.info() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+        assert memo.get("b", lambda: "B2") == "B2"
+
+    def test_failed_validation_is_not_memoized(self):
+        memo = ValidationMemo()
+
+        def fail():
+            raise ValueError("invalid")
+
+        with pytest.raises(ValueError):
+            memo.get("x", fail)
+        assert len(memo) == 0
+
+    def test_repeated_values_hit_memos_on_load(self, sample_rezume):
+        clear_validation_memos()
+        Rezume().load_data(sample_rezume)
+        Rezume().load_data(sample_rezume)
+
+        info = get_validation_memo_info()
+        assert info["email"]["hits"] >= 1
+        assert info["url"]["hits"] >= 2
+        assert info["url"]["misses"] == 2
+
+    def test_memoized_values_are_validated_types(self, sample_rezume):
+        rezume = Rezume().load_data(sample_rezume)
+        assert isinstance(rezume.website, HttpUrl)
+        assert rezume.website.host == "johndoe.com"
+
+        sample_rezume["basics"]["website"] = "not a url"
+        with pytest.raises(ValidationError):
+            Rezume().load_data(sample_rezume)
+
+
+class TestInterning:
+    def test_repeated_values_are_shared_across_rezumes(self, sample_rezume):
+        interner = Interner()
+        first = Rezume().load_data(deepcopy(sample_rezume), interner=interner)
+        second = Rezume().load_data(deepcopy(sample_rezume), interner=interner)
+
+        [first_entry], [second_entry] = first["education"], second["education"]
+        assert first_entry.institution is second_entry.institution
+        assert first_entry.start_date is second_entry.start_date
+        assert first.location.country_code is second.location.country_code
+
+        stats = interner.stats()
+        assert stats["hits"] > 0
+        assert stats["saved_bytes"] > 0
+
+    def test_interning_applies_to_lazy_sections(self, sample_rezume):
+        interner = Interner()
+        first = Rezume().load_data(deepcopy(sample_rezume), interner=interner)
+        second = Rezume().load_data(deepcopy(sample_rezume), lazy=True, interner=interner)
+
+        [first_entry], [second_entry] = first["education"], second["education"]
+        assert first_entry.area is second_entry.area
+
+    def test_interning_keeps_value_types(self):
+        interner = Interner()
+        url = HttpUrl("http://x.com", scheme="http", host="x.com")
+        assert interner.intern(url) is url
+        assert interner.intern("http://x.com") == "http://x.com"
+        assert len(interner) == 1
+
+
+class TestRecords:
+    def test_records_hold_model_data(self, sample_rezume):
+        rezume = Rezume().load_data(deepcopy(sample_rezume), records=True)
+
+        [entry] = rezume["education"]
+        assert isinstance(entry, Record)
+        assert entry.institution == "University"
+        assert not hasattr(entry, "__dict__")
+
+        expected = Rezume().load_data(deepcopy(sample_rezume)).dump_data()
+        assert rezume.dump_data() == expected
+
+    def test_records_are_read_only(self, sample_rezume):
+        rezume = Rezume().load_data(sample_rezume, lazy=True, records=True)
+
+        [entry] = rezume["education"]
+        with pytest.raises(AttributeError):
+            entry.institution = "College"
+
+    def test_records_are_validated_without_models(self, sample_rezume, monkeypatch):
+        monkeypatch.setattr(records, "parse_obj_as", pretend.raiser(AssertionError))
+        rezume = Rezume().load_data(deepcopy(sample_rezume), records=True)
+        assert rezume.dump_data() == Rezume().load_data(sample_rezume).dump_data()
+
+    def test_records_report_model_errors(self, sample_rezume):
+        del sample_rezume["education"][0]["institution"]
+        with pytest.raises(RezumeError) as error:
+            Rezume().load_data(sample_rezume, records=True)
+        assert "institution" in str(error.value)
+
+    def test_records_round_trip(self, sample_rezume):
+        sample_rezume["education"][0]["courses"] = ["Compilers"]
+        [entry] = Rezume().load_data(sample_rezume)["education"]
+        record = to_record(entry)
+
+        assert record.courses == ("Compilers",)
+
+        assert pickle.loads(pickle.dumps(record)) == record
+        assert record.to_model() == entry
+        assert type(record) is get_record_type(Education)
+
+
+class TestFingerprint:
+    @pytest.fixture
+    def data(self, sample_rezume):
+        sample_rezume["education"].append(
+            {"institution": "College", "area": "Physics", "startDate": "2016-09-01"}
+        )
+        sample_rezume["skills"] = [{"name": "Python", "level": "Master"}]
+        return sample_rezume
+
+    def test_fingerprint_ignores_ordering(self, data):
+        fingerprint = Rezume().load_data(deepcopy(data)).fingerprint()
+
+        data["education"].reverse()
+        data["basics"] = dict(reversed(list(data["basics"].items())))
+        assert Rezume().load_data(deepcopy(data)).fingerprint() == fingerprint
+        assert Rezume().load_data(data, lazy=True, records=True).fingerprint() == fingerprint
+
+        data["skills"][0]["level"] = "Expert"
+        assert Rezume().load_data(deepcopy(data)).fingerprint() != fingerprint
+        data["skills"] = []
+        assert Rezume().load_data(deepcopy(data)).fingerprint() != fingerprint
+
+    def test_fingerprint_rehashes_changed_sections(self, data, monkeypatch):
+        rezume = Rezume().load_data(data)
+        fingerprint = rezume.fingerprint()
+
+        hashed = []
+        get_digest = Rezume._get_digest
+        monkeypatch.setattr(
+            Rezume, "_get_digest", lambda self, s: hashed.append(s) or get_digest(self, s)
+        )
+        # only basics are hashed again, the sections being unchanged
+        rezume.label = "Engineer"
+        assert rezume.fingerprint() != fingerprint
+        assert hashed == []
+
+        [skill] = rezume["skills"]
+        rezume.discard_item("skills", skill)
+        rezume.add_item("skills", skill.copy(update={"level": "Expert"}))
+        rezume.label = "Programmer"
+        assert rezume.fingerprint() != fingerprint
+        assert hashed == [rezume["skills"]]
+
+        rezume.apply_patch([{"op": "replace", "path": "/skills/0/level", "value": "Master"}])
+        assert rezume.fingerprint() == fingerprint
+
+    def test_fingerprint_items_cannot_change_in_place(self, data):
+        rezume = Rezume().load_data(data)
+        fingerprint = rezume.fingerprint()
+
+        [skill] = rezume["skills"]
+        with pytest.raises(TypeError):
+            skill.level = "Expert"
+        assert rezume.fingerprint() == fingerprint
+
+
+class TestClone:
+    @pytest.fixture
+    def rezume(self, sample_rezume):
+        sample_rezume["work"] = [
+            {
+                "company": "Acme",
+                "position": "Engineer",
+                "startDate": "2016-01-01",
+                "highlights": ["Led migration", "Mentored"],
+            }
+        ]
+        return Rezume().load_data(sample_rezume)
+
+    def test_clone_shares_sections_till_changed(self, rezume):
+        clone = rezume.clone()
+        assert clone["work"] is not rezume["work"]
+        assert clone["work"]._items is rezume["work"]._items
+        assert clone.dump_data() == rezume.dump_data()
+        assert clone.fingerprint() == rezume.fingerprint()
+
+        expected = rezume.dump_data()
+        clone.apply_patch([{"op": "remove", "path": "/work/0/highlights/1"}])
+        clone.label = "Engineer"
+        clone.profiles.clear()
+        assert rezume.dump_data() == expected
+
+        [item] = clone["work"]
+        assert item.highlights == ["Led migration"]
+        assert clone.label == "Engineer" and not clone.profiles
+        # unchanged sections are still shared
+        assert clone["education"]._items is rezume["education"]._items
+        assert list(clone["education"])[0] is list(rezume["education"])[0]
+
+        rezume.discard_item("work", list(rezume["work"])[0])
+        assert not rezume["work"] and len(clone["work"]) == 1
+
+    @pytest.mark.parametrize("records", [False, True])
+    def test_clone_items_cannot_change_original(self, rezume, records):
+        rezume = Rezume().load_data(rezume.dump_data(), records=records)
+        expected = rezume.dump_data()
+        clone = rezume.clone()
+
+        for item in clone["work"]:
+            with pytest.raises((TypeError, AttributeError)):
+                item.highlights = item.highlights[:1]
+        assert rezume.dump_data() == expected
+
+    def test_clone_lazy_rezume(self, sample_rezume):
+        rezume = Rezume().load_data(sample_rezume, lazy=True)
+        clone = rezume.clone()
+        clone.clear_section("education")
+
+        assert not clone["education"]
+        assert len(rezume["education"]) == 1
+
+
+class TestTimeline:
+    @pytest.fixture
+    def rezume(self, sample_rezume):
+        sample_rezume["work"] = [
+            {"company": "Acme", "position": "Engineer", "startDate": "2016-01-01"},
+            {"company": "Acme", "position": "Developer", "startDate": "2021-01-01"},
+        ]
+        sample_rezume["volunteer"] = [
+            {"organization": "Club", "position": "Coach", "startDate": "2018-03-01"}
+        ]
+        return Rezume().load_data(sample_rezume)
+
+    def test_timeline_merges_sections(self, rezume):
+        entries = [(name, str(entry.start_date)) for name, entry in rezume.timeline()]
+        assert entries == [
+            ("work", "2021-01-01"),
+            ("education", "2020-07-05"),
+            ("volunteer", "2018-03-01"),
+            ("work", "2016-01-01"),
+        ]
+
+        oldest = rezume.timeline(("work", "volunteer"), reverse=False, limit=2)
+        assert [entry.position for _, entry in oldest] == ["Engineer", "Coach"]
+        assert [entry.position for _, entry in rezume.timeline(limit=1)] == ["Developer"]
+
+        with pytest.raises(RezumeError):
+            list(rezume.timeline(["awards"]))
+
+    def test_top_matches_sorted_order(self, rezume):
+        work = rezume["work"]
+        assert [entry.position for entry in work.top(1)] == ["Developer"]
+        assert work.top(1, reverse=False) == list(work)[-1:]
+        assert work.top(5) == list(work)
+
+
+def test_memory_breakdown_reflects_representation(sample_rezume):
+    models = Rezume().load_data(deepcopy(sample_rezume))
+    records = Rezume().load_data(deepcopy(sample_rezume), records=True)
+
+    breakdown = get_memory_breakdown([models])
+    assert breakdown["profiles"] > 0 and breakdown["EducationSet"] > 0
+    assert get_memory_breakdown([records])["models"] < breakdown["models"]
+    # values shared between rezumes are only counted once
+    assert get_memory_breakdown([models, models]) == breakdown
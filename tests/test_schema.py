@@ -0,0 +1,74 @@
+import pytest
+
+from rezume import Rezume, RezumeError
+from rezume.schema import compile_schema, get_validator
+
+
+@pytest.fixture
+def validate():
+    return compile_schema(
+        {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "tags": {"type": "array", "items": {"type": "string"}},
+                "owner": {"$ref": "#/definitions/Owner"},
+            },
+            "required": ["name"],
+            "definitions": {
+                "Owner": {
+                    "type": "object",
+                    "properties": {"email": {"type": "string"}},
+                    "required": ["email"],
+                }
+            },
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"name": "n"},
+        {"name": 1, "tags": ["a", 2], "owner": {"email": "e"}},
+        {"name": "n", "tags": None, "extra": {}},
+    ],
+)
+def test_compiled_schema_accepts_wellformed_data(validate, data):
+    validate(data)
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ("text", "__root__\n  value is not a valid dict"),
+        ({}, "name\n  field required"),
+        ({"name": None}, "name\n  none is not an allowed value"),
+        ({"name": {}}, "name\n  str type expected"),
+        ({"name": "n", "tags": "a"}, "tags\n  value is not a valid list"),
+        ({"name": "n", "tags": ["a", ["b"]]}, "tags -> 1\n  str type expected"),
+        ({"name": "n", "owner": {}}, "owner -> email\n  field required"),
+    ],
+)
+def test_compiled_schema_rejects_malformed_data(validate, data, message):
+    with pytest.raises(RezumeError) as ex:
+        validate(data)
+    assert message in str(ex.value)
+
+
+def test_rezume_validator_rejects_missing_basics(sample_rezume):
+    del sample_rezume["basics"]["location"]["region"]
+    with pytest.raises(RezumeError) as ex:
+        get_validator()(sample_rezume)
+    assert "basics -> location -> region" in str(ex.value)
+
+
+def test_validate_does_not_materialize_sections(sample_rezume, monkeypatch):
+    def fail(*args, **kwargs):
+        pytest.fail("Rezume should not be built for validation")
+
+    monkeypatch.setattr(Rezume, "__init__", fail)
+    Rezume.validate(sample_rezume)
+
+    sample_rezume["basics"]["email"] = "not-an-email"
+    assert Rezume.is_valid(sample_rezume) is False
@@ -0,0 +1,96 @@
+from copy import deepcopy
+
+import pytest
+
+from rezume import Rezume
+from rezume.cli.commands.search import SearchCommand
+from rezume.search import SearchIndex
+
+
+@pytest.fixture
+def rezume_files(tmp_path, sample_rezume):
+    texts = {
+        "backend": ("Backend engineer", "Reduced API latency for payment services"),
+        "data": ("Data engineer", "Built data pipeline services, latency was reduced"),
+        "writer": ("Technical writer", "Wrote API documentation"),
+    }
+    paths = {}
+    for name, (position, highlight) in texts.items():
+        data = deepcopy(sample_rezume)
+        data["work"] = [
+            {
+                "company": "Acme",
+                "position": position,
+                "startDate": "2015-01-01",
+                "highlights": [highlight],
+            }
+        ]
+        paths[name] = tmp_path / f"{name}.yml"
+        Rezume().load_data(data).save(paths[name])
+    return paths
+
+
+def search(index, query):
+    return [hit.path.rsplit("/", 1)[-1][:-4] for hit in index.search(query)]
+
+
+def test_search_ranks_matches(tmp_path, rezume_files):
+    index = SearchIndex(tmp_path / "index.json")
+    assert index.update(rezume_files.values()) == {}
+
+    assert search(index, "latency") == ["backend", "data"]
+    assert search(index, "engineer") == ["backend", "data"]
+    assert search(index, "api writer")[0] == "writer"
+    assert search(index, "kubernetes") == []
+
+
+def test_phrase_queries(tmp_path, rezume_files):
+    index = SearchIndex()
+    index.update(rezume_files.values())
+
+    assert search(index, '"reduced api latency"') == ["backend"]
+    assert search(index, '"latency reduced"') == []
+    # phrases don't match across texts (position and highlight)
+    assert search(index, '"engineer reduced"') == []
+    assert search(index, '"API" writer') == ["writer", "backend"]
+
+
+def test_field_boosts(tmp_path, rezume_files):
+    index = SearchIndex()
+    index.update(rezume_files.values())
+
+    assert search(index, "data latency") == ["data", "backend"]
+    boosts = {"work.highlights": 5.0, "work.position": 0.1}
+    assert [h.path for h in index.search("data", boosts=boosts)] == [
+        str(rezume_files["data"])
+    ]
+
+
+def test_index_updates_incrementally(tmp_path, rezume_files, sample_rezume):
+    index_path = tmp_path / "index.json"
+    index = SearchIndex(index_path)
+    index.update(rezume_files.values())
+    index.save()
+
+    index = SearchIndex(index_path)
+    assert len(index) == 3
+    index.add = None  # unchanged files must not be indexed again
+    assert index.update(rezume_files.values()) == {}
+
+    index = SearchIndex(index_path)
+    Rezume().load_data(sample_rezume).save(rezume_files["writer"], overwrite=True)
+    rezume_files["data"].unlink()
+    index.update(rezume_files.values())
+    assert index.prune() == [str(rezume_files["data"])]
+    assert search(index, "api") == ["backend"]
+    assert search(index, "latency") == ["backend"]
+
+
+def test_search_command(tmp_path, rezume_files, capsys):
+    (tmp_path / "invalid.yml").write_text("name: [")
+    command = SearchCommand("latency", [tmp_path], tmp_path / "index.json", limit=1)
+
+    [hit] = command.search()
+    assert hit.path == str(rezume_files["backend"])
+    assert "Skipped" in capsys.readouterr().out
+    assert (tmp_path / "index.json").exists()
@@ -1,8 +1,10 @@
 import random
+from datetime import date
 
 import pytest
 
-from rezume.sections import Section
+from rezume.models import Education
+from rezume.sections import EducationSet, Section
 
 
 class TestSection:
@@ -57,3 +59,18 @@ class TestSection:
         section, item = Section(), (1, 2, "boys")
         key = section._generate_key(item)
         assert key is item
+
+    def test_items_cannot_change_in_place(self):
+        first = Education(institution="A", area="Physics", startDate=date(2021, 1, 1))
+        second = Education(institution="B", area="Physics", startDate=date(2019, 1, 1))
+        section = EducationSet("education", [first, second], reverse=False)
+        assert [item.institution for item in section] == ["B", "A"]
+
+        with pytest.raises(TypeError):
+            first.start_date = date(2018, 1, 1)
+
+        # items are swapped for updated copies instead
+        section.discard(first)
+        section.add(first.copy(update={"start_date": date(2018, 1, 1)}))
+        assert [item.institution for item in section] == ["A", "B"]
+        assert [item.institution for item in section.top(1)] == ["A"]
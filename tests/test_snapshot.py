@@ -0,0 +1,51 @@
+import pytest
+
+from rezume import Rezume, RezumeError, snapshot
+
+
+@pytest.fixture
+def rezume_template():
+    return Rezume().load("./src/rezume/assets/rezume-template.yml")
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_snapshot_round_trips_rezume(rezume_template, tmp_path, compress):
+    filepath = tmp_path / "rezume.snap"
+    rezume_template.save_snapshot(filepath, compress=compress)
+
+    loaded = Rezume().load_snapshot(filepath)
+    assert loaded.dump_data() == rezume_template.dump_data()
+    assert loaded.email == rezume_template.email
+    assert loaded.location == rezume_template.location
+    for section in rezume_template.sections:
+        assert list(loaded[section.name]) == list(section)
+
+
+def test_save_snapshot_fails_without_overwrite(rezume_template, tmp_path):
+    filepath = tmp_path / "rezume.snap"
+    rezume_template.save_snapshot(filepath)
+
+    with pytest.raises(RezumeError):
+        rezume_template.save_snapshot(filepath)
+    rezume_template.save_snapshot(filepath, overwrite=True)
+
+
+@pytest.mark.parametrize(
+    "mangle",
+    [
+        lambda content: content[:10],
+        lambda content: b"NOTSNP" + content[6:],
+        lambda content: content[:-1] + bytes([content[-1] ^ 0xFF]),
+    ],
+)
+def test_load_snapshot_rejects_invalid_content(rezume_template, tmp_path, mangle):
+    filepath = tmp_path / "rezume.snap"
+    filepath.write_bytes(mangle(snapshot.dumps(rezume_template)))
+
+    with pytest.raises(RezumeError):
+        Rezume().load_snapshot(filepath)
+
+
+def test_load_snapshot_fails_for_missing_file(tmp_path):
+    with pytest.raises(RezumeError):
+        Rezume().load_snapshot(tmp_path / "missing.snap")
@@ -0,0 +1,117 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from datetime import date
+
+import pytest
+
+from rezume import Rezume, RezumeError, RezumeStore
+
+
+@pytest.fixture
+def rezumes(sample_rezume):
+    python = deepcopy(sample_rezume)
+    python["skills"] = [{"name": "Python", "level": "Master", "keywords": ["Django"]}]
+    python["work"] = [
+        {
+            "company": "Acme",
+            "position": "Engineer",
+            "startDate": "2016-01-01",
+            "endDate": "2018-12-31",
+            "highlights": ["Led migration", "Mentored"],
+        }
+    ]
+
+    rust = deepcopy(sample_rezume)
+    rust["skills"] = [{"name": "Rust", "level": "Beginner"}]
+    rust["work"] = [{"company": "Initech", "position": "Developer", "startDate": "2019-01-01"}]
+    return {"python": Rezume().load_data(python), "rust": Rezume().load_data(rust)}
+
+
+@pytest.fixture
+def store(tmp_path, rezumes):
+    store = RezumeStore(tmp_path / "rezumes.db")
+    assert store.add_many(rezumes.items(), batch_size=1) == 2
+    yield store
+    store.close()
+
+
+def test_store_round_trips_rezumes(store, rezumes):
+    assert len(store) == 2 and list(store) == ["python", "rust"]
+    for key, rezume in rezumes.items():
+        assert store[key].dump_data() == rezume.dump_data()
+        assert store.get(key, records=True).dump_data() == rezume.dump_data()
+
+    # replacing a rezume replaces its rows
+    store.add(rezumes["rust"], "python")
+    assert len(store) == 2
+    assert store["python"].dump_data() == rezumes["rust"].dump_data()
+
+    store.remove("python")
+    assert "python" not in store and "rust" in store
+    with pytest.raises(RezumeError):
+        store.get("python")
+    with pytest.raises(RezumeError):
+        store.remove("python")
+
+
+def test_store_schema_is_normalized(store):
+    connection = sqlite3.connect(str(store.path))
+    rows = connection.execute(
+        "SELECT seq, company, start_date, end_date, highlights FROM work ORDER BY rezume_id"
+    ).fetchall()
+    assert rows == [
+        (0, "Acme", "2016-01-01", "2018-12-31", '["Led migration", "Mentored"]'),
+        (0, "Initech", "2019-01-01", None, None),
+    ]
+    assert connection.execute("SELECT location_city FROM basics").fetchall() == [
+        ("Kano",),
+        ("Kano",),
+    ]
+    indexes = {name for name, in connection.execute("SELECT name FROM sqlite_master")}
+    assert {"work_start_date", "work_company", "skills_name", "terms_rezume_id"} <= indexes
+    assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_store_lookups(store):
+    assert store.find_keys(skill="django") == {"python"}
+    assert store.find_keys(skill=["rust", "django"], company=" ACME ") == {"python"}
+    assert store.find_keys(institution="university") == {"python", "rust"}
+    assert store.find_keys(skill="python", company="initech") == set()
+    assert store.values("company") == {"acme": 1, "initech": 1}
+    assert [rezume["work"].top(1)[0].company for rezume in store.find(skill="rust")] == [
+        "Initech"
+    ]
+
+    assert store.find_active(date(2018, 6, 1)) == {"python", "rust"}
+    assert store.find_active(date(2017, 1, 1), date(2017, 2, 1)) == {"python"}
+    assert store.find_active(date(2020, 1, 1), sections=["work", "education"]) == {
+        "python",
+        "rust",
+    }
+
+    with pytest.raises(RezumeError):
+        store.find_keys(hobby="chess")
+    with pytest.raises(RezumeError):
+        store.find_active(date(2020, 1, 1), sections=["skills"])
+
+
+def test_store_connections_per_thread(store, rezumes):
+    def read(key):
+        return store.get(key).dump_data()
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(read, ["python", "rust"] * 4))
+    assert results == [rezume.dump_data() for rezume in rezumes.values()] * 4
+
+
+def test_store_load_dir(tmp_path, rezumes):
+    directory = tmp_path / "rezumes"
+    directory.mkdir()
+    for key, rezume in rezumes.items():
+        rezume.save(directory / f"{key}.yml")
+
+    store = RezumeStore(tmp_path / "loaded.db").load_dir(directory, batch_size=1)
+    assert set(store) == {str(directory / "python.yml"), str(directory / "rust.yml")}
+    with pytest.raises(RezumeError):
+        store.load_dir(tmp_path / "missing")